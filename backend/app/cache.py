@@ -0,0 +1,121 @@
+"""프로세스 내 캐시.
+
+조회는 잦고 변경은 드문 데이터(사이클 알림, 수업반 등)를 메모리에 보관한다.
+변경 API가 invalidate_on_commit()으로 커밋 시점에 무효화하고, TTL이 지나면 자동 만료된다.
+uvicorn 워커마다 따로 존재하므로, 워커가 여럿이면 TTL만큼 늦게 반영될 수 있다.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+_MISSING = object()
+
+# 이름 → 캐시 (모니터링 / 테스트 초기화용)
+_registry: dict[str, "TTLCache"] = {}
+
+
+class TTLCache:
+    """TTL + LRU 캐시. ttl_seconds <= 0 이면 캐시하지 않는다."""
+
+    def __init__(self, name: str, ttl_seconds: float, maxsize: int = 128):
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.version = 0  # invalidate()마다 증가
+        self._data: OrderedDict[Any, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        _registry[name] = self
+
+    def get(self, key: Any = None, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is not _MISSING and entry[0] > time.monotonic():
+                self._data.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry is not _MISSING:
+                del self._data[key]
+            self.misses += 1
+            return default
+
+    def set(self, key: Any, value: Any, version: int | None = None) -> None:
+        """version을 주면 그 뒤로 invalidate()가 없었을 때만 저장한다.
+
+        값을 읽기 전에 self.version을 받아 두고 넘기면, 읽는 사이 다른 요청의 커밋으로
+        무효화된 옛 데이터를 다시 캐시하지 않는다.
+        """
+        if self.ttl_seconds <= 0:
+            return
+        with self._lock:
+            if version is not None and version != self.version:
+                return
+            self._data[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def get_or_set(self, key: Any, factory: Callable[[], Any]) -> Any:
+        version = self.version
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = factory()
+            self.set(key, value, version)
+        return value
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.version += 1
+
+    def stats(self) -> dict:
+        return {"size": len(self._data), "hits": self.hits, "misses": self.misses, "version": self.version}
+
+
+class ResourceVersion:
+    """데이터 없이 버전 번호만 관리 (ETag용). TTLCache처럼 invalidate_on_commit()에 넘길 수 있다."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.version = 0
+        self._lock = threading.Lock()
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self.version += 1
+
+
+def invalidate_on_commit(db: Session, *caches: "TTLCache | ResourceVersion") -> None:
+    """세션이 커밋될 때 캐시를 무효화하도록 표시한다. (롤백되면 취소)
+
+    커밋 전에 비우면 그 사이 다른 요청이 옛 데이터를 다시 캐시할 수 있으므로 커밋 후에 비운다.
+    """
+    db.info.setdefault("stale_caches", set()).update(caches)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_stale_caches(session: Session) -> None:
+    for cache in session.info.pop("stale_caches", ()):
+        cache.invalidate()
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_stale_caches(session: Session, previous_transaction) -> None:
+    session.info.pop("stale_caches", None)
+
+
+def cache_stats() -> dict[str, dict]:
+    return {name: cache.stats() for name, cache in _registry.items()}
+
+
+def clear_all_caches() -> None:
+    """모든 캐시 비우기 + 카운터 초기화 (테스트용)."""
+    for cache in _registry.values():
+        cache.invalidate()
+        cache.hits = 0
+        cache.misses = 0
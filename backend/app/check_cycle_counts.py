@@ -0,0 +1,44 @@
+"""사이클 current_count 정합성 점검 (주기 실행/오프라인용).
+
+출석 기록을 한 번의 GROUP BY로 집계해 각 사이클의 current_count와 비교한다.
+
+사용법 (backend/ 에서):
+    python -m app.check_cycle_counts           # 불일치 보고만
+    python -m app.check_cycle_counts --repair  # 불일치 수정
+"""
+import sys
+
+from app.database import SessionLocal
+from app.services.cycle_service import check_cycle_counts
+
+# 모델 import (관계 매핑 설정을 위해 필요)
+import app.models.student  # noqa: F401
+import app.models.class_group  # noqa: F401
+import app.models.cycle  # noqa: F401
+import app.models.attendance  # noqa: F401
+import app.models.payment  # noqa: F401
+import app.models.enrollment_history  # noqa: F401
+import app.models.student_summary  # noqa: F401
+import app.models.message_template  # noqa: F401
+import app.models.attendance_monthly  # noqa: F401
+import app.models.payment_monthly  # noqa: F401
+
+
+def main(repair: bool = False) -> int:
+    db = SessionLocal()
+    try:
+        drifts = check_cycle_counts(db, repair=repair)
+        for d in drifts:
+            print(f"cycle {d['cycle_id']}: 저장값 {d['stored']} / 실제 {d['actual']}")
+        if repair:
+            db.commit()
+            print(f"{len(drifts)}건 수정했습니다")
+        else:
+            print(f"불일치 {len(drifts)}건")
+        return 1 if drifts and not repair else 0
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main(repair="--repair" in sys.argv[1:]))
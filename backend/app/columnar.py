@@ -0,0 +1,94 @@
+"""큰 목록 API의 열 단위(columnar) JSON 응답 (선택 형식).
+
+?format=columnar 또는 Accept: application/vnd.columnar+json 요청이면 행 객체 배열 대신
+
+    {"count": N,
+     "columns": {"id": [...], "status": [0, 0, 1], "current_cycle.id": [...], ...},
+     "dictionaries": {"status": ["present", "late"], ...}}
+
+- 필드 이름은 열마다 한 번만 나오고, 중첩 모델(current_cycle 등)은 "필드.하위필드" 열로 편다
+- 반복되는 문자열(학생/수업반 이름, 상태 등)은 사전 인코딩: 열에는 dictionaries 인덱스 (None은 그대로)
+- 행마다 Pydantic 검증을 거치지 않고 pydantic_core.to_json(Rust 인코더)으로 바로 직렬화
+- 필드와 기본값은 기존 응답 모델을 따르므로 JSON 형식과 같은 데이터다
+"""
+import types
+import typing
+from typing import Any, Collection, Literal
+
+from fastapi import Request, Response
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+COLUMNAR_MEDIA_TYPE = "application/vnd.columnar+json"
+
+# 목록 API의 format 쿼리 파라미터
+ListFormat = Literal["json", "columnar"]
+
+
+def wants_columnar(request: Request) -> bool:
+    """?format=columnar 또는 Accept 헤더로 열 단위 형식을 요청했는지."""
+    return (
+        request.query_params.get("format") == "columnar"
+        or COLUMNAR_MEDIA_TYPE in request.headers.get("accept", "")
+    )
+
+
+def _nested_model(annotation: Any) -> type[BaseModel] | None:
+    """필드 타입이 (Optional) 모델이면 그 모델."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    if typing.get_origin(annotation) in (typing.Union, types.UnionType):
+        return next((arg for arg in typing.get_args(annotation) if _nested_model(arg)), None)
+    return None
+
+
+def _attr(value: Any, name: str) -> Any:
+    if value is None:
+        return None
+    return value.get(name) if isinstance(value, dict) else getattr(value, name)
+
+
+def encode_columns(rows: list[dict], model: type[BaseModel], dictionary_fields: Collection[str] = ()) -> dict:
+    """응답 모델 필드 순서대로 열을 만들고, dictionary_fields 열은 사전 인코딩한다."""
+    columns: dict[str, list] = {}
+    for name, field in model.model_fields.items():
+        default = None if field.is_required() else field.get_default(call_default_factory=True)
+        values = [row.get(name, default) for row in rows]
+        nested = _nested_model(field.annotation)
+        if nested is None:
+            columns[name] = values
+            continue
+        for sub in nested.model_fields:
+            columns[f"{name}.{sub}"] = [_attr(value, sub) for value in values]
+
+    dictionaries: dict[str, list] = {}
+    for name in dictionary_fields:
+        index: dict[Any, int] = {}
+        columns[name] = [None if v is None else index.setdefault(v, len(index)) for v in columns[name]]
+        dictionaries[name] = list(index)
+    return {"count": len(rows), "columns": columns, "dictionaries": dictionaries}
+
+
+class ColumnarResponse(Response):
+    media_type = COLUMNAR_MEDIA_TYPE
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
+
+
+def columnar_response(
+    rows: list[dict],
+    model: type[BaseModel],
+    dictionary_fields: Collection[str] = (),
+    response: Response | None = None,
+) -> ColumnarResponse:
+    """열 단위 응답. response(엔드포인트가 주입받은 Response)에 붙인 헤더(커서 등)도 옮긴다.
+
+    (Response를 직접 반환하면 FastAPI가 주입된 Response의 헤더를 합치지 않으므로)
+    """
+    result = ColumnarResponse(encode_columns(rows, model, dictionary_fields))
+    if response is not None:
+        for key, value in response.headers.items():
+            if key not in ("content-length", "content-type"):
+                result.headers[key] = value
+    return result
@@ -1,11 +1,113 @@
-from sqlalchemy import create_engine
+import time
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import URL, Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, DeclarativeBase
 
-from app.config import DATABASE_URL
+from app.config import Settings, settings
+from app.profiling import record_statement
+
+
+def sqlite_pragmas(config: Settings) -> dict[str, str | int]:
+    """설정의 SQLite 프로필을 연결마다 실행할 PRAGMA 목록으로 변환."""
+    if config.sqlite_profile != "performance":
+        return {}
+    return {
+        "journal_mode": config.sqlite_journal_mode,  # WAL: 쓰기 중에도 읽기 가능
+        "synchronous": config.sqlite_synchronous,  # WAL에서는 NORMAL로도 안전
+        "cache_size": -config.sqlite_cache_size_kb,  # 음수 = KiB 단위
+        "mmap_size": config.sqlite_mmap_size_mb * 1024 * 1024,
+        "busy_timeout": config.sqlite_busy_timeout_ms,
+        "foreign_keys": "ON" if config.sqlite_foreign_keys else "OFF",
+    }
+
+
+def apply_sqlite_profile(target: Engine, config: Settings) -> None:
+    """connect 이벤트에 PRAGMA 설정을 등록한다. (SQLite 엔진에만 적용)"""
+    if target.dialect.name != "sqlite":
+        return
+    pragmas = sqlite_pragmas(config)
+    if not pragmas:
+        return
+
+    @event.listens_for(target, "connect")
+    def _set_pragmas(dbapi_conn, connection_record):
+        cursor = dbapi_conn.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+
+
+def create_db_engine(config: Settings) -> Engine:
+    """설정의 database_url로 엔진 생성. SQLite는 PRAGMA 프로필, 서버 DB는 연결 풀 설정."""
+    url = make_url(config.database_url)
+    if url.get_backend_name() == "sqlite":
+        sqlite_engine = create_engine(url, connect_args={"check_same_thread": False})
+        apply_sqlite_profile(sqlite_engine, config)
+        return sqlite_engine
+    return create_engine(
+        url,
+        pool_size=config.db_pool_size,
+        max_overflow=config.db_max_overflow,
+        pool_pre_ping=config.db_pool_pre_ping,
+        pool_recycle=config.db_pool_recycle_seconds,
+    )
+
+
+def async_url(url: str | URL) -> URL:
+    """동기 URL → 비동기 드라이버 URL (sqlite → aiosqlite, postgresql → psycopg async)."""
+    url = make_url(url)
+    backend = url.get_backend_name()
+    if backend == "sqlite":
+        return url.set(drivername="sqlite+aiosqlite")
+    if backend == "postgresql":
+        return url.set(drivername="postgresql+psycopg")
+    return url
+
+
+def create_async_db_engine(config: Settings) -> AsyncEngine:
+    """get_async_db용 비동기 엔진. 풀/PRAGMA 설정은 동기 엔진과 동일하게 적용."""
+    url = async_url(config.database_url)
+    if url.get_backend_name() == "sqlite":
+        async_engine = create_async_engine(url)
+        apply_sqlite_profile(async_engine.sync_engine, config)
+        return async_engine
+    return create_async_engine(
+        url,
+        pool_size=config.db_pool_size,
+        max_overflow=config.db_max_overflow,
+        pool_pre_ping=config.db_pool_pre_ping,
+        pool_recycle=config.db_pool_recycle_seconds,
+    )
 
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+
+# 모든 엔진(동기, 비동기 내부 동기 엔진, 테스트/벤치마크 엔진)의 SQL 실행 시간 기록 → profiling.py
+@event.listens_for(Engine, "before_cursor_execute")
+def _start_statement_timer(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("statement_started_at", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _record_statement(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info["statement_started_at"].pop()
+    record_statement(statement, (time.perf_counter() - started) * 1000)
+
+
+@event.listens_for(Engine, "handle_error")
+def _discard_statement_timer(context):
+    # 실패한 SQL은 after_cursor_execute가 오지 않으므로 시작 시각만 버린다
+    conn = context.connection
+    if conn is not None and conn.info.get("statement_started_at"):
+        conn.info["statement_started_at"].pop()
+
+
+engine = create_db_engine(settings)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+async_engine = create_async_db_engine(settings)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
 
 class Base(DeclarativeBase):
     pass
@@ -17,3 +119,8 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -0,0 +1,69 @@
+"""조회 API 조건부 요청 (ETag / If-None-Match).
+
+프론트엔드가 주기적으로 다시 부르는 목록 API에 리소스 버전 기반 강한 ETag를 붙인다.
+버전은 변경 API가 커밋될 때 올라가므로(invalidate_on_commit), 클라이언트의 ETag가
+현재 버전과 같으면 라우터/DB를 거치지 않고 바로 304를 돌려준다.
+
+- ETag = 프로세스 ID + 시간 구간 + 리소스 버전
+  · 프로세스 ID: 재시작하거나 다른 워커가 만든 ETag는 버전이 같아도 일치하지 않음
+  · 시간 구간(etag_max_age_seconds): 버전은 프로세스마다 따로 세므로, 다른 워커나 CLI가
+    커밋한 변경은 이 프로세스의 버전을 올리지 않는다. 그동안 이 워커는 자기가 만든 옛 ETag에
+    304를 줄 수 있고, 시간 구간이 바뀌어야(최대 etag_max_age_seconds) 새 응답을 준다.
+    그래서 구간을 짧게(기본 30초, 알림 캐시 TTL과 같게) 둔다
+- 쿼리 파라미터(필터)는 ETag에 넣지 않는다. 클라이언트가 URL별로 ETag를 보관하므로
+  같은 버전이면 같은 URL의 응답은 같다.
+- 단, Accept 헤더로 고르는 열 단위 형식(app/columnar.py)은 같은 URL의 다른 표현이므로
+  ETag에 "-columnar"를 붙이고 Vary: Accept로 알린다.
+"""
+import time
+import uuid
+
+from fastapi import Request, Response
+
+from app.cache import ResourceVersion, TTLCache
+from app.columnar import wants_columnar
+from app.config import settings
+from app.services.alert_service import alerts_cache
+from app.services.class_group_cache import class_group_cache
+from app.services.read_model import students_version
+
+_INSTANCE = uuid.uuid4().hex[:8]
+
+# 경로 → 응답 내용을 결정하는 버전들 (등급 설정은 코드 상수라 버전 없음)
+ETAG_RESOURCES: dict[str, tuple[TTLCache | ResourceVersion, ...]] = {
+    "/api/students": (students_version,),
+    "/api/class-groups": (class_group_cache,),
+    "/api/grades": (),
+    "/api/cycles/alerts": (alerts_cache,),
+}
+
+
+def current_etag(sources: tuple[TTLCache | ResourceVersion, ...], variant: str = "") -> str:
+    window = int(time.time() // settings.etag_max_age_seconds) if settings.etag_max_age_seconds > 0 else 0
+    versions = ".".join(str(source.version) for source in sources)
+    suffix = f"-{variant}" if variant else ""
+    return f'"{_INSTANCE}-{window}-{versions}{suffix}"'
+
+
+def _matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+async def etag_middleware(request: Request, call_next) -> Response:
+    sources = ETAG_RESOURCES.get(request.url.path) if request.method == "GET" else None
+    if sources is None:
+        return await call_next(request)
+
+    # 처리 전에 계산: 처리 중 변경이 커밋되면 새 데이터에 옛 ETag가 붙어 다음 요청이 200이 된다 (안전한 쪽)
+    etag = current_etag(sources, "columnar" if wants_columnar(request) else "")
+    headers = {"ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept"}
+    if _matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+
+    response = await call_next(request)
+    if response.status_code == 200:
+        response.headers.update(headers)
+    return response
@@ -0,0 +1,66 @@
+"""학생 일괄 등록 (신규 지점 온보딩).
+
+CSV 헤더(또는 JSON 객체 키)는 학생 등록 API 필드명과 같고, start_date 열이 있으면
+수업중 학생의 첫 사이클을 시작한다. 한 행이라도 오류가 있으면 아무것도 등록하지 않는다.
+
+사용법 (backend/ 에서):
+    python -m app.import_students students.csv [--dry-run]
+    python -m app.import_students students.json
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from app.database import SessionLocal
+from app.services.import_service import StudentImportError, decode_csv, import_students, parse_csv
+
+# 모델 import (관계 매핑 설정을 위해 필요)
+import app.models.student  # noqa: F401
+import app.models.class_group  # noqa: F401
+import app.models.cycle  # noqa: F401
+import app.models.attendance  # noqa: F401
+import app.models.payment  # noqa: F401
+import app.models.enrollment_history  # noqa: F401
+import app.models.student_summary  # noqa: F401
+import app.models.message_template  # noqa: F401
+import app.models.attendance_monthly  # noqa: F401
+import app.models.payment_monthly  # noqa: F401
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="학생 일괄 등록")
+    parser.add_argument("path", type=Path, help="CSV 또는 JSON 파일")
+    parser.add_argument("--dry-run", action="store_true", help="검증만 하고 등록하지 않음")
+    args = parser.parse_args()
+
+    if args.path.suffix.lower() == ".json":
+        rows = json.loads(args.path.read_text(encoding="utf-8-sig"))
+    else:
+        try:
+            rows = parse_csv(decode_csv(args.path.read_bytes()))
+        except ValueError as e:
+            print(str(e))
+            return 1
+
+    db = SessionLocal()
+    try:
+        result = import_students(db, rows, dry_run=args.dry_run)
+        db.commit()
+    except StudentImportError as e:
+        print(str(e))
+        for error in e.errors:
+            print(f"  {error['row']}행: {'; '.join(error['errors'])}")
+        return 1
+    finally:
+        db.close()
+
+    if args.dry_run:
+        print(f"{result['validated']}행 모두 정상입니다 (등록하지 않음)")
+    else:
+        print(f"학생 {result['created']}명 등록, 사이클 {result['cycles_started']}개 시작")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
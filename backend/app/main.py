@@ -1,13 +1,22 @@
 import os
+import time
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.cache import cache_stats
 from app.constants import GRADE_CONFIG
+from app.config import settings
 from app.database import Base, SessionLocal, engine
-from app.routers import attendance, class_groups, payments, students
+from app.etag import etag_middleware
+from app.migrate import ensure_indexes
+from app.profiling import QueryProfile, current_profile, profile_headers, request_metrics
+from app.routers import attendance, class_groups, dashboard, exports, message_templates, payments, students
 from app.seed import seed_class_groups
+from app.services.attendance_stats import ensure_attendance_rollup
+from app.services.read_model import ensure_read_model
+from app.services.revenue import ensure_payment_rollup
 
 # 모델 import (create_all에서 테이블 생성을 위해 필요)
 import app.models.student  # noqa: F401
@@ -15,15 +24,23 @@ import app.models.cycle  # noqa: F401
 import app.models.attendance  # noqa: F401
 import app.models.payment  # noqa: F401
 import app.models.enrollment_history  # noqa: F401
+import app.models.student_summary  # noqa: F401
+import app.models.message_template  # noqa: F401
+import app.models.attendance_monthly  # noqa: F401
+import app.models.payment_monthly  # noqa: F401
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     if not os.getenv("TESTING"):
         Base.metadata.create_all(bind=engine)
+        ensure_indexes(engine)
         db = SessionLocal()
         try:
             seed_class_groups(db)
+            ensure_read_model(db)
+            ensure_attendance_rollup(db)
+            ensure_payment_rollup(db)
         finally:
             db.close()
     yield
@@ -31,18 +48,51 @@ async def lifespan(app: FastAPI):
 
 app = FastAPI(title="수학공부방 관리 시스템", version="0.1.0", lifespan=lifespan)
 
+# CORS보다 먼저 등록 → CORS가 바깥에서 304 응답에도 헤더를 붙인다
+app.middleware("http")(etag_middleware)
+
+
+@app.middleware("http")
+async def profile_requests(request: Request, call_next):
+    """요청별 SQL 문 수 / DB 시간 / 가장 느린 SQL 집계. (ETag 304 응답도 포함)"""
+    profile = QueryProfile()
+    token = current_profile.set(profile)
+    started = time.perf_counter()
+    try:
+        response = await call_next(request)
+    finally:
+        current_profile.reset(token)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    # 경로 템플릿 기준 집계 (ETag 304는 라우팅 전이라 실제 경로, 404는 한 묶음)
+    route = request.scope.get("route")
+    path = route.path if route else ("unmatched" if response.status_code == 404 else request.url.path)
+    endpoint = f"{request.method} {path}"
+    request_metrics.record(endpoint, response.status_code, elapsed_ms, profile)
+    if settings.debug:
+        response.headers.update(profile_headers(profile, elapsed_ms))
+    return response
+
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:5173"],
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[
+        "X-Next-Cursor", "ETag",
+        "X-Response-Time-Ms", "X-DB-Query-Count", "X-DB-Time-Ms", "X-DB-Slowest-Ms", "X-DB-Slowest",
+    ],
 )
 
 app.include_router(class_groups.router)
 app.include_router(students.router)
 app.include_router(attendance.router)
 app.include_router(payments.router)
+app.include_router(dashboard.router)
+app.include_router(exports.router)
+app.include_router(message_templates.router)
 
 
 @app.get("/api/health")
@@ -50,6 +100,26 @@ def health_check():
     return {"status": "ok"}
 
 
+@app.get("/api/metrics")
+def get_metrics():
+    """엔드포인트별 요청 수·지연·SQL 문 수·DB 시간 + 캐시 통계 (프로세스 시작 후 누적)."""
+    return {
+        "thresholds": {
+            "slow_request_ms": settings.slow_request_ms,
+            "slow_request_query_count": settings.slow_request_query_count,
+            "slow_query_ms": settings.slow_query_ms,
+        },
+        "endpoints": request_metrics.snapshot(),
+        "caches": cache_stats(),
+    }
+
+
+@app.get("/api/cache/stats")
+def get_cache_stats():
+    """프로세스 내 캐시별 크기/적중/미스/버전 (모니터링용)."""
+    return cache_stats()
+
+
 @app.get("/api/grades")
 def get_grades():
     return GRADE_CONFIG
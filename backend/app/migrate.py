@@ -0,0 +1,50 @@
+"""기존 DB 파일에 모델에 선언된 인덱스를 추가하는 마이그레이션.
+
+create_all()은 새로 만드는 테이블에만 인덱스를 생성하므로,
+이미 존재하는 math_academy.db에는 이 단계가 필요하다.
+여러 번 실행해도 안전하다 (이미 있는 인덱스는 건너뜀).
+
+사용법 (backend/ 에서):
+    python -m app.migrate
+"""
+from sqlalchemy import inspect
+from sqlalchemy.engine import Engine
+
+from app.database import Base, engine
+
+# 모델 import (Base.metadata에 테이블/인덱스 등록)
+import app.models.student  # noqa: F401
+import app.models.class_group  # noqa: F401
+import app.models.cycle  # noqa: F401
+import app.models.attendance  # noqa: F401
+import app.models.payment  # noqa: F401
+import app.models.enrollment_history  # noqa: F401
+import app.models.student_summary  # noqa: F401
+import app.models.message_template  # noqa: F401
+import app.models.attendance_monthly  # noqa: F401
+import app.models.payment_monthly  # noqa: F401
+
+
+def ensure_indexes(bind: Engine) -> list[str]:
+    """누락된 인덱스를 생성하고, 새로 만든 인덱스 이름 목록을 반환한다."""
+    inspector = inspect(bind)
+    existing_tables = set(inspector.get_table_names())
+    created: list[str] = []
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue  # 테이블 자체가 없으면 create_all이 인덱스까지 만든다
+        existing = {ix["name"] for ix in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name in existing:
+                continue
+            index.create(bind=bind, checkfirst=True)
+            created.append(index.name)
+    return created
+
+
+if __name__ == "__main__":
+    names = ensure_indexes(engine)
+    if names:
+        print(f"인덱스 {len(names)}개 생성: {', '.join(names)}")
+    else:
+        print("추가할 인덱스가 없습니다")
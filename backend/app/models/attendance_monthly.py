@@ -0,0 +1,20 @@
+from sqlalchemy import ForeignKey, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class AttendanceMonthly(Base):
+    """출석 통계용 월별 집계 (학생 × 월 × 상태 × 사유별 출석 건수).
+
+    출석 레코드를 만들거나 상태를 바꾸는 서비스/라우터가
+    services/attendance_stats.py로 같은 트랜잭션에서 증감한다.
+    """
+
+    __tablename__ = "attendance_monthly"
+
+    month: Mapped[str] = mapped_column(String(7), primary_key=True)  # "2026-03"
+    student_id: Mapped[int] = mapped_column(Integer, ForeignKey("students.id"), primary_key=True)
+    status: Mapped[str] = mapped_column(String(20), primary_key=True)
+    excuse_reason: Mapped[str] = mapped_column(String(50), primary_key=True, default="")  # 사유 없음 = ""
+    count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
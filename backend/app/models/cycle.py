@@ -1,6 +1,6 @@
 from datetime import date, datetime
 
-from sqlalchemy import Date, DateTime, ForeignKey, Integer, String
+from sqlalchemy import Date, DateTime, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -8,6 +8,11 @@ from app.database import Base
 
 class Cycle(Base):
     __tablename__ = "cycles"
+    __table_args__ = (
+        Index("ix_cycles_student_id_status", "student_id", "status"),
+        Index("ix_cycles_student_id_cycle_number", "student_id", "cycle_number"),
+        Index("ix_cycles_status_completed_at", "status", "completed_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     student_id: Mapped[int] = mapped_column(Integer, ForeignKey("students.id"), nullable=False)
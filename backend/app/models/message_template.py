@@ -0,0 +1,20 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class MessageTemplate(Base):
+    """안내 문자 템플릿. 지점마다 DB가 따로이므로 지점별 문구가 된다.
+
+    행이 없으면 services/message_template.py의 기본 문구를 쓴다.
+    """
+
+    __tablename__ = "message_templates"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    name: Mapped[str] = mapped_column(String(50), unique=True, nullable=False)  # payment_notice
+    body: Mapped[str] = mapped_column(Text, nullable=False)  # {student_name} 등 자리표시자
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now, onupdate=datetime.now)
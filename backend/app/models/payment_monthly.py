@@ -0,0 +1,23 @@
+from sqlalchemy import Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class PaymentMonthly(Base):
+    """수납/미수 요약용 월별 집계 (월 × 상태 × 납부 방법 × 학년 × 수업반별 건수/금액).
+
+    월은 납부 완료 건이면 납부월, 미납 건이면 청구월.
+    학년/수업반은 학생의 현재 값을 따른다. 수업료를 만들거나 납부 확인하거나
+    학생의 학년/수업반을 바꾸는 쪽이 services/revenue.py로 같은 트랜잭션에서 증감한다.
+    """
+
+    __tablename__ = "payment_monthly"
+
+    month: Mapped[str] = mapped_column(String(7), primary_key=True)  # "2026-03"
+    status: Mapped[str] = mapped_column(String(20), primary_key=True)  # pending/paid
+    payment_method: Mapped[str] = mapped_column(String(20), primary_key=True, default="")  # 미납 = ""
+    grade: Mapped[str] = mapped_column(String(10), primary_key=True)
+    class_group_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    amount: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
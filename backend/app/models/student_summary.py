@@ -0,0 +1,43 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class StudentSummary(Base):
+    """대시보드용 학생별 비정규화 읽기 모델.
+
+    정규화 테이블(students/cycles/payments/enrollment_history) 변경 시
+    services/read_model.py에서 같은 트랜잭션으로 갱신한다.
+    """
+
+    __tablename__ = "student_summaries"
+    __table_args__ = (
+        Index("ix_student_summaries_status_name", "enrollment_status", "name"),
+        Index("ix_student_summaries_class_group_id", "class_group_id"),
+        Index("ix_student_summaries_current_cycle_id", "current_cycle_id"),
+    )
+
+    student_id: Mapped[int] = mapped_column(Integer, ForeignKey("students.id"), primary_key=True)
+    name: Mapped[str] = mapped_column(String(20), nullable=False)
+    grade: Mapped[str] = mapped_column(String(10), nullable=False)
+    enrollment_status: Mapped[str] = mapped_column(String(20), nullable=False)
+    class_group_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    class_group_name: Mapped[str | None] = mapped_column(String(50), nullable=True)
+    start_time: Mapped[str | None] = mapped_column(String(5), nullable=True)
+    # 가장 최근 사이클 (진행 중 또는 완료 후 다음 사이클 대기)
+    current_cycle_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    current_cycle_number: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    current_cycle_status: Mapped[str | None] = mapped_column(String(20), nullable=True)
+    current_count: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    total_count: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    # 미납 수업료 (가장 최근 pending 1건)
+    pending_payment_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    pending_amount: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    inquiry_date: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    level_test_status_date: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    active_date: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    stopped_date: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now, onupdate=datetime.now)
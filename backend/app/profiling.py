@@ -0,0 +1,142 @@
+"""요청별 SQL 프로파일링.
+
+database.py의 엔진 이벤트가 실행된 SQL 문마다 record_statement()를 호출하고,
+main.py의 미들웨어가 요청마다 QueryProfile을 ContextVar에 넣어 두었다가
+요청이 끝나면 request_metrics에 엔드포인트(경로 템플릿)별로 집계한다.
+
+- 동기 엔드포인트는 스레드풀에서 실행되지만 컨텍스트가 복사되므로 같은 QueryProfile에 기록된다
+- StreamingResponse(내보내기)의 본문 전송 중 쿼리는 미들웨어가 끝난 뒤라 집계되지 않는다
+"""
+import logging
+import threading
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from app.config import settings
+
+logger = logging.getLogger("app.profiling")
+
+TOP_STATEMENTS = 3  # 요청/엔드포인트별로 보관할 가장 느린 SQL 수
+STATEMENT_PREVIEW = 200  # 로그/헤더에 남길 SQL 길이
+
+
+def _preview(statement: str) -> str:
+    return " ".join(statement.split())[:STATEMENT_PREVIEW]
+
+
+def _keep_slowest(slowest: list[tuple[float, str]], elapsed_ms: float, statement: str) -> None:
+    if len(slowest) < TOP_STATEMENTS or elapsed_ms > slowest[-1][0]:
+        slowest.append((elapsed_ms, statement))
+        slowest.sort(key=lambda item: item[0], reverse=True)
+        del slowest[TOP_STATEMENTS:]
+
+
+@dataclass
+class QueryProfile:
+    """요청 1건 동안 실행된 SQL 통계."""
+
+    count: int = 0
+    total_ms: float = 0.0
+    slowest: list[tuple[float, str]] = field(default_factory=list)  # (ms, SQL) 느린 순
+
+    def record(self, statement: str, elapsed_ms: float) -> None:
+        self.count += 1
+        self.total_ms += elapsed_ms
+        _keep_slowest(self.slowest, elapsed_ms, statement)
+
+
+current_profile: ContextVar[QueryProfile | None] = ContextVar("current_profile", default=None)
+
+
+def record_statement(statement: str, elapsed_ms: float) -> None:
+    """엔진 이벤트에서 호출. 요청 밖(CLI, 시드)에서는 느린 쿼리 로그만 남긴다."""
+    profile = current_profile.get()
+    if profile is not None:
+        profile.record(statement, elapsed_ms)
+    if elapsed_ms >= settings.slow_query_ms:
+        logger.warning("느린 쿼리 %.1f ms: %s", elapsed_ms, _preview(statement))
+
+
+@dataclass
+class EndpointStats:
+    requests: int = 0
+    errors: int = 0  # 5xx
+    slow_requests: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    queries: int = 0
+    max_queries: int = 0
+    db_ms: float = 0.0
+    slowest: list[tuple[float, str]] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        n = self.requests or 1
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "slow_requests": self.slow_requests,
+            "avg_ms": round(self.total_ms / n, 2),
+            "max_ms": round(self.max_ms, 2),
+            "avg_queries": round(self.queries / n, 2),
+            "max_queries": self.max_queries,
+            "avg_db_ms": round(self.db_ms / n, 2),
+            "slowest_statements": [
+                {"ms": round(ms, 2), "statement": _preview(sql)} for ms, sql in self.slowest
+            ],
+        }
+
+
+class RequestMetrics:
+    """엔드포인트별 누적 통계 (프로세스 내, /api/metrics 용)."""
+
+    def __init__(self):
+        self._stats: dict[str, EndpointStats] = {}
+        self._lock = threading.Lock()
+
+    def record(self, endpoint: str, status_code: int, elapsed_ms: float, profile: QueryProfile) -> bool:
+        """요청 1건 집계. 기준을 넘으면 경고 로그를 남기고 True 반환."""
+        slow = elapsed_ms >= settings.slow_request_ms or profile.count >= settings.slow_request_query_count
+        with self._lock:
+            stats = self._stats.setdefault(endpoint, EndpointStats())
+            stats.requests += 1
+            stats.errors += status_code >= 500
+            stats.slow_requests += slow
+            stats.total_ms += elapsed_ms
+            stats.max_ms = max(stats.max_ms, elapsed_ms)
+            stats.queries += profile.count
+            stats.max_queries = max(stats.max_queries, profile.count)
+            stats.db_ms += profile.total_ms
+            for ms, statement in profile.slowest:
+                _keep_slowest(stats.slowest, ms, statement)
+        if slow:
+            slowest = f"{profile.slowest[0][0]:.1f} ms {_preview(profile.slowest[0][1])}" if profile.slowest else "-"
+            logger.warning(
+                "느린 요청 %s (%d): %.1f ms, 쿼리 %d개 / DB %.1f ms, 가장 느린 쿼리: %s",
+                endpoint, status_code, elapsed_ms, profile.count, profile.total_ms, slowest,
+            )
+        return slow
+
+    def snapshot(self) -> dict[str, dict]:
+        with self._lock:
+            return {endpoint: stats.to_dict() for endpoint, stats in sorted(self._stats.items())}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+request_metrics = RequestMetrics()
+
+
+def profile_headers(profile: QueryProfile, elapsed_ms: float) -> dict[str, str]:
+    """debug 모드 응답 헤더. (헤더는 latin-1이므로 SQL은 ASCII로 치환)"""
+    headers = {
+        "X-Response-Time-Ms": f"{elapsed_ms:.1f}",
+        "X-DB-Query-Count": str(profile.count),
+        "X-DB-Time-Ms": f"{profile.total_ms:.1f}",
+    }
+    if profile.slowest:
+        ms, statement = profile.slowest[0]
+        headers["X-DB-Slowest-Ms"] = f"{ms:.1f}"
+        headers["X-DB-Slowest"] = _preview(statement).encode("ascii", "replace").decode()
+    return headers
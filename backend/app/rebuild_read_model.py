@@ -0,0 +1,35 @@
+"""대시보드 읽기 모델(student_summaries)과 월별 집계(attendance_monthly, payment_monthly) 전체 재생성.
+
+사용법 (backend/ 에서):
+    python -m app.rebuild_read_model
+"""
+from app.database import SessionLocal
+from app.services.attendance_stats import rebuild_attendance_rollup
+from app.services.read_model import rebuild_read_model
+from app.services.revenue import rebuild_payment_rollup
+
+# 모델 import (관계 매핑 설정을 위해 필요)
+import app.models.student  # noqa: F401
+import app.models.class_group  # noqa: F401
+import app.models.cycle  # noqa: F401
+import app.models.attendance  # noqa: F401
+import app.models.payment  # noqa: F401
+import app.models.enrollment_history  # noqa: F401
+import app.models.student_summary  # noqa: F401
+import app.models.message_template  # noqa: F401
+import app.models.attendance_monthly  # noqa: F401
+import app.models.payment_monthly  # noqa: F401
+
+
+if __name__ == "__main__":
+    db = SessionLocal()
+    try:
+        count = rebuild_read_model(db)
+        rollup_rows = rebuild_attendance_rollup(db)
+        payment_rows = rebuild_payment_rollup(db)
+        db.commit()
+        print(f"학생 {count}명의 읽기 모델을 다시 만들었습니다")
+        print(f"월별 출석 집계 {rollup_rows}행을 다시 만들었습니다")
+        print(f"월별 수업료 집계 {payment_rows}행을 다시 만들었습니다")
+    finally:
+        db.close()
@@ -1,37 +1,62 @@
 import json
 from datetime import date as date_type
+from typing import Literal
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from pydantic import BaseModel
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.columnar import ListFormat, columnar_response, wants_columnar
+from app.database import get_async_db, get_db
 from app.models.attendance import Attendance
 from app.models.class_group import ClassGroup
 from app.models.cycle import Cycle
 from app.models.payment import Payment
 from app.models.student import Student
 from app.schemas.attendance import (
+    AttendanceCalendarResponse,
     AttendanceResponse,
+    AttendanceStatsRow,
     AttendanceUpdate,
+    BulkAttendanceCreate,
     CycleAlertResponse,
+    CycleRolloverRequest,
+    CycleRolloverResponse,
 )
+from app.services import alert_service
+from app.services.attendance_stats import get_attendance_stats, update_attendance_rollup
 from app.services.cycle_service import (
+    adjust_cycle_count,
     complete_cycle,
     extend_schedule,
-    recount_cycle,
+    rollover_cycles,
     start_cycle,
 )
+from app.services.rollup import MONTH_PATTERN, month_key
 
 router = APIRouter(prefix="/api", tags=["attendance"])
 
+MAX_CALENDAR_DAYS = 62
 
-def _to_response(att: Attendance, db: Session) -> dict:
-    cycle = db.query(Cycle).filter(Cycle.id == att.cycle_id).first()
-    if cycle:
-        db.refresh(cycle)
-    student = db.query(Student).filter(Student.id == att.student_id).first()
-    class_group = student.class_group if student else None
+# 열 단위 형식에서 사전 인코딩하는 (반복이 많은) 열
+ATTENDANCE_DICTIONARY_FIELDS = ("status", "excuse_reason", "student_name", "class_group_name", "start_time")
+
+
+def _board_select():
+    """출석 ⋈ 사이클 ⋈ 학생 ⋈ 수업반을 한 번에 조회하는 기본 쿼리. (동기/비동기 공용)"""
+    return (
+        select(Attendance, Cycle, Student, ClassGroup)
+        .outerjoin(Cycle, Cycle.id == Attendance.cycle_id)
+        .outerjoin(Student, Student.id == Attendance.student_id)
+        .outerjoin(ClassGroup, ClassGroup.id == Student.class_group_id)
+    )
+
+
+def _row_to_response(
+    att: Attendance, cycle: Cycle | None, student: Student | None, class_group: ClassGroup | None
+) -> dict:
     return {
         "id": att.id,
         "student_id": att.student_id,
@@ -50,23 +75,113 @@ def _to_response(att: Attendance, db: Session) -> dict:
     }
 
 
+def _to_response(att: Attendance, db: Session) -> dict:
+    row = db.execute(_board_select().where(Attendance.id == att.id)).one()
+    return _row_to_response(*row)
+
+
 # --- 출석 조회/수정 (스케줄 기반) ---
 
 @router.get("/attendance/daily/{date}", response_model=list[AttendanceResponse])
-def get_daily_attendance(date: str, class_group_id: int | None = None, db: Session = Depends(get_db)):
-    """해당 날짜에 스케줄이 있는 출석 기록 조회."""
-    query = db.query(Attendance).filter(Attendance.date == date)
+async def get_daily_attendance(
+    request: Request,
+    date: date_type,
+    class_group_id: int | None = None,
+    format: ListFormat = "json",
+    db: AsyncSession = Depends(get_async_db),
+):
+    """해당 날짜에 스케줄이 있는 출석 기록 조회. (format=columnar: 열 단위 형식, app/columnar.py)"""
+    stmt = _board_select().where(Attendance.date == date)
     if class_group_id:
-        student_ids = [
-            s.id for s in
-            db.query(Student).filter(
-                Student.class_group_id == class_group_id,
-                Student.enrollment_status == "active",
-            ).all()
-        ]
-        query = query.filter(Attendance.student_id.in_(student_ids))
-    records = query.all()
-    return [_to_response(a, db) for a in records]
+        # 수업반 필터는 학생 JOIN 조건으로 SQL에서 처리
+        stmt = stmt.where(
+            Student.class_group_id == class_group_id,
+            Student.enrollment_status == "active",
+        )
+    result = await db.execute(stmt)
+    items = [_row_to_response(*row) for row in result.all()]
+    if wants_columnar(request):
+        return columnar_response(items, AttendanceResponse, ATTENDANCE_DICTIONARY_FIELDS)
+    return items
+
+
+@router.get("/attendance/calendar", response_model=AttendanceCalendarResponse)
+async def get_attendance_calendar(
+    date_from: date_type = Query(alias="from"),
+    date_to: date_type = Query(alias="to"),
+    class_group_id: int | None = None,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """주간/월간 달력: 기간의 출석을 날짜 → 수업반 단위로 묶어 조회 (날짜 범위 쿼리 1회).
+
+    응답은 열 단위(attendance)와 날짜별 수업 구간(days[].blocks의 start/count),
+    학생/수업반 이름 조회표로 나눠 이름·시간이 기록마다 반복되지 않는다.
+    수업반 필터는 일일 출석부와 같이 수업중 학생만.
+    """
+    if date_from > date_to:
+        raise HTTPException(status_code=400, detail="시작일이 종료일보다 늦습니다")
+    if (date_to - date_from).days >= MAX_CALENDAR_DAYS:
+        raise HTTPException(status_code=400, detail=f"기간은 최대 {MAX_CALENDAR_DAYS}일입니다")
+
+    stmt = (
+        select(
+            Attendance.id,
+            Attendance.student_id,
+            Attendance.cycle_id,
+            Attendance.date,
+            Attendance.status,
+            Attendance.counts_toward_cycle,
+            Attendance.excuse_reason,
+            Student.name,
+            Student.class_group_id,
+            ClassGroup.name,
+            ClassGroup.start_time,
+        )
+        .join(Student, Student.id == Attendance.student_id)
+        .outerjoin(ClassGroup, ClassGroup.id == Student.class_group_id)
+        .where(Attendance.date >= date_from, Attendance.date <= date_to)
+        .order_by(Attendance.date, ClassGroup.start_time, Student.class_group_id, Student.name, Attendance.id)
+    )
+    if class_group_id:
+        stmt = stmt.where(Student.class_group_id == class_group_id, Student.enrollment_status == "active")
+    rows = (await db.execute(stmt)).all()
+
+    columns = {
+        "id": [], "student_id": [], "cycle_id": [], "status": [], "counts_toward_cycle": [], "excuse_reason": [],
+    }
+    students: dict[int, str] = {}
+    groups: dict[int, tuple[str | None, str | None]] = {}
+    days: list[dict] = []
+    for i, (att_id, student_id, cycle_id, day, status, counts, reason,
+            student_name, group_id, group_name, start_time) in enumerate(rows):
+        columns["id"].append(att_id)
+        columns["student_id"].append(student_id)
+        columns["cycle_id"].append(cycle_id)
+        columns["status"].append(status)
+        columns["counts_toward_cycle"].append(counts)
+        columns["excuse_reason"].append(reason)
+        students.setdefault(student_id, student_name)
+        groups.setdefault(group_id, (group_name, start_time))
+
+        if not days or days[-1]["date"] != day:
+            days.append({"date": day, "blocks": []})
+        blocks = days[-1]["blocks"]
+        if not blocks or blocks[-1]["class_group_id"] != group_id:
+            blocks.append({"class_group_id": group_id, "start": i, "count": 0})
+        blocks[-1]["count"] += 1
+
+    return {
+        "date_from": date_from,
+        "date_to": date_to,
+        "days": days,
+        "attendance": columns,
+        "students": {"id": list(students), "name": list(students.values())},
+        "class_groups": {
+            "id": list(groups),
+            "name": [name for name, _ in groups.values()],
+            "start_time": [start for _, start in groups.values()],
+        },
+    }
 
 
 @router.put("/attendance/{att_id}", response_model=AttendanceResponse)
@@ -77,50 +192,115 @@ def update_attendance(att_id: int, data: AttendanceUpdate, db: Session = Depends
         raise HTTPException(status_code=404, detail="출석 기록을 찾을 수 없습니다")
 
     was_counting = att.counts_toward_cycle
+    update_attendance_rollup(
+        db,
+        added=[(att.student_id, att.date, data.status, data.excuse_reason)],
+        removed=[(att.student_id, att.date, att.status, att.excuse_reason)],
+    )
     att.status = data.status
     att.counts_toward_cycle = data.counts_toward_cycle
     att.excuse_reason = data.excuse_reason
     att.memo = data.memo
     db.flush()
 
+    delta = int(data.counts_toward_cycle) - int(was_counting)
     # 미차감으로 변경된 경우 → 스케줄 1회 연장
     if was_counting and not data.counts_toward_cycle:
-        extend_schedule(db, att.cycle_id)
+        delta += len(extend_schedule(db, att.cycle_id))
 
-    recount_cycle(db, att.cycle_id)
+    adjust_cycle_count(db, att.cycle_id, delta)
     db.commit()
     db.refresh(att)
     return _to_response(att, db)
 
 
+@router.post("/attendance/bulk", response_model=list[AttendanceResponse])
+def bulk_update_attendance(data: BulkAttendanceCreate, db: Session = Depends(get_db)):
+    """한 수업의 출석을 일괄 변경 (단일 트랜잭션).
+
+    스케줄 연장과 회차 증감은 사이클별로 묶어서 한 번씩만 수행한다.
+    학생당 항목 1개만 받고, 그날 출석 기록이 2개인 학생(이전 사이클의 연장 스케줄과
+    다음 사이클이 겹친 경우)은 어느 기록인지 알 수 없으므로 409 - 개별 수정 API를 쓴다.
+    응답은 요청 항목 순서.
+    """
+    student_ids = [item.student_id for item in data.items]
+    duplicated = sorted({sid for sid in student_ids if student_ids.count(sid) > 1})
+    if duplicated:
+        raise HTTPException(status_code=400, detail=f"같은 학생이 여러 번 포함되어 있습니다: {duplicated}")
+
+    records: dict[int, Attendance] = {}
+    ambiguous = set()
+    for att in db.query(Attendance).filter(
+        Attendance.date == data.date,
+        Attendance.student_id.in_(student_ids),
+    ).order_by(Attendance.id):
+        if att.student_id in records:
+            ambiguous.add(att.student_id)
+        records.setdefault(att.student_id, att)
+    missing = [sid for sid in student_ids if sid not in records]
+    if missing:
+        raise HTTPException(status_code=404, detail=f"해당 날짜에 출석 기록이 없는 학생이 있습니다: {missing}")
+    if ambiguous:
+        raise HTTPException(
+            status_code=409, detail=f"해당 날짜에 출석 기록이 여러 개인 학생이 있습니다: {sorted(ambiguous)}",
+        )
+
+    extensions: dict[int, int] = {}  # cycle_id → 연장 횟수
+    deltas: dict[int, int] = {}  # cycle_id → 차감 회차 증감
+    added, removed = [], []  # 월별 출석 집계 증감
+    for item in data.items:
+        att = records[item.student_id]
+        was_counting = att.counts_toward_cycle
+        removed.append((att.student_id, att.date, att.status, att.excuse_reason))
+        added.append((att.student_id, att.date, item.status, item.excuse_reason))
+        att.status = item.status
+        att.counts_toward_cycle = item.counts_toward_cycle
+        att.excuse_reason = item.excuse_reason
+        deltas[att.cycle_id] = deltas.get(att.cycle_id, 0) + int(item.counts_toward_cycle) - int(was_counting)
+        # 미차감으로 변경된 경우 → 스케줄 1회 연장
+        if was_counting and not item.counts_toward_cycle:
+            extensions[att.cycle_id] = extensions.get(att.cycle_id, 0) + 1
+    db.flush()
+    update_attendance_rollup(db, added=added, removed=removed)
+
+    for cycle_id, count in extensions.items():
+        deltas[cycle_id] += len(extend_schedule(db, cycle_id, count=count))
+    for cycle_id, delta in deltas.items():
+        adjust_cycle_count(db, cycle_id, delta)
+    db.commit()
+
+    att_ids = [records[sid].id for sid in student_ids]
+    rows = {row[0].id: row for row in db.execute(_board_select().where(Attendance.id.in_(att_ids))).all()}
+    return [_row_to_response(*rows[att_id]) for att_id in att_ids]
+
+
+@router.get("/attendance/stats", response_model=list[AttendanceStatsRow])
+async def get_attendance_statistics(
+    month_from: str | None = Query(None, pattern=MONTH_PATTERN, description="기본: 올해 1월"),
+    month_to: str | None = Query(None, pattern=MONTH_PATTERN, description="기본: 이번 달"),
+    group_by: list[Literal["month", "student", "class_group"]] = Query(["month"]),
+    class_group_id: int | None = None,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """월/학생/수업반별 출석률, 상태별 건수, 결석 사유별 건수 (오늘까지 진행한 수업 기준).
+
+    group_by는 여러 개 조합 가능 (예: ?group_by=class_group&group_by=month).
+    지난 달까지는 월별 집계 테이블에서 읽으므로 기간이 길어도 쿼리 2회로 끝난다.
+    """
+    today = date_type.today()
+    month_to = month_to or month_key(today)
+    month_from = month_from or f"{today.year:04d}-01"
+    if month_from > month_to:
+        raise HTTPException(status_code=400, detail="시작 월이 종료 월보다 늦습니다")
+    return await get_attendance_stats(db, month_from, month_to, group_by, class_group_id, today)
+
+
 # --- 사이클 알림 ---
 
 @router.get("/cycles/alerts", response_model=list[CycleAlertResponse])
-def get_cycle_alerts(db: Session = Depends(get_db)):
-    """완료된 사이클 목록 (다음 사이클 시작 대기)"""
-    cycles = (
-        db.query(Cycle)
-        .filter(Cycle.status == "completed")
-        .order_by(Cycle.completed_at.desc())
-        .all()
-    )
-    results = []
-    for c in cycles:
-        student = db.query(Student).filter(Student.id == c.student_id).first()
-        if not student or student.enrollment_status != "active":
-            continue
-        group = db.query(ClassGroup).filter(ClassGroup.id == student.class_group_id).first()
-        results.append({
-            "student_id": student.id,
-            "student_name": student.name,
-            "class_group_name": group.name if group else "",
-            "cycle_id": c.id,
-            "cycle_number": c.cycle_number,
-            "current_count": c.current_count,
-            "total_count": c.total_count,
-            "status": c.status,
-        })
-    return results
+async def get_cycle_alerts(db: AsyncSession = Depends(get_async_db)):
+    """완료된 사이클 목록 (다음 사이클 시작 대기). 학생별 최신 사이클 기준."""
+    return await alert_service.get_cycle_alerts(db)
 
 
 # --- 사이클 완료 (수동) ---
@@ -177,6 +357,21 @@ def start_next_cycle(cycle_id: int, data: StartCycleRequest, db: Session = Depen
     }
 
 
+@router.post("/cycles/rollover", response_model=CycleRolloverResponse)
+def rollover_cycles_endpoint(data: CycleRolloverRequest, db: Session = Depends(get_db)):
+    """학기 전환 일괄 처리: 완료 + 납부 확인된 사이클의 다음 사이클을 한 번에 시작 (단일 트랜잭션)."""
+    if data.class_group_id:
+        group = db.get(ClassGroup, data.class_group_id)
+        if not group or not group.is_active:
+            raise HTTPException(status_code=404, detail="수업반을 찾을 수 없습니다")
+    try:
+        cycles = rollover_cycles(db, data.start_date or date_type.today(), data.class_group_id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    db.commit()
+    return {"started": len(cycles), "cycles": cycles}
+
+
 @router.post("/students/{student_id}/start-cycle")
 def start_first_cycle(student_id: int, data: StartCycleRequest, db: Session = Depends(get_db)):
     """신규 학생: 첫 사이클 시작 (납부 확인 후)."""
@@ -7,6 +7,9 @@ from sqlalchemy.orm import Session
 from app.database import get_db
 from app.models.class_group import ClassGroup
 from app.schemas.class_group import ClassGroupCreate, ClassGroupResponse, ClassGroupUpdate
+from app.services.alert_service import mark_alerts_stale
+from app.services.class_group_cache import get_active_class_groups, get_class_group_info, mark_class_groups_stale
+from app.services.read_model import refresh_class_group
 
 router = APIRouter(prefix="/api/class-groups", tags=["class-groups"])
 
@@ -28,16 +31,15 @@ def _to_response(group: ClassGroup) -> dict:
 
 @router.get("", response_model=list[ClassGroupResponse])
 def list_class_groups(db: Session = Depends(get_db)):
-    groups = db.query(ClassGroup).filter(ClassGroup.is_active).order_by(ClassGroup.start_time).all()
-    return [_to_response(g) for g in groups]
+    return [g.to_response() for g in get_active_class_groups(db)]
 
 
 @router.get("/{group_id}", response_model=ClassGroupResponse)
 def get_class_group(group_id: int, db: Session = Depends(get_db)):
-    group = db.query(ClassGroup).filter(ClassGroup.id == group_id, ClassGroup.is_active).first()
-    if not group:
+    group = get_class_group_info(db, group_id)
+    if not group or not group.is_active:
         raise HTTPException(status_code=404, detail="수업반을 찾을 수 없습니다")
-    return _to_response(group)
+    return group.to_response()
 
 
 @router.post("", response_model=ClassGroupResponse, status_code=201)
@@ -50,6 +52,7 @@ def create_class_group(data: ClassGroupCreate, db: Session = Depends(get_db)):
         memo=data.memo,
     )
     db.add(group)
+    mark_class_groups_stale(db)
     try:
         db.commit()
     except IntegrityError:
@@ -69,6 +72,9 @@ def update_class_group(group_id: int, data: ClassGroupUpdate, db: Session = Depe
     group.start_time = data.start_time
     group.default_duration_minutes = data.default_duration_minutes
     group.memo = data.memo
+    refresh_class_group(db, group)
+    mark_class_groups_stale(db)
+    mark_alerts_stale(db)
     db.commit()
     db.refresh(group)
     return _to_response(group)
@@ -80,5 +86,7 @@ def delete_class_group(group_id: int, db: Session = Depends(get_db)):
     if not group:
         raise HTTPException(status_code=404, detail="수업반을 찾을 수 없습니다")
     group.is_active = False
+    mark_class_groups_stale(db)
+    mark_alerts_stale(db)
     db.commit()
     return {"message": "삭제되었습니다"}
@@ -0,0 +1,55 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import get_async_db
+from app.models.payment import Payment
+from app.models.student_summary import StudentSummary
+from app.schemas.dashboard import DashboardStats, StudentSummaryResponse
+
+router = APIRouter(prefix="/api/dashboard", tags=["dashboard"])
+
+ENROLLMENT_STATUSES = ("inquiry", "level_test", "active", "stopped")
+
+
+@router.get("/students", response_model=list[StudentSummaryResponse])
+async def list_student_summaries(
+    class_group_id: int | None = None,
+    enrollment_status: str | None = None,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """읽기 모델에서 학생 현황 조회 (단일 테이블)."""
+    stmt = select(StudentSummary)
+    if enrollment_status == "all":
+        pass  # 전체 조회
+    elif enrollment_status:
+        stmt = stmt.where(StudentSummary.enrollment_status == enrollment_status)
+    else:
+        # 기본: stopped 제외 (학생 목록 API와 동일)
+        stmt = stmt.where(StudentSummary.enrollment_status != "stopped")
+    if class_group_id:
+        stmt = stmt.where(StudentSummary.class_group_id == class_group_id)
+    result = await db.execute(stmt.order_by(StudentSummary.name))
+    return result.scalars().all()
+
+
+@router.get("/stats", response_model=DashboardStats)
+async def get_dashboard_stats(db: AsyncSession = Depends(get_async_db)):
+    """상태별 학생 수 (읽기 모델 집계) + 미납 건수/금액 (payments 집계).
+
+    읽기 모델은 학생별로 가장 최근 미납 1건만 갖고 있어, 미납 사이클이 여럿인 학생이 있으면
+    건수/금액이 모자란다. 미납 합계는 payments(status 인덱스)에서 직접 센다.
+    """
+    stmt = select(StudentSummary.enrollment_status, func.count()).group_by(StudentSummary.enrollment_status)
+    status_counts = {status: 0 for status in ENROLLMENT_STATUSES}
+    for status, students in (await db.execute(stmt)).all():
+        status_counts[status] = students
+
+    pending_count, pending_total = (await db.execute(
+        select(func.count(), func.coalesce(func.sum(Payment.amount), 0)).where(Payment.status == "pending")
+    )).one()
+    return {
+        "status_counts": status_counts,
+        "pending_payment_count": pending_count,
+        "pending_amount_total": pending_total,
+    }
@@ -0,0 +1,74 @@
+from datetime import date
+from typing import Literal
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+from app.database import get_db
+from app.services.export_service import export_select, iter_export
+
+router = APIRouter(prefix="/api/exports", tags=["exports"])
+
+MEDIA_TYPES = {"csv": "text/csv; charset=utf-8", "ndjson": "application/x-ndjson"}
+
+
+def _stream(
+    db: Session,
+    name: str,
+    fmt: str,
+    date_from: date | None,
+    date_to: date | None,
+    class_group_id: int | None,
+) -> StreamingResponse:
+    stmt = export_select(name, date_from, date_to, class_group_id)
+    bind = db.get_bind()
+
+    def _chunks():
+        # 요청 세션은 응답 전송 전에 닫히므로, 스트리밍 동안 쓸 세션을 따로 연다
+        with Session(bind=bind) as stream_db:
+            yield from iter_export(stream_db, stmt, fmt)
+
+    period = "_".join(d.isoformat() for d in (date_from, date_to) if d)
+    filename = f"{name}{'_' + period if period else ''}.{fmt}"
+    return StreamingResponse(
+        _chunks(),
+        media_type=MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.get("/attendance")
+def export_attendance(
+    format: Literal["csv", "ndjson"] = "csv",
+    date_from: date | None = None,
+    date_to: date | None = None,
+    class_group_id: int | None = None,
+    db: Session = Depends(get_db),
+):
+    """출석 기록 내보내기 (수업일 기준 기간 필터)."""
+    return _stream(db, "attendance", format, date_from, date_to, class_group_id)
+
+
+@router.get("/payments")
+def export_payments(
+    format: Literal["csv", "ndjson"] = "csv",
+    date_from: date | None = None,
+    date_to: date | None = None,
+    class_group_id: int | None = None,
+    db: Session = Depends(get_db),
+):
+    """수업료 내보내기 (청구 생성일 기준 기간 필터)."""
+    return _stream(db, "payments", format, date_from, date_to, class_group_id)
+
+
+@router.get("/enrollment-history")
+def export_enrollment_history(
+    format: Literal["csv", "ndjson"] = "csv",
+    date_from: date | None = None,
+    date_to: date | None = None,
+    class_group_id: int | None = None,
+    db: Session = Depends(get_db),
+):
+    """등록 상태 변경 이력 내보내기 (변경일 기준 기간 필터)."""
+    return _stream(db, "enrollment-history", format, date_from, date_to, class_group_id)
@@ -0,0 +1,40 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+
+from app.database import get_db
+from app.models.message_template import MessageTemplate
+from app.schemas.message_template import MessageTemplateResponse, MessageTemplateUpdate
+from app.services.message_template import DEFAULT_TEMPLATES, PLACEHOLDERS, TemplateError, save_template
+
+router = APIRouter(prefix="/api/message-templates", tags=["message-templates"])
+
+
+def _to_response(db: Session, name: str) -> dict:
+    if name not in PLACEHOLDERS:
+        raise HTTPException(status_code=404, detail="템플릿을 찾을 수 없습니다")
+    template = db.query(MessageTemplate).filter(MessageTemplate.name == name).first()
+    return {
+        "name": name,
+        "body": template.body if template else DEFAULT_TEMPLATES[name],
+        "placeholders": sorted(PLACEHOLDERS[name]),
+        "is_default": template is None,
+        "updated_at": template.updated_at if template else None,
+    }
+
+
+@router.get("/{name}", response_model=MessageTemplateResponse)
+def get_message_template(name: str, db: Session = Depends(get_db)):
+    return _to_response(db, name)
+
+
+@router.put("/{name}", response_model=MessageTemplateResponse)
+def update_message_template(name: str, data: MessageTemplateUpdate, db: Session = Depends(get_db)):
+    """문구 수정. 알 수 없는 자리표시자가 있으면 400."""
+    if name not in PLACEHOLDERS:
+        raise HTTPException(status_code=404, detail="템플릿을 찾을 수 없습니다")
+    try:
+        save_template(db, name, data.body)
+    except TemplateError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    db.commit()
+    return _to_response(db, name)
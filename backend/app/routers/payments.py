@@ -1,25 +1,53 @@
-from datetime import datetime
+import base64
+from datetime import date, datetime, timedelta
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy import and_, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.constants import GRADE_CONFIG
-from app.database import get_db
+from app.columnar import ListFormat, columnar_response, wants_columnar
+from app.database import get_async_db, get_db
 from app.models.class_group import ClassGroup
 from app.models.cycle import Cycle
 from app.models.payment import Payment
 from app.models.student import Student
-from app.schemas.payment import MessageResponse, PaymentConfirm, PaymentResponse
+from app.schemas.payment import (
+    MessageBatchRequest,
+    MessageResponse,
+    PaymentConfirm,
+    PaymentResponse,
+    RevenueSummary,
+)
+from app.services.alert_service import mark_alerts_stale
+from app.services.message_template import PAYMENT_NOTICE, get_template, payment_notice_values
+from app.services.read_model import refresh_student_summary
+from app.services.revenue import get_revenue_summary, payment_entry, update_payment_rollup
+from app.services.rollup import MONTH_PATTERN, month_key
 
 router = APIRouter(prefix="/api/payments", tags=["payments"])
 
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
 
-def _to_response(p: Payment, db: Session) -> dict:
-    student = db.query(Student).filter(Student.id == p.student_id).first()
-    cycle = db.query(Cycle).filter(Cycle.id == p.cycle_id).first()
-    group = None
-    if student:
-        group = db.query(ClassGroup).filter(ClassGroup.id == student.class_group_id).first()
+# 열 단위 형식에서 사전 인코딩하는 (반복이 많은) 열
+PAYMENT_DICTIONARY_FIELDS = ("status", "payment_method", "student_name", "class_group_name")
+
+
+def _payment_select():
+    """수업료 ⋈ 학생 ⋈ 사이클 ⋈ 수업반을 한 번에 조회하는 기본 쿼리. (동기/비동기 공용)"""
+    return (
+        select(Payment, Student, Cycle, ClassGroup)
+        .outerjoin(Student, Student.id == Payment.student_id)
+        .outerjoin(Cycle, Cycle.id == Payment.cycle_id)
+        .outerjoin(ClassGroup, ClassGroup.id == Student.class_group_id)
+    )
+
+
+def _row_to_response(
+    p: Payment, student: Student | None, cycle: Cycle | None, group: ClassGroup | None
+) -> dict:
     return {
         "id": p.id,
         "student_id": p.student_id,
@@ -38,21 +66,116 @@ def _to_response(p: Payment, db: Session) -> dict:
     }
 
 
-@router.get("", response_model=list[PaymentResponse])
-def list_payments(status: str | None = None, db: Session = Depends(get_db)):
-    query = db.query(Payment)
+def _to_response(p: Payment, db: Session) -> dict:
+    row = db.execute(_payment_select().where(Payment.id == p.id)).one()
+    return _row_to_response(*row)
+
+
+def _filter_payments(
+    stmt,
+    status: str | None = None,
+    student_id: int | None = None,
+    class_group_id: int | None = None,
+    date_from: date | None = None,
+    date_to: date | None = None,
+    message_sent: bool | None = None,
+):
+    """목록/일괄 안내 공용 필터. date_from~date_to는 청구 생성일 기준 (양끝 포함)."""
     if status:
-        query = query.filter(Payment.status == status)
-    payments = query.order_by(Payment.created_at.desc()).all()
-    return [_to_response(p, db) for p in payments]
+        stmt = stmt.where(Payment.status == status)
+    if student_id:
+        stmt = stmt.where(Payment.student_id == student_id)
+    if class_group_id:
+        stmt = stmt.where(Student.class_group_id == class_group_id)
+    if date_from:
+        stmt = stmt.where(Payment.created_at >= datetime.combine(date_from, datetime.min.time()))
+    if date_to:
+        stmt = stmt.where(Payment.created_at < datetime.combine(date_to + timedelta(days=1), datetime.min.time()))
+    if message_sent is not None:
+        stmt = stmt.where(Payment.message_sent == message_sent)
+    return stmt
+
+
+def _encode_cursor(p: Payment) -> str:
+    """(created_at, id) → 불투명 커서 문자열."""
+    raw = f"{p.created_at.isoformat()}|{p.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        created_at, payment_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(created_at), int(payment_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="잘못된 커서입니다")
+
+
+@router.get("", response_model=list[PaymentResponse])
+async def list_payments(
+    request: Request,
+    response: Response,
+    status: str | None = None,
+    student_id: int | None = None,
+    class_group_id: int | None = None,
+    date_from: date | None = None,
+    date_to: date | None = None,
+    message_sent: bool | None = None,
+    cursor: str | None = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    format: ListFormat = "json",
+    db: AsyncSession = Depends(get_async_db),
+):
+    """수업료 목록 (최신순, (created_at, id) 키셋 페이지네이션).
+
+    다음 페이지가 있으면 X-Next-Cursor 헤더로 커서를 돌려준다.
+    format=columnar 또는 Accept 헤더로 열 단위 형식 (app/columnar.py).
+    """
+    stmt = _filter_payments(
+        _payment_select(), status, student_id, class_group_id, date_from, date_to, message_sent,
+    )
+    if cursor:
+        created_at, payment_id = _decode_cursor(cursor)
+        stmt = stmt.where(or_(
+            Payment.created_at < created_at,
+            and_(Payment.created_at == created_at, Payment.id < payment_id),
+        ))
+
+    stmt = stmt.order_by(Payment.created_at.desc(), Payment.id.desc()).limit(limit + 1)
+    rows = (await db.execute(stmt)).all()
+    if len(rows) > limit:
+        rows = rows[:limit]
+        response.headers[NEXT_CURSOR_HEADER] = _encode_cursor(rows[-1][0])
+    items = [_row_to_response(*row) for row in rows]
+    if wants_columnar(request):
+        return columnar_response(items, PaymentResponse, PAYMENT_DICTIONARY_FIELDS, response)
+    return items
+
+
+@router.get("/summary", response_model=RevenueSummary)
+async def get_payment_summary(
+    month_from: str | None = Query(None, pattern=MONTH_PATTERN, description="기본: 올해 1월"),
+    month_to: str | None = Query(None, pattern=MONTH_PATTERN, description="기본: 이번 달"),
+    class_group_id: int | None = None,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """월별 수납액/미수금 + 납부 방법별, 학년별, 수업반별 (월별 집계 테이블 쿼리 1회).
+
+    납부 완료 건은 납부월, 미납 건은 청구월에 잡힌다. 학년/수업반은 학생의 현재 값 기준.
+    """
+    today = date.today()
+    month_to = month_to or month_key(today)
+    month_from = month_from or f"{today.year:04d}-01"
+    if month_from > month_to:
+        raise HTTPException(status_code=400, detail="시작 월이 종료 월보다 늦습니다")
+    return await get_revenue_summary(db, month_from, month_to, class_group_id)
 
 
 @router.get("/{payment_id}", response_model=PaymentResponse)
 def get_payment(payment_id: int, db: Session = Depends(get_db)):
-    payment = db.query(Payment).filter(Payment.id == payment_id).first()
-    if not payment:
+    row = db.execute(_payment_select().where(Payment.id == payment_id)).first()
+    if not row:
         raise HTTPException(status_code=404, detail="수업료 정보를 찾을 수 없습니다")
-    return _to_response(payment, db)
+    return _row_to_response(*row)
 
 
 @router.post("/{payment_id}/confirm", response_model=PaymentResponse)
@@ -63,44 +186,62 @@ def confirm_payment(payment_id: int, data: PaymentConfirm, db: Session = Depends
     if payment.status == "paid":
         raise HTTPException(status_code=400, detail="이미 납부 완료된 건입니다")
 
+    student = db.get(Student, payment.student_id)
+    unpaid = payment_entry(payment, student.grade, student.class_group_id)
     payment.status = "paid"
     payment.payment_method = data.payment_method
     payment.paid_at = datetime.now()
     payment.memo = data.memo
+    update_payment_rollup(
+        db, added=[payment_entry(payment, student.grade, student.class_group_id)], removed=[unpaid],
+    )
+    refresh_student_summary(db, payment.student_id)
+    mark_alerts_stale(db)
     db.commit()
     db.refresh(payment)
     return _to_response(payment, db)
 
 
+@router.post("/messages", response_model=list[MessageResponse])
+def generate_messages(data: MessageBatchRequest, db: Session = Depends(get_db)):
+    """미납 수업료 안내 문자 일괄 생성 (월말 일괄 발송용).
+
+    조인 쿼리 1회로 대상을 읽고, 발송 표시는 UPDATE 1회로 처리한다.
+    """
+    stmt = _filter_payments(
+        _payment_select(),
+        status="pending",
+        class_group_id=data.class_group_id,
+        date_from=data.date_from,
+        date_to=data.date_to,
+        message_sent=False if data.unsent_only else None,
+    )
+    rows = db.execute(stmt.order_by(Payment.created_at, Payment.id)).all()
+    template = get_template(db, PAYMENT_NOTICE)
+    messages = [
+        {"payment_id": row[0].id, "message": template.render(payment_notice_values(*row))}
+        for row in rows
+    ]
+    if messages:
+        db.execute(
+            update(Payment)
+            .where(Payment.id.in_([m["payment_id"] for m in messages]))
+            .values(message_sent=True, message_sent_at=datetime.now())
+        )
+        db.commit()
+    return messages
+
+
 @router.post("/{payment_id}/message", response_model=MessageResponse)
 def generate_message(payment_id: int, db: Session = Depends(get_db)):
-    payment = db.query(Payment).filter(Payment.id == payment_id).first()
-    if not payment:
+    row = db.execute(_payment_select().where(Payment.id == payment_id)).first()
+    if not row:
         raise HTTPException(status_code=404, detail="수업료 정보를 찾을 수 없습니다")
+    payment = row[0]
 
-    student = db.query(Student).filter(Student.id == payment.student_id).first()
-    cycle = db.query(Cycle).filter(Cycle.id == payment.cycle_id).first()
-    grade_cfg = GRADE_CONFIG.get(student.grade, {}) if student else {}
-
-    student_name = student.name if student else "학생"
-    grade_label = grade_cfg.get("label", "")
-    cycle_number = cycle.cycle_number if cycle else 0
-    amount_str = f"{payment.amount:,}"
-
-    message = (
-        f"안녕하세요, 수학공부방입니다.\n"
-        f"\n"
-        f"{student_name} 학생({grade_label})의\n"
-        f"{cycle_number}회차 수업(8회)이 완료되었습니다.\n"
-        f"\n"
-        f"수업료: {amount_str}원\n"
-        f"\n"
-        f"입금 확인 후 다음 회차 수업이 시작됩니다.\n"
-        f"감사합니다."
-    )
-
+    message = get_template(db, PAYMENT_NOTICE).render(payment_notice_values(*row))
     payment.message_sent = True
     payment.message_sent_at = datetime.now()
     db.commit()
 
-    return {"payment_id": payment.id, "message": message}
+    return {"payment_id": payment_id, "message": message}
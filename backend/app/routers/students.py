@@ -1,25 +1,39 @@
+import json
 from datetime import date as date_type
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Request
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload, selectinload
 
+from app.columnar import ListFormat, columnar_response, wants_columnar
 from app.constants import GRADE_CONFIG
-from app.database import get_db
+from app.database import get_async_db, get_db
 from app.models.cycle import Cycle
 from app.models.enrollment_history import EnrollmentHistory
 from app.models.student import Student
+from app.services.alert_service import mark_alerts_stale
+from app.services.class_group_cache import get_class_group_info
 from app.services.cycle_service import start_cycle
+from app.services.read_model import mark_students_changed, refresh_student_summary
+from app.services.enrollment_service import build_status_dates_map, get_status_dates_map, status_dates_select
+from app.services.import_service import StudentImportError, decode_csv, import_students, parse_csv
+from app.services.revenue import move_student_payments
 from app.schemas.student import (
     EnrollmentHistoryResponse,
     LevelTestUpdate,
     StatusChangeRequest,
     StudentCreate,
+    StudentImportResult,
     StudentResponse,
     StudentUpdate,
 )
 
 router = APIRouter(prefix="/api/students", tags=["students"])
 
+# 열 단위 형식에서 사전 인코딩하는 (반복이 많은) 열
+STUDENT_DICTIONARY_FIELDS = ("school", "grade", "enrollment_status", "class_group_name", "current_cycle.status")
+
 # 허용되는 상태 전이
 ALLOWED_TRANSITIONS = {
     "inquiry": {"level_test", "active", "stopped"},
@@ -31,27 +45,10 @@ ALLOWED_TRANSITIONS = {
 
 def _get_status_dates(db: Session, student_id: int) -> dict:
     """EnrollmentHistory에서 각 상태별 최초 전환 일자를 조회."""
-    histories = (
-        db.query(EnrollmentHistory)
-        .filter(EnrollmentHistory.student_id == student_id)
-        .order_by(EnrollmentHistory.changed_at.asc())
-        .all()
-    )
-    status_date_map = {
-        "inquiry": "inquiry_date",
-        "level_test": "level_test_status_date",
-        "active": "active_date",
-        "stopped": "stopped_date",
-    }
-    dates: dict = {v: None for v in status_date_map.values()}
-    for h in histories:
-        key = status_date_map.get(h.to_status)
-        if key and dates[key] is None:
-            dates[key] = h.changed_at
-    return dates
+    return get_status_dates_map(db, [student_id])[student_id]
 
 
-def _to_response(student: Student, db: Session) -> dict:
+def _to_response(student: Student, db: Session | None, status_dates: dict | None = None) -> dict:
     current_cycle = None
     for c in student.cycles:
         if c.status == "in_progress":
@@ -61,7 +58,8 @@ def _to_response(student: Student, db: Session) -> dict:
     grade_cfg = GRADE_CONFIG.get(student.grade, {})
     effective_tuition = student.tuition_amount if student.tuition_amount is not None else grade_cfg.get("tuition", 0)
 
-    status_dates = _get_status_dates(db, student.id)
+    if status_dates is None:
+        status_dates = _get_status_dates(db, student.id)
 
     return {
         "id": student.id,
@@ -87,23 +85,37 @@ def _to_response(student: Student, db: Session) -> dict:
 
 
 @router.get("", response_model=list[StudentResponse])
-def list_students(
+async def list_students(
+    request: Request,
     class_group_id: int | None = None,
     enrollment_status: str | None = None,
-    db: Session = Depends(get_db),
+    format: ListFormat = "json",
+    db: AsyncSession = Depends(get_async_db),
 ):
-    query = db.query(Student)
+    """학생 목록 (이름순). format=columnar 또는 Accept 헤더로 열 단위 형식 (app/columnar.py)."""
+    # class_group은 JOIN, cycles는 SELECT IN으로 미리 로드 (학생 수와 무관하게 쿼리 수 고정)
+    stmt = select(Student).options(
+        joinedload(Student.class_group),
+        selectinload(Student.cycles),
+    )
     if enrollment_status == "all":
         pass  # 전체 조회
     elif enrollment_status:
-        query = query.filter(Student.enrollment_status == enrollment_status)
+        stmt = stmt.where(Student.enrollment_status == enrollment_status)
     else:
         # 기본: stopped 제외 (문의/레벨테스트/수업중 모두 표시)
-        query = query.filter(Student.enrollment_status != "stopped")
+        stmt = stmt.where(Student.enrollment_status != "stopped")
     if class_group_id:
-        query = query.filter(Student.class_group_id == class_group_id)
-    students = query.order_by(Student.name).all()
-    return [_to_response(s, db) for s in students]
+        stmt = stmt.where(Student.class_group_id == class_group_id)
+    students = (await db.execute(stmt.order_by(Student.name))).scalars().all()
+
+    student_ids = [s.id for s in students]
+    rows = (await db.execute(status_dates_select(student_ids))).all() if student_ids else []
+    status_dates_map = build_status_dates_map(student_ids, rows)
+    items = [_to_response(s, None, status_dates_map[s.id]) for s in students]
+    if wants_columnar(request):
+        return columnar_response(items, StudentResponse, STUDENT_DICTIONARY_FIELDS)
+    return items
 
 
 @router.get("/{student_id}", response_model=StudentResponse)
@@ -114,8 +126,19 @@ def get_student(student_id: int, db: Session = Depends(get_db)):
     return _to_response(student, db)
 
 
+def _check_class_group(db: Session, group_id: int, current_group_id: int | None = None) -> None:
+    """없는 수업반이면 400 (SQLite foreign_keys=ON에서 IntegrityError 500이 되지 않도록).
+
+    새로 배정하는 수업반은 삭제(is_active=False)되지 않은 것만 허용한다. (기존 수업반 유지는 허용)
+    """
+    group = get_class_group_info(db, group_id)
+    if group is None or (not group.is_active and group_id != current_group_id):
+        raise HTTPException(status_code=400, detail=f"수업반을 찾을 수 없습니다 ({group_id})")
+
+
 @router.post("", response_model=StudentResponse, status_code=201)
 def create_student(data: StudentCreate, db: Session = Depends(get_db)):
+    _check_class_group(db, data.class_group_id)
     student = Student(
         name=data.name,
         phone=data.phone,
@@ -140,16 +163,57 @@ def create_student(data: StudentCreate, db: Session = Depends(get_db)):
         to_status=data.enrollment_status,
     )
     db.add(history)
+    refresh_student_summary(db, student.id)
     db.commit()
     db.refresh(student)
     return _to_response(student, db)
 
 
+async def _import_rows(request: Request) -> list[dict]:
+    """요청 본문 → 행 목록. Content-Type이 text/csv면 CSV, 아니면 JSON 배열."""
+    body = await request.body()
+    if request.headers.get("content-type", "").startswith("text/csv"):
+        try:
+            return parse_csv(decode_csv(body))
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    try:
+        rows = json.loads(body)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="JSON 형식이 올바르지 않습니다")
+    if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+        raise HTTPException(status_code=400, detail="학생 객체의 배열을 보내주세요")
+    return rows
+
+
+@router.post("/import", response_model=StudentImportResult, status_code=201)
+def import_students_endpoint(
+    dry_run: bool = False,
+    rows: list[dict] = Depends(_import_rows),
+    db: Session = Depends(get_db),
+):
+    """학생 일괄 등록 (CSV 또는 JSON). 한 행이라도 오류가 있으면 전체 취소하고 행별 오류를 돌려준다.
+
+    start_date가 있는 수업중 학생은 첫 사이클(8회차 스케줄)까지 시작한다.
+    dry_run=true면 검증만 한다.
+    """
+    try:
+        result = import_students(db, rows, dry_run=dry_run)
+    except StudentImportError as e:
+        raise HTTPException(status_code=400, detail={"message": str(e), "errors": e.errors})
+    db.commit()
+    return result
+
+
 @router.put("/{student_id}", response_model=StudentResponse)
 def update_student(student_id: int, data: StudentUpdate, db: Session = Depends(get_db)):
     student = db.query(Student).filter(Student.id == student_id).first()
     if not student or student.enrollment_status == "stopped":
         raise HTTPException(status_code=404, detail="학생을 찾을 수 없습니다")
+    _check_class_group(db, data.class_group_id, student.class_group_id)
+    move_student_payments(
+        db, student.id, (student.grade, student.class_group_id), (data.grade, data.class_group_id),
+    )
     student.name = data.name
     student.phone = data.phone
     student.school = data.school
@@ -161,6 +225,8 @@ def update_student(student_id: int, data: StudentUpdate, db: Session = Depends(g
     student.level_test_date = data.level_test_date
     student.level_test_time = data.level_test_time
     student.level_test_result = data.level_test_result
+    refresh_student_summary(db, student.id)
+    mark_alerts_stale(db)
     db.commit()
     db.refresh(student)
     return _to_response(student, db)
@@ -179,6 +245,8 @@ def delete_student(student_id: int, db: Session = Depends(get_db)):
         to_status="stopped",
     )
     db.add(history)
+    refresh_student_summary(db, student.id)
+    mark_alerts_stale(db)
     db.commit()
     return {"message": "삭제되었습니다"}
 
@@ -208,6 +276,7 @@ def change_status(student_id: int, data: StatusChangeRequest, db: Session = Depe
         memo=data.memo,
     )
     db.add(history)
+    mark_alerts_stale(db)
 
     # active 전환 시 start_date가 있으면 사이클 자동 시작
     if target == "active" and data.start_date:
@@ -219,6 +288,7 @@ def change_status(student_id: int, data: StatusChangeRequest, db: Session = Depe
             sd = date_type.fromisoformat(data.start_date)
             start_cycle(db, student_id, sd)
 
+    refresh_student_summary(db, student_id)
     db.commit()
     db.refresh(student)
     return _to_response(student, db)
@@ -232,6 +302,7 @@ def update_level_test(student_id: int, data: LevelTestUpdate, db: Session = Depe
     student.level_test_date = data.level_test_date
     student.level_test_time = data.level_test_time
     student.level_test_result = data.level_test_result
+    mark_students_changed(db)
     db.commit()
     db.refresh(student)
     return _to_response(student, db)
@@ -59,3 +59,81 @@ class CycleAlertResponse(BaseModel):
     current_count: int
     total_count: int
     status: str
+
+
+class CycleRolloverRequest(BaseModel):
+    start_date: date | None = None  # 없으면 오늘 (첫 수업은 그 이후 첫 수업 요일)
+    class_group_id: int | None = None  # 없으면 전체 수업반
+
+
+class RolledOverCycle(BaseModel):
+    student_id: int
+    student_name: str
+    class_group_name: str
+    previous_cycle_id: int
+    cycle_id: int
+    cycle_number: int
+
+
+class CycleRolloverResponse(BaseModel):
+    started: int
+    cycles: list[RolledOverCycle]
+
+
+class AttendanceStatsRow(BaseModel):
+    # group_by에 포함된 기준만 채워짐
+    month: str | None = None  # "2026-03"
+    student_id: int | None = None
+    student_name: str | None = None
+    class_group_id: int | None = None
+    class_group_name: str | None = None
+    students: int  # 기간 중 출석 기록이 있는 학생 수
+    total: int  # 진행한 수업 수 (오늘까지)
+    present: int
+    late: int
+    early_leave: int
+    absent: int
+    absent_excused: int
+    attendance_rate: float  # (출석 + 지각 + 조퇴) / 전체
+    absence_reasons: dict[str, int]  # 결석 사유별 건수 (사유 없음 = "none")
+
+
+class CalendarAttendanceColumns(BaseModel):
+    # 출석 기록을 열 단위로 (같은 위치 = 같은 기록). 날짜 → 수업반(시작 시간순) → 학생 이름순
+    id: list[int]
+    student_id: list[int]
+    cycle_id: list[int]
+    status: list[str]
+    counts_toward_cycle: list[bool]
+    excuse_reason: list[str | None]
+
+
+class CalendarBlock(BaseModel):
+    class_group_id: int
+    start: int  # attendance 열에서 이 수업의 시작 위치
+    count: int
+
+
+class CalendarDay(BaseModel):
+    date: date
+    blocks: list[CalendarBlock]
+
+
+class CalendarStudents(BaseModel):
+    id: list[int]
+    name: list[str]
+
+
+class CalendarClassGroups(BaseModel):
+    id: list[int]
+    name: list[str | None]
+    start_time: list[str | None]
+
+
+class AttendanceCalendarResponse(BaseModel):
+    date_from: date
+    date_to: date
+    days: list[CalendarDay]  # 수업이 있는 날만
+    attendance: CalendarAttendanceColumns
+    students: CalendarStudents  # 이름 조회용 (기간 내 등장한 학생만)
+    class_groups: CalendarClassGroups
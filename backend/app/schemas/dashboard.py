@@ -0,0 +1,32 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+
+class StudentSummaryResponse(BaseModel):
+    student_id: int
+    name: str
+    grade: str
+    enrollment_status: str
+    class_group_id: int
+    class_group_name: str | None
+    start_time: str | None
+    current_cycle_id: int | None
+    current_cycle_number: int | None
+    current_cycle_status: str | None
+    current_count: int | None
+    total_count: int | None
+    pending_payment_id: int | None
+    pending_amount: int | None
+    inquiry_date: datetime | None
+    level_test_status_date: datetime | None
+    active_date: datetime | None
+    stopped_date: datetime | None
+
+    model_config = {"from_attributes": True}
+
+
+class DashboardStats(BaseModel):
+    status_counts: dict[str, int]  # inquiry/level_test/active/stopped → 학생 수
+    pending_payment_count: int
+    pending_amount_total: int
@@ -0,0 +1,15 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+
+class MessageTemplateUpdate(BaseModel):
+    body: str
+
+
+class MessageTemplateResponse(BaseModel):
+    name: str
+    body: str
+    placeholders: list[str]  # 사용 가능한 자리표시자
+    is_default: bool  # DB에 저장된 문구가 없어 기본 문구를 쓰는 중
+    updated_at: datetime | None = None
@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import date, datetime
 
 from pydantic import BaseModel
 
@@ -27,6 +27,44 @@ class PaymentConfirm(BaseModel):
     memo: str | None = None
 
 
+class MessageBatchRequest(BaseModel):
+    class_group_id: int | None = None
+    date_from: date | None = None  # 청구 생성일 기준
+    date_to: date | None = None
+    unsent_only: bool = True  # False면 이미 안내한 건도 다시 생성
+
+
 class MessageResponse(BaseModel):
     payment_id: int
     message: str
+
+
+class RevenueAmounts(BaseModel):
+    paid_count: int
+    paid_amount: int  # 수납액
+    pending_count: int
+    pending_amount: int  # 미수금
+
+
+class GradeRevenue(RevenueAmounts):
+    grade: str
+    label: str  # GRADE_CONFIG 표시 이름
+
+
+class ClassGroupRevenue(RevenueAmounts):
+    class_group_id: int
+    class_group_name: str | None
+
+
+class RevenuePeriod(RevenueAmounts):
+    month: str | None  # "2026-03" (None = 기간 합계)
+    by_method: dict[str, int]  # transfer/cash → 수납액
+    by_grade: list[GradeRevenue]
+    by_class_group: list[ClassGroupRevenue]
+
+
+class RevenueSummary(BaseModel):
+    month_from: str
+    month_to: str
+    total: RevenuePeriod
+    months: list[RevenuePeriod]  # 납부 건은 납부월, 미납 건은 청구월 기준
@@ -79,3 +79,14 @@ class EnrollmentHistoryResponse(BaseModel):
     memo: str | None
 
     model_config = {"from_attributes": True}
+
+
+class StudentImportRow(StudentCreate):
+    start_date: date | None = None  # 있으면 첫 사이클 시작 (수업중 학생만)
+
+
+class StudentImportResult(BaseModel):
+    validated: int
+    created: int
+    cycles_started: int
+    student_ids: list[int]
@@ -1,5 +1,5 @@
 import json
-from datetime import date, timedelta
+from datetime import date
 
 from sqlalchemy.orm import Session
 
@@ -7,9 +7,8 @@ from app.models.class_group import ClassGroup
 from app.models.enrollment_history import EnrollmentHistory
 from app.models.student import Student
 from app.services.cycle_service import start_cycle
-
-# Python weekday() → 요일 문자열 매핑
-WEEKDAY_MAP = {0: "mon", 1: "tue", 2: "wed", 3: "thu", 4: "fri", 5: "sat", 6: "sun"}
+from app.services.read_model import refresh_student_summary
+from app.services.schedule_calculator import latest_class_date, weekday_mask
 
 SEED_CLASS_GROUPS = [
     {"name": "월수반A", "days_of_week": ["mon", "wed"], "start_time": "14:30", "default_duration_minutes": 90, "memo": "사실상 초등 전용"},
@@ -33,13 +32,8 @@ SEED_STUDENTS = [
 def _find_cycle_start_date(days_of_week: list[str]) -> date:
     """오늘 기준으로 가장 최근 과거/오늘의 수업 요일을 찾아 시작일로 반환."""
     today = date.today()
-    # 오늘부터 7일 전까지 역순 탐색
-    for i in range(7):
-        d = today - timedelta(days=i)
-        if WEEKDAY_MAP[d.weekday()] in days_of_week:
-            return d
-    # fallback: 오늘
-    return today
+    # fallback: 수업 요일이 없으면 오늘
+    return latest_class_date(today, weekday_mask(days_of_week)) or today
 
 
 def seed_class_groups(db: Session):
@@ -91,5 +85,8 @@ def seed_class_groups(db: Session):
             days = json.loads(group.days_of_week) if isinstance(group.days_of_week, str) else group.days_of_week
             cycle_start = _find_cycle_start_date(days)
             start_cycle(db, student.id, cycle_start)
+        else:
+            # 대시보드 읽기 모델 행 생성 (active는 start_cycle에서 갱신)
+            refresh_student_summary(db, student.id)
 
     db.commit()
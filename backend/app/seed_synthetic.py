@@ -0,0 +1,244 @@
+"""부하 테스트용 합성 데이터 생성 (seed.py의 확장판).
+
+지점 N개 × 학생 M명 × Y년치 사이클/출석/수업료/등록 이력을 만든다.
+앱은 지점마다 따로 배포되므로, 여기서는 지점 이름을 붙인 수업반 세트를 한 DB에 넣어
+"지점 N개 규모의 단일 인스턴스"를 만든다 (예: "분당점 월수반A").
+
+- 빈 DB에서만 실행 (id를 직접 매겨 executemany로 넣는다)
+- 같은 --seed면 같은 데이터 → 벤치마크 결과 비교 가능
+- 출석은 모두 회차 차감 상태라 사이클의 current_count(8)와 일치한다
+- 마지막에 읽기 모델(student_summaries)과 월별 집계(attendance_monthly, payment_monthly)를 다시 만든다
+
+사용법 (backend/ 에서):
+    python -m app.seed_synthetic --branches 3 --students 300 --years 2
+"""
+import argparse
+import json
+import random
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta
+
+from sqlalchemy import func, insert, select, text
+from sqlalchemy.orm import Session
+
+from app.constants import GRADE_CONFIG
+from app.database import Base, SessionLocal, engine
+from app.migrate import ensure_indexes
+from app.models.attendance import Attendance
+from app.models.class_group import ClassGroup
+from app.models.cycle import Cycle
+from app.models.enrollment_history import EnrollmentHistory
+from app.models.payment import Payment
+from app.models.student import Student
+from app.seed import SEED_CLASS_GROUPS
+from app.services.attendance_stats import rebuild_attendance_rollup
+from app.services.read_model import rebuild_read_model
+from app.services.revenue import rebuild_payment_rollup
+from app.services.schedule_calculator import class_dates, weekday_mask
+
+# 모델 import (관계 매핑 설정을 위해 필요)
+import app.models.student_summary  # noqa: F401
+import app.models.message_template  # noqa: F401
+import app.models.attendance_monthly  # noqa: F401
+import app.models.payment_monthly  # noqa: F401
+
+BRANCH_NAMES = ["강남점", "서초점", "송파점", "분당점", "일산점", "목동점", "노원점", "수원점"]
+SURNAMES = "김이박최정강조윤장임한오서신권황안송류홍"
+GIVEN = ["서연", "준호", "지민", "유진", "하은", "민수", "소희", "도윤", "서준", "하린", "지호", "예은", "시우", "수아"]
+SCHOOLS = {"elementary": ["서울초", "한빛초", "새솔초"], "middle": ["강남중", "한강중"], "high": ["서초고", "중앙고"]}
+
+# 상태 비율 (학생 수 기준). 수업중 학생의 10%는 마지막 사이클 완료 후 납부 대기
+STATUS_WEIGHTS = {"active": 0.75, "stopped": 0.15, "inquiry": 0.05, "level_test": 0.05}
+# 지난 수업의 출석 상태 비율 (모두 회차 차감)
+ATTENDANCE_WEIGHTS = {"present": 0.85, "late": 0.07, "early_leave": 0.03, "absent": 0.05}
+
+INSERT_CHUNK = 5000
+
+
+def _branch_name(index: int) -> str:
+    return BRANCH_NAMES[index] if index < len(BRANCH_NAMES) else f"{index + 1}호점"
+
+
+def _school(grade: str, rng: random.Random) -> str:
+    return rng.choice(SCHOOLS["elementary" if grade == "elementary" else "high" if grade == "high" else "middle"])
+
+
+def _insert(db: Session, model, rows: list[dict]) -> None:
+    for i in range(0, len(rows), INSERT_CHUNK):
+        db.execute(insert(model), rows[i:i + INSERT_CHUNK])
+
+
+def _sync_sequences(db: Session) -> None:
+    """PostgreSQL: id를 직접 넣었으므로 시퀀스를 최대 id로 맞춘다 (SQLite는 불필요)."""
+    if db.get_bind().dialect.name != "postgresql":
+        return
+    for model in (ClassGroup, Student, Cycle, Attendance, Payment, EnrollmentHistory):
+        table = model.__tablename__
+        db.execute(text(
+            f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), COALESCE((SELECT MAX(id) FROM {table}), 1))"
+        ))
+
+
+def generate_synthetic_data(
+    db: Session,
+    branches: int,
+    students_per_branch: int,
+    years: float,
+    end_date: date | None = None,
+    seed: int = 0,
+) -> dict[str, int]:
+    """합성 데이터를 넣고 테이블별 행 수를 반환한다 (커밋은 호출한 쪽)."""
+    if db.execute(select(func.count()).select_from(Student)).scalar():
+        raise ValueError("빈 DB에서만 실행할 수 있습니다 (학생 데이터가 이미 있음)")
+
+    rng = random.Random(seed)
+    end_date = end_date or date.today()
+    period_start = end_date - timedelta(days=int(365 * years))
+    grades = list(GRADE_CONFIG)
+    statuses, status_weights = zip(*STATUS_WEIGHTS.items())
+    att_statuses, att_weights = zip(*ATTENDANCE_WEIGHTS.items())
+
+    rows: dict[str, list[dict]] = defaultdict(list)
+    groups = []  # (id, mask)
+    for b in range(branches):
+        for data in SEED_CLASS_GROUPS:
+            group_id = len(groups) + 1
+            groups.append((group_id, weekday_mask(data["days_of_week"])))
+            rows["class_groups"].append({
+                "id": group_id,
+                "name": f"{_branch_name(b)} {data['name']}",
+                "days_of_week": json.dumps(data["days_of_week"]),
+                "start_time": data["start_time"],
+                "default_duration_minutes": data["default_duration_minutes"],
+                "memo": data["memo"],
+            })
+
+    for b in range(branches):
+        branch_groups = groups[b * len(SEED_CLASS_GROUPS):(b + 1) * len(SEED_CLASS_GROUPS)]
+        for i in range(students_per_branch):
+            student_id = len(rows["students"]) + 1
+            group_id, mask = rng.choice(branch_groups)
+            grade = rng.choice(grades)
+            status = rng.choices(statuses, status_weights)[0]
+            joined = period_start + timedelta(days=rng.randrange(max(1, int(365 * years) - 30)))
+            rows["students"].append({
+                "id": student_id,
+                "name": rng.choice(SURNAMES) + rng.choice(GIVEN),
+                "phone": f"010-{1000 + b:04d}-{i:04d}",
+                "school": _school(grade, rng),
+                "grade": grade,
+                "parent_phone": f"010-{5000 + b:04d}-{i:04d}",
+                "class_group_id": group_id,
+                "enrollment_status": status,
+                "level_test_date": joined + timedelta(days=7) if status == "level_test" else None,
+                "level_test_time": "15:00" if status == "level_test" else None,
+                "created_at": datetime.combine(joined, time(10)),
+                "updated_at": datetime.combine(joined, time(10)),
+            })
+            first_status = "inquiry" if status in ("inquiry", "level_test") else "active"
+            rows["enrollment_history"].append({
+                "student_id": student_id, "from_status": None, "to_status": first_status,
+                "changed_at": datetime.combine(joined, time(10)),
+            })
+            if status == "level_test":
+                rows["enrollment_history"].append({
+                    "student_id": student_id, "from_status": "inquiry", "to_status": "level_test",
+                    "changed_at": datetime.combine(joined + timedelta(days=1), time(10)),
+                })
+            if status in ("inquiry", "level_test"):
+                continue
+
+            # 사이클: 8회차씩 이어서, 마지막 사이클은 end_date에 걸치면 진행 중
+            stop_after = rng.randint(1, 12) if status == "stopped" else None
+            waiting = status == "active" and rng.random() < 0.1
+            start = joined
+            cycle_number = 0
+            while start <= end_date:
+                dates = class_dates(start, mask, 8)
+                if status == "stopped" and dates[-1] >= end_date and cycle_number:
+                    break  # 중단 학생은 기간 안에 끝난 사이클까지만
+                cycle_number += 1
+                cycle_id = len(rows["cycles"]) + 1
+                in_progress = dates[-1] >= end_date and status == "active"
+                rows["cycles"].append({
+                    "id": cycle_id, "student_id": student_id, "cycle_number": cycle_number,
+                    "current_count": 8, "total_count": 8,
+                    "status": "in_progress" if in_progress else "completed",
+                    "started_at": start, "completed_at": None if in_progress else dates[-1],
+                    "created_at": datetime.combine(start, time(9)),
+                })
+                rows["attendance"].extend(
+                    {
+                        "student_id": student_id, "cycle_id": cycle_id, "date": d,
+                        "status": rng.choices(att_statuses, att_weights)[0] if d <= end_date else "present",
+                        "counts_toward_cycle": True,
+                        "created_at": datetime.combine(start, time(9)),
+                    }
+                    for d in dates
+                )
+                if in_progress:
+                    break
+
+                # 마지막 완료 사이클: 중단 학생의 마지막, 또는 납부 대기 중인 수업중 학생(알림 대상)
+                next_start = dates[-1] + timedelta(days=1)
+                last = (
+                    cycle_number == stop_after
+                    or next_start > end_date
+                    or (waiting and class_dates(next_start, mask, 8)[-1] >= end_date)
+                )
+                created = datetime.combine(dates[-1], time(21))
+                paid = not last or (status == "stopped" and rng.random() < 0.7)
+                rows["payments"].append({
+                    "student_id": student_id, "cycle_id": cycle_id,
+                    "amount": GRADE_CONFIG[grade]["tuition"],
+                    "payment_method": rng.choice(["transfer", "cash"]) if paid else None,
+                    "status": "paid" if paid else "pending",
+                    "message_sent": paid or rng.random() < 0.5,
+                    "message_sent_at": created if paid else None,
+                    "paid_at": created + timedelta(days=rng.randint(1, 5)) if paid else None,
+                    "created_at": created,
+                })
+                if last:
+                    break
+                start = next_start
+
+            if status == "stopped":
+                rows["enrollment_history"].append({
+                    "student_id": student_id, "from_status": "active", "to_status": "stopped",
+                    "changed_at": datetime.combine(rows["cycles"][-1]["completed_at"], time(21)),
+                })
+
+    for model in (ClassGroup, Student, Cycle, Attendance, Payment, EnrollmentHistory):
+        _insert(db, model, rows[model.__tablename__])
+    _sync_sequences(db)
+    summaries = rebuild_read_model(db)
+
+    counts = {table: len(table_rows) for table, table_rows in rows.items()}
+    counts["student_summaries"] = summaries
+    counts["attendance_monthly"] = rebuild_attendance_rollup(db)
+    counts["payment_monthly"] = rebuild_payment_rollup(db)
+    return counts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="부하 테스트용 합성 데이터 생성 (빈 DB)")
+    parser.add_argument("--branches", type=int, default=3)
+    parser.add_argument("--students", type=int, default=300, help="지점당 학생 수")
+    parser.add_argument("--years", type=float, default=2)
+    parser.add_argument("--end-date", type=date.fromisoformat, default=None, help="기본: 오늘")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    Base.metadata.create_all(bind=engine)
+    ensure_indexes(engine)
+    db = SessionLocal()
+    try:
+        counts = generate_synthetic_data(db, args.branches, args.students, args.years, args.end_date, args.seed)
+        db.commit()
+    finally:
+        db.close()
+    print(", ".join(f"{table} {count:,}" for table, count in counts.items()))
+
+
+if __name__ == "__main__":
+    main()
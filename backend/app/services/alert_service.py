@@ -0,0 +1,64 @@
+"""사이클 알림: 학생별 최신 사이클이 완료 상태(다음 사이클 미시작)인 수업중 학생 목록."""
+from sqlalchemy import and_, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.cache import TTLCache, invalidate_on_commit
+from app.config import settings
+from app.models.class_group import ClassGroup
+from app.models.cycle import Cycle
+from app.models.student import Student
+
+alerts_cache = TTLCache("cycle_alerts", settings.alerts_cache_ttl_seconds, maxsize=1)
+
+
+def mark_alerts_stale(db: Session) -> None:
+    """사이클/학생/수업반/수업료 변경 시 호출. 커밋되면 알림 캐시를 비운다."""
+    invalidate_on_commit(db, alerts_cache)
+
+
+def alerts_select():
+    """학생별 최신 사이클(ROW_NUMBER 윈도우)이 completed인 수업중 학생 - 쿼리 1회."""
+    latest = (
+        select(
+            Cycle.id.label("cycle_id"),
+            func.row_number().over(
+                partition_by=Cycle.student_id,
+                order_by=Cycle.cycle_number.desc(),
+            ).label("rn"),
+        )
+        .subquery()
+    )
+    return (
+        select(Cycle, Student, ClassGroup)
+        .join(latest, and_(latest.c.cycle_id == Cycle.id, latest.c.rn == 1))
+        .join(Student, Student.id == Cycle.student_id)
+        .outerjoin(ClassGroup, ClassGroup.id == Student.class_group_id)
+        .where(Cycle.status == "completed", Student.enrollment_status == "active")
+        .order_by(Cycle.completed_at.desc())
+    )
+
+
+async def get_cycle_alerts(db: AsyncSession) -> list[dict]:
+    # 조회 전에 버전을 받아 두면, 조회하는 사이 다른 요청의 커밋으로 무효화된 옛 목록은 캐시하지 않는다
+    version = alerts_cache.version
+    cached = alerts_cache.get()
+    if cached is not None:
+        return cached
+
+    result = await db.execute(alerts_select())
+    alerts = [
+        {
+            "student_id": student.id,
+            "student_name": student.name,
+            "class_group_name": group.name if group else "",
+            "cycle_id": c.id,
+            "cycle_number": c.cycle_number,
+            "current_count": c.current_count,
+            "total_count": c.total_count,
+            "status": c.status,
+        }
+        for c, student, group in result.all()
+    ]
+    alerts_cache.set(None, alerts, version)
+    return alerts
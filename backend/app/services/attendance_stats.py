@@ -0,0 +1,171 @@
+"""출석 통계: 학생/수업반/월별 출석률, 결석 사유별 건수, 지각·조퇴 빈도.
+
+- 월별 집계(attendance_monthly)는 출석 레코드를 만들거나 바꾸는 쪽이 같은 트랜잭션에서
+  update_attendance_rollup으로 증감한다 (스케줄 생성/연장, 출석 변경)
+- 조회: 지난 달까지는 집계 테이블, 이번 달은 오늘까지의 출석 기록을 직접 GROUP BY 한다
+  (출석 레코드는 앞으로의 스케줄까지 미리 만들어지므로 아직 안 한 수업은 빼야 한다)
+- rebuild_attendance_rollup: 전체 재생성 (최초 도입, 정합성 복구)
+- 수업반 기준 집계는 학생의 현재 수업반을 따른다
+"""
+from collections import Counter
+from datetime import date
+from typing import Iterable, Sequence
+
+from sqlalchemy import delete, distinct, func, insert, literal, literal_column, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.models.attendance import Attendance
+from app.models.attendance_monthly import AttendanceMonthly
+from app.models.class_group import ClassGroup
+from app.models.student import Student
+from app.services.rollup import add_to_rollup, month_expr, month_key
+
+ATTENDED_STATUSES = ("present", "late", "early_leave")
+ABSENT_STATUSES = ("absent", "absent_excused")
+GROUP_BY_FIELDS = ("month", "student", "class_group")
+
+# (학생 id, 수업일, 출석 상태, 사유)
+RollupEntry = tuple[int, date, str, str | None]
+
+
+def update_attendance_rollup(
+    db: Session, added: Iterable[RollupEntry] = (), removed: Iterable[RollupEntry] = ()
+) -> None:
+    """추가/제거된 출석만큼 월별 집계를 증감 (키별 upsert 1회, 변화 없으면 쿼리 없음)."""
+    delta: Counter = Counter()
+    for student_id, day, status, reason in added:
+        delta[(month_key(day), student_id, status, reason or "")] += 1
+    for student_id, day, status, reason in removed:
+        delta[(month_key(day), student_id, status, reason or "")] -= 1
+    rows = [
+        {"month": month, "student_id": student_id, "status": status, "excuse_reason": reason, "count": n}
+        for (month, student_id, status, reason), n in delta.items()
+        if n
+    ]
+    add_to_rollup(db, AttendanceMonthly, ["month", "student_id", "status", "excuse_reason"], rows)
+
+
+def rebuild_attendance_rollup(db: Session) -> int:
+    """출석 기록 전체를 GROUP BY 1회로 다시 집계하고, 만든 집계 행 수를 반환한다."""
+    month = month_expr(db, Attendance.date)
+    reason = func.coalesce(Attendance.excuse_reason, literal_column("''"))
+    db.execute(delete(AttendanceMonthly))
+    db.execute(insert(AttendanceMonthly).from_select(
+        ["month", "student_id", "status", "excuse_reason", "count"],
+        select(month, Attendance.student_id, Attendance.status, reason, func.count())
+        .group_by(month, Attendance.student_id, Attendance.status, reason),
+    ))
+    db.flush()
+    return db.execute(select(func.count()).select_from(AttendanceMonthly)).scalar()
+
+
+def ensure_attendance_rollup(db: Session) -> None:
+    """집계가 비어 있는데 출석 기록이 있으면 (기존 DB 최초 기동) 전체 생성."""
+    if db.query(AttendanceMonthly).first() is None and db.query(Attendance).first() is not None:
+        rebuild_attendance_rollup(db)
+        db.commit()
+
+
+def _stats_source(month_from: str, month_to: str, today: date):
+    """(month, student_id, status, excuse_reason, n) 행. 지난 달까지 = 집계, 이번 달 = 오늘까지의 원본."""
+    current = month_key(today)
+    parts = []
+    if month_from < current:
+        parts.append(
+            select(
+                AttendanceMonthly.month,
+                AttendanceMonthly.student_id,
+                AttendanceMonthly.status,
+                AttendanceMonthly.excuse_reason,
+                AttendanceMonthly.count.label("n"),
+            ).where(
+                AttendanceMonthly.month >= month_from,
+                AttendanceMonthly.month <= month_to,
+                AttendanceMonthly.month < current,
+            )
+        )
+    if month_from <= current <= month_to:
+        parts.append(
+            select(
+                literal(current).label("month"),
+                Attendance.student_id,
+                Attendance.status,
+                func.coalesce(Attendance.excuse_reason, literal_column("''")).label("excuse_reason"),
+                literal(1).label("n"),
+            ).where(Attendance.date >= today.replace(day=1), Attendance.date <= today)
+        )
+    if not parts:
+        return None
+    return (union_all(*parts) if len(parts) > 1 else parts[0]).subquery()
+
+
+def _dimensions(source, group_by: Sequence[str]) -> list:
+    columns = []
+    if "month" in group_by:
+        columns.append(source.c.month)
+    if "student" in group_by:
+        columns += [Student.id.label("student_id"), Student.name.label("student_name")]
+    if "class_group" in group_by:
+        columns += [Student.class_group_id.label("class_group_id"), ClassGroup.name.label("class_group_name")]
+    return columns
+
+
+def _empty_row(keys: dict) -> dict:
+    return {
+        "month": None, "student_id": None, "student_name": None, "class_group_id": None, "class_group_name": None,
+        **keys,
+        "students": 0, "total": 0,
+        **{status: 0 for status in ATTENDED_STATUSES + ABSENT_STATUSES},
+        "attendance_rate": 0.0,
+        "absence_reasons": {},
+    }
+
+
+async def get_attendance_stats(
+    db: AsyncSession,
+    month_from: str,
+    month_to: str,
+    group_by: Sequence[str] = ("month",),
+    class_group_id: int | None = None,
+    today: date | None = None,
+) -> list[dict]:
+    """group_by(month/student/class_group 조합)별 출석 통계. 기간·데이터 양과 무관하게 쿼리 2회."""
+    source = _stats_source(month_from, month_to, today or date.today())
+    if source is None:
+        return []
+
+    dims = _dimensions(source, group_by)
+
+    def _stmt(*aggregates):
+        stmt = select(*dims, *aggregates).select_from(source).join(Student, Student.id == source.c.student_id)
+        if "class_group" in group_by:
+            stmt = stmt.outerjoin(ClassGroup, ClassGroup.id == Student.class_group_id)
+        if class_group_id:
+            stmt = stmt.where(Student.class_group_id == class_group_id)
+        return stmt
+
+    counts = await db.execute(
+        _stmt(source.c.status, source.c.excuse_reason, func.sum(source.c.n))
+        .group_by(*dims, source.c.status, source.c.excuse_reason)
+        .order_by(*dims)
+    )
+    students = await db.execute(_stmt(func.count(distinct(source.c.student_id))).group_by(*dims))
+
+    labels = [column.name for column in dims]
+    rows: dict[tuple, dict] = {}
+    for *keys, status, reason, n in counts.all():
+        row = rows.setdefault(tuple(keys), _empty_row(dict(zip(labels, keys))))
+        row[status] = row.get(status, 0) + n
+        row["total"] += n
+        if status in ABSENT_STATUSES:
+            reason = reason or "none"
+            row["absence_reasons"][reason] = row["absence_reasons"].get(reason, 0) + n
+    for *keys, count in students.all():
+        if tuple(keys) in rows:
+            rows[tuple(keys)]["students"] = count
+
+    for row in rows.values():
+        attended = sum(row[status] for status in ATTENDED_STATUSES)
+        row["attendance_rate"] = round(attended / row["total"], 4) if row["total"] else 0.0
+    return list(rows.values())
@@ -0,0 +1,100 @@
+"""수업반 캐시.
+
+수업반은 1년에 몇 번 바뀌지 않는데, 사이클 시작/스케줄 연장/수업반 조회마다
+DB 조회 + json.loads(days_of_week)를 반복했다. 전체 수업반을 한 번에 읽어
+요일 목록·요일 비트마스크를 미리 계산해 두고, 수업반 변경 API가 커밋될 때 무효화한다.
+"""
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Iterable
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.cache import TTLCache, invalidate_on_commit
+from app.config import settings
+from app.models.class_group import ClassGroup
+from app.services.schedule_calculator import weekday_mask
+
+class_group_cache = TTLCache("class_groups", settings.class_group_cache_ttl_seconds, maxsize=1)
+
+
+@dataclass(frozen=True)
+class ClassGroupInfo:
+    id: int
+    name: str
+    days_of_week: tuple[str, ...]
+    weekday_mask: int
+    start_time: str
+    default_duration_minutes: int
+    memo: str | None
+    is_active: bool
+    created_at: datetime
+    updated_at: datetime
+
+    def to_response(self) -> dict:
+        return {
+            "id": self.id,
+            "name": self.name,
+            "days_of_week": list(self.days_of_week),
+            "start_time": self.start_time,
+            "default_duration_minutes": self.default_duration_minutes,
+            "memo": self.memo,
+            "is_active": self.is_active,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+        }
+
+
+def _to_info(group: ClassGroup) -> ClassGroupInfo:
+    days = json.loads(group.days_of_week) if isinstance(group.days_of_week, str) else group.days_of_week
+    return ClassGroupInfo(
+        id=group.id,
+        name=group.name,
+        days_of_week=tuple(days),
+        weekday_mask=weekday_mask(days),
+        start_time=group.start_time,
+        default_duration_minutes=group.default_duration_minutes,
+        memo=group.memo,
+        is_active=group.is_active,
+        created_at=group.created_at,
+        updated_at=group.updated_at,
+    )
+
+
+def _load_all(db: Session) -> dict[int, ClassGroupInfo]:
+    groups = db.query(ClassGroup).order_by(ClassGroup.start_time).all()
+    return {g.id: _to_info(g) for g in groups}
+
+
+def get_class_groups(db: Session) -> dict[int, ClassGroupInfo]:
+    """전체 수업반 (삭제된 수업반 포함, 시작 시간순). 캐시에 없으면 쿼리 1회."""
+    return class_group_cache.get_or_set(None, lambda: _load_all(db))
+
+
+def get_active_class_groups(db: Session) -> list[ClassGroupInfo]:
+    return [g for g in get_class_groups(db).values() if g.is_active]
+
+
+def get_class_groups_including(db: Session, group_ids: Iterable[int | None]) -> dict[int, ClassGroupInfo]:
+    """전체 수업반 (get_class_groups). group_ids 중 캐시에 없는 id가 DB에 있으면 한 번 다시 읽는다.
+
+    다른 워커/CLI/시드로 추가된 수업반을 놓치지 않기 위해서다. 없는 id뿐이면 그 id들을
+    확인하는 쿼리 1회로 끝나고 캐시는 그대로 둔다 (잘못된 id마다 전체를 다시 읽지 않도록).
+    """
+    groups = get_class_groups(db)
+    missing = {gid for gid in group_ids if gid is not None and gid not in groups}
+    if missing and db.execute(select(ClassGroup.id).where(ClassGroup.id.in_(missing)).limit(1)).first():
+        class_group_cache.invalidate()
+        groups = get_class_groups(db)
+    return groups
+
+
+def get_class_group_info(db: Session, group_id: int) -> ClassGroupInfo | None:
+    return get_class_groups_including(db, [group_id]).get(group_id)
+
+
+def mark_class_groups_stale(db: Session) -> None:
+    """수업반 생성/수정/삭제 시 호출. 커밋되면 캐시를 비운다."""
+    invalidate_on_commit(db, class_group_cache)
@@ -1,6 +1,6 @@
-import json
-from datetime import date, timedelta
+from datetime import date
 
+from sqlalchemy import and_, case, func, insert, select, tuple_
 from sqlalchemy.orm import Session
 
 from app.constants import GRADE_CONFIG
@@ -9,24 +9,24 @@ from app.models.class_group import ClassGroup
 from app.models.cycle import Cycle
 from app.models.payment import Payment
 from app.models.student import Student
-
-# Python weekday() → 요일 문자열 매핑
-WEEKDAY_MAP = {0: "mon", 1: "tue", 2: "wed", 3: "thu", 4: "fri", 5: "sat", 6: "sun"}
+from app.services.alert_service import alerts_select, mark_alerts_stale
+from app.services.attendance_stats import update_attendance_rollup
+from app.services.class_group_cache import get_class_group_info, get_class_groups_including
+from app.services.read_model import (
+    apply_cycle_count_delta,
+    refresh_student_summaries,
+    refresh_student_summary,
+    set_cycle_count,
+)
+from app.services.revenue import payment_entry, update_payment_rollup
+from app.services.schedule_calculator import class_dates, next_class_dates, weekday_mask
 
 
 def generate_schedule(
     db: Session, student_id: int, cycle_id: int, start_date: date, days_of_week: list[str], count: int = 8
 ) -> list[Attendance]:
     """수업반 요일 기준으로 출석 스케줄을 미리 생성한다 (기본: present)."""
-    schedule_dates: list[date] = []
-    current = start_date
-    for _ in range(365):
-        day_name = WEEKDAY_MAP[current.weekday()]
-        if day_name in days_of_week:
-            schedule_dates.append(current)
-            if len(schedule_dates) >= count:
-                break
-        current += timedelta(days=1)
+    schedule_dates = class_dates(start_date, weekday_mask(days_of_week), count)
 
     records = []
     for d in schedule_dates:
@@ -41,6 +41,7 @@ def generate_schedule(
         records.append(att)
 
     db.flush()
+    update_attendance_rollup(db, added=[(student_id, d, "present", None) for d in schedule_dates])
     return records
 
 
@@ -55,11 +56,11 @@ def start_cycle(db: Session, student_id: int, start_date: date) -> Cycle:
     if not student:
         raise ValueError("학생을 찾을 수 없습니다")
 
-    group = db.query(ClassGroup).filter(ClassGroup.id == student.class_group_id).first()
+    group = get_class_group_info(db, student.class_group_id)
     if not group:
         raise ValueError("수업반을 찾을 수 없습니다")
 
-    days = json.loads(group.days_of_week) if isinstance(group.days_of_week, str) else group.days_of_week
+    days = list(group.days_of_week)
 
     # 사이클 번호 결정
     last_cycle = (
@@ -81,25 +82,118 @@ def start_cycle(db: Session, student_id: int, start_date: date) -> Cycle:
     db.flush()
 
     generate_schedule(db, student_id, cycle.id, start_date, days, count=8)
+    refresh_student_summary(db, student_id)
+    mark_alerts_stale(db)
 
     return cycle
 
 
-def extend_schedule(db: Session, cycle_id: int):
-    """미차감 결석 시 스케줄 1회 연장. 마지막 스케줄 다음 수업 요일에 추가."""
+def start_cycles_bulk(db: Session, starts: dict[int, date]) -> dict[int, int]:
+    """여러 학생의 사이클을 한 번에 시작한다. {학생 id: 시작일} → {학생 id: 새 사이클 id}.
+
+    start_cycle과 같은 규칙(다음 사이클 번호, 8회차 present 스케줄)을 따르되
+    사이클/출석을 executemany로 넣어 학생 수와 무관하게 쿼리 수가 고정된다.
+    수업반 요일은 캐시에서 한 번만 읽고, 같은 (수업반, 시작일)의 스케줄은 한 번만 계산한다.
+    읽기 모델은 호출한 쪽에서 refresh_student_summaries로 갱신한다.
+    """
+    if not starts:
+        return {}
+
+    student_groups = dict(db.execute(
+        select(Student.id, Student.class_group_id).where(Student.id.in_(starts))
+    ).all())
+    missing = [sid for sid in starts if sid not in student_groups]
+    if missing:
+        raise ValueError(f"학생을 찾을 수 없습니다: {missing}")
+    groups = get_class_groups_including(db, student_groups.values())
+    if any(gid not in groups for gid in student_groups.values()):
+        raise ValueError("수업반을 찾을 수 없습니다")
+
+    last_numbers = dict(db.execute(
+        select(Cycle.student_id, func.max(Cycle.cycle_number))
+        .where(Cycle.student_id.in_(starts))
+        .group_by(Cycle.student_id)
+    ).all())
+
+    student_ids = list(starts)
+    numbers = {sid: last_numbers.get(sid, 0) + 1 for sid in student_ids}
+    db.execute(insert(Cycle), [
+        {"student_id": sid, "cycle_number": numbers[sid], "current_count": 8, "total_count": 8, "started_at": starts[sid]}
+        for sid in student_ids
+    ])
+    # (학생, 사이클 번호)로 새 id 조회 (RETURNING 순서 보장은 SQLite에서 행마다 INSERT가 된다)
+    cycle_by_student = dict(db.execute(
+        select(Cycle.student_id, Cycle.id)
+        .where(tuple_(Cycle.student_id, Cycle.cycle_number).in_(list(numbers.items())))
+    ).all())
+    cycle_ids = [cycle_by_student[sid] for sid in student_ids]
+
+    schedules: dict[tuple[int, date], list[date]] = {}
+    attendance_rows = []
+    for sid, cycle_id in zip(student_ids, cycle_ids):
+        key = (student_groups[sid], starts[sid])
+        if key not in schedules:
+            schedules[key] = class_dates(starts[sid], groups[key[0]].weekday_mask, 8)
+        attendance_rows.extend(
+            {"student_id": sid, "cycle_id": cycle_id, "date": d, "status": "present", "counts_toward_cycle": True}
+            for d in schedules[key]
+        )
+    if attendance_rows:
+        db.execute(insert(Attendance), attendance_rows)
+        update_attendance_rollup(db, added=[(r["student_id"], r["date"], r["status"], None) for r in attendance_rows])
+    mark_alerts_stale(db)
+    return dict(zip(student_ids, cycle_ids))
+
+
+def rollover_cycles(db: Session, start_date: date, class_group_id: int | None = None) -> list[dict]:
+    """학기 전환: 최신 사이클이 완료 + 납부 확인된 수업중 학생 전원의 다음 사이클을 한 번에 시작한다.
+
+    삭제된(is_active=False) 수업반이나 수업반이 없는 학생은 제외한다 (스케줄을 만들 요일이 없음).
+    class_group_id가 있으면 그 수업반만. 대상 조회 1회 + start_cycles_bulk + 읽기 모델 일괄 갱신으로
+    학생 수와 무관하게 쿼리 수가 고정된다. 시작한 사이클 목록을 반환한다.
+    """
+    stmt = (
+        alerts_select()
+        .join(Payment, and_(Payment.cycle_id == Cycle.id, Payment.status == "paid"))
+        .where(ClassGroup.is_active)
+    )
+    if class_group_id:
+        stmt = stmt.where(Student.class_group_id == class_group_id)
+    candidates = db.execute(stmt).all()
+    if not candidates:
+        return []
+
+    started = start_cycles_bulk(db, {student.id: start_date for _, student, _ in candidates})
+    refresh_student_summaries(db, list(started))
+    return [
+        {
+            "student_id": student.id,
+            "student_name": student.name,
+            "class_group_name": group.name if group else "",
+            "previous_cycle_id": cycle.id,
+            "cycle_id": started[student.id],
+            "cycle_number": cycle.cycle_number + 1,
+        }
+        for cycle, student, group in candidates
+    ]
+
+
+def extend_schedule(db: Session, cycle_id: int, count: int = 1) -> list[Attendance]:
+    """미차감 결석 시 스케줄 연장 (기본 1회). 마지막 스케줄 다음 수업 요일부터 count개 추가.
+
+    추가된 출석 레코드를 반환한다 (연장 불가 시 빈 목록).
+    """
     cycle = db.query(Cycle).filter(Cycle.id == cycle_id).first()
     if not cycle:
-        return
+        return []
 
     student = db.query(Student).filter(Student.id == cycle.student_id).first()
     if not student:
-        return
+        return []
 
-    group = db.query(ClassGroup).filter(ClassGroup.id == student.class_group_id).first()
+    group = get_class_group_info(db, student.class_group_id)
     if not group:
-        return
-
-    days = json.loads(group.days_of_week) if isinstance(group.days_of_week, str) else group.days_of_week
+        return []
 
     # 이 사이클의 마지막 스케줄 날짜
     last_att = (
@@ -109,55 +203,72 @@ def extend_schedule(db: Session, cycle_id: int):
         .first()
     )
     if not last_att:
-        return
+        return []
 
     # 마지막 날짜 다음 날부터 다음 수업 요일 찾기
-    next_dates = _find_next_class_dates(last_att.date, days, count=1)
+    next_dates = next_class_dates(last_att.date, group.weekday_mask, count)
     if not next_dates:
-        return
+        return []
 
-    att = Attendance(
-        student_id=cycle.student_id,
-        cycle_id=cycle_id,
-        date=next_dates[0],
-        status="present",
-        counts_toward_cycle=True,
-    )
-    db.add(att)
+    records = []
+    for d in next_dates:
+        att = Attendance(
+            student_id=cycle.student_id,
+            cycle_id=cycle_id,
+            date=d,
+            status="present",
+            counts_toward_cycle=True,
+        )
+        db.add(att)
+        records.append(att)
     db.flush()
+    update_attendance_rollup(db, added=[(cycle.student_id, d, "present", None) for d in next_dates])
+    return records
 
 
-def _find_next_class_dates(after_date: date, days_of_week: list[str], count: int = 1) -> list[date]:
-    """지정 날짜 이후의 다음 수업 요일 날짜들을 찾는다."""
-    result: list[date] = []
-    current = after_date + timedelta(days=1)
-    for _ in range(365):
-        day_name = WEEKDAY_MAP[current.weekday()]
-        if day_name in days_of_week:
-            result.append(current)
-            if len(result) >= count:
-                break
-        current += timedelta(days=1)
-    return result
-
-
-def recount_cycle(db: Session, cycle_id: int):
-    """사이클의 현재 회차를 출석 기록 기준으로 재계산한다.
+def adjust_cycle_count(db: Session, cycle_id: int, delta: int):
+    """출석 변경으로 생긴 차감 회차 증감분만 current_count에 반영한다.
 
-    스케줄 기반 시스템에서는 상태를 자동 변경하지 않는다.
-    완료 처리는 complete_cycle()로 수동 수행.
+    사이클 전체를 COUNT(*)로 다시 세지 않고 호출자가 계산한 delta를 같은 트랜잭션에서 더한다.
+    (counts_toward_cycle 변경분 + 연장으로 추가된 회차)
     """
-    cycle = db.query(Cycle).filter(Cycle.id == cycle_id).first()
-    if not cycle:
+    if not delta:
         return
+    db.query(Cycle).filter(Cycle.id == cycle_id).update(
+        {Cycle.current_count: Cycle.current_count + delta}
+    )
+    apply_cycle_count_delta(db, cycle_id, delta)
+    mark_alerts_stale(db)
 
-    count = db.query(Attendance).filter(
-        Attendance.cycle_id == cycle_id,
-        Attendance.counts_toward_cycle == True,  # noqa: E712
-    ).count()
 
-    cycle.current_count = count
-    db.flush()
+def check_cycle_counts(db: Session, repair: bool = False) -> list[dict]:
+    """모든 사이클의 current_count를 출석 기록과 대조한다 (GROUP BY 1회).
+
+    불일치 목록을 반환하며, repair=True면 실제 값으로 바로잡는다 (커밋은 호출자 몫).
+    """
+    actual = func.coalesce(
+        func.sum(case((Attendance.counts_toward_cycle == True, 1), else_=0)),  # noqa: E712
+        0,
+    )
+    rows = (
+        db.query(Cycle.id, Cycle.current_count, actual)
+        .outerjoin(Attendance, Attendance.cycle_id == Cycle.id)
+        .group_by(Cycle.id, Cycle.current_count)
+        .having(Cycle.current_count != actual)
+        .all()
+    )
+    drifts = [
+        {"cycle_id": cycle_id, "stored": stored, "actual": count}
+        for cycle_id, stored, count in rows
+    ]
+    if repair:
+        for d in drifts:
+            db.query(Cycle).filter(Cycle.id == d["cycle_id"]).update({Cycle.current_count: d["actual"]})
+            set_cycle_count(db, d["cycle_id"], d["actual"])
+        if drifts:
+            mark_alerts_stale(db)
+        db.flush()
+    return drifts
 
 
 def complete_cycle(db: Session, cycle_id: int):
@@ -172,7 +283,8 @@ def complete_cycle(db: Session, cycle_id: int):
     cycle.status = "completed"
     cycle.completed_at = date.today()
     _create_next_payment(db, cycle.student_id, cycle.id)
-    db.flush()
+    refresh_student_summary(db, cycle.student_id)
+    mark_alerts_stale(db)
 
 
 def _create_next_payment(db: Session, student_id: int, cycle_id: int):
@@ -197,3 +309,5 @@ def _create_next_payment(db: Session, student_id: int, cycle_id: int):
         amount=amount,
     )
     db.add(payment)
+    db.flush()
+    update_payment_rollup(db, added=[payment_entry(payment, student.grade, student.class_group_id)])
@@ -0,0 +1,40 @@
+"""수업등록 이력(EnrollmentHistory) 기반 상태별 일자 계산."""
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.models.enrollment_history import EnrollmentHistory
+
+# to_status → 응답 필드명
+STATUS_DATE_FIELDS = {
+    "inquiry": "inquiry_date",
+    "level_test": "level_test_status_date",
+    "active": "active_date",
+    "stopped": "stopped_date",
+}
+
+
+def status_dates_select(student_ids: list[int] | None = None):
+    """학생별·상태별 최초 전환 일자 (EnrollmentHistory GROUP BY 1회). None이면 전체 학생."""
+    stmt = select(
+        EnrollmentHistory.student_id,
+        EnrollmentHistory.to_status,
+        func.min(EnrollmentHistory.changed_at),
+    )
+    if student_ids is not None:
+        stmt = stmt.where(EnrollmentHistory.student_id.in_(student_ids))
+    return stmt.group_by(EnrollmentHistory.student_id, EnrollmentHistory.to_status)
+
+
+def build_status_dates_map(student_ids: list[int], rows) -> dict[int, dict]:
+    result: dict[int, dict] = {sid: {v: None for v in STATUS_DATE_FIELDS.values()} for sid in student_ids}
+    for student_id, to_status, first_changed_at in rows:
+        key = STATUS_DATE_FIELDS.get(to_status)
+        if key and student_id in result:
+            result[student_id][key] = first_changed_at
+    return result
+
+
+def get_status_dates_map(db: Session, student_ids: list[int]) -> dict[int, dict]:
+    """EnrollmentHistory에서 학생별·상태별 최초 전환 일자를 한 번의 GROUP BY 쿼리로 조회."""
+    rows = db.execute(status_dates_select(student_ids)).all() if student_ids else []
+    return build_status_dates_map(student_ids, rows)
@@ -0,0 +1,150 @@
+"""출석/수업료/등록 이력 대량 내보내기 (회계 시스템 연동용).
+
+목록 API처럼 전체를 메모리에 올리지 않고, yield_per로 EXPORT_BATCH_SIZE 행씩 읽어
+바로 CSV/NDJSON 청크로 내보낸다. 내보내는 기간과 무관하게 메모리 사용량이 일정하다.
+(PostgreSQL에서는 yield_per가 서버 측 커서를 사용한다)
+"""
+import csv
+import io
+import json
+from collections.abc import Iterator
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import Select, select
+from sqlalchemy.orm import Session
+
+from app.models.attendance import Attendance
+from app.models.class_group import ClassGroup
+from app.models.cycle import Cycle
+from app.models.enrollment_history import EnrollmentHistory
+from app.models.payment import Payment
+from app.models.student import Student
+
+EXPORT_BATCH_SIZE = 1000
+
+
+def _attendance_select() -> Select:
+    return (
+        select(
+            Attendance.id,
+            Attendance.date,
+            Attendance.student_id,
+            Student.name.label("student_name"),
+            ClassGroup.name.label("class_group_name"),
+            Cycle.cycle_number,
+            Attendance.status,
+            Attendance.counts_toward_cycle,
+            Attendance.excuse_reason,
+            Attendance.memo,
+        )
+        .join(Student, Student.id == Attendance.student_id)
+        .outerjoin(Cycle, Cycle.id == Attendance.cycle_id)
+        .outerjoin(ClassGroup, ClassGroup.id == Student.class_group_id)
+    )
+
+
+def _payment_select() -> Select:
+    return (
+        select(
+            Payment.id,
+            Payment.created_at,
+            Payment.student_id,
+            Student.name.label("student_name"),
+            ClassGroup.name.label("class_group_name"),
+            Cycle.cycle_number,
+            Payment.amount,
+            Payment.payment_method,
+            Payment.status,
+            Payment.paid_at,
+            Payment.message_sent,
+            Payment.message_sent_at,
+            Payment.memo,
+        )
+        .join(Student, Student.id == Payment.student_id)
+        .outerjoin(Cycle, Cycle.id == Payment.cycle_id)
+        .outerjoin(ClassGroup, ClassGroup.id == Student.class_group_id)
+    )
+
+
+def _history_select() -> Select:
+    return (
+        select(
+            EnrollmentHistory.id,
+            EnrollmentHistory.changed_at,
+            EnrollmentHistory.student_id,
+            Student.name.label("student_name"),
+            ClassGroup.name.label("class_group_name"),
+            EnrollmentHistory.from_status,
+            EnrollmentHistory.to_status,
+            EnrollmentHistory.memo,
+        )
+        .join(Student, Student.id == EnrollmentHistory.student_id)
+        .outerjoin(ClassGroup, ClassGroup.id == Student.class_group_id)
+    )
+
+
+# 이름 → (select 생성 함수, 기간 필터/정렬 기준 컬럼)
+EXPORTS = {
+    "attendance": (_attendance_select, Attendance.date, Attendance.id),
+    "payments": (_payment_select, Payment.created_at, Payment.id),
+    "enrollment-history": (_history_select, EnrollmentHistory.changed_at, EnrollmentHistory.id),
+}
+
+
+def export_select(
+    name: str,
+    date_from: date | None = None,
+    date_to: date | None = None,
+    class_group_id: int | None = None,
+) -> Select:
+    """기간(date_from~date_to, 양끝 포함) / 수업반 필터를 적용한 내보내기 쿼리."""
+    builder, date_col, id_col = EXPORTS[name]
+    is_datetime = date_col.type.python_type is datetime
+    stmt = builder()
+    if date_from:
+        stmt = stmt.where(date_col >= (datetime.combine(date_from, datetime.min.time()) if is_datetime else date_from))
+    if date_to:
+        if is_datetime:
+            stmt = stmt.where(date_col < datetime.combine(date_to + timedelta(days=1), datetime.min.time()))
+        else:
+            stmt = stmt.where(date_col <= date_to)
+    if class_group_id:
+        stmt = stmt.where(Student.class_group_id == class_group_id)
+    return stmt.order_by(date_col, id_col)
+
+
+def _csv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+def _json_value(value):
+    return value.isoformat() if isinstance(value, (date, datetime)) else value
+
+
+def iter_export(db: Session, stmt: Select, fmt: str) -> Iterator[str]:
+    """쿼리 결과를 배치 단위 CSV(UTF-8 BOM, 헤더 포함) 또는 NDJSON 문자열 청크로 생성."""
+    result = db.execute(stmt.execution_options(yield_per=EXPORT_BATCH_SIZE))
+    columns = list(result.keys())
+
+    if fmt == "csv":
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        buffer.write("\ufeff")  # 엑셀에서 한글이 깨지지 않도록
+        writer.writerow(columns)
+        for batch in result.partitions():
+            writer.writerows([_csv_value(v) for v in row] for row in batch)
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+        if buffer.tell():
+            yield buffer.getvalue()
+    else:
+        for batch in result.partitions():
+            yield "".join(
+                json.dumps(dict(zip(columns, map(_json_value, row))), ensure_ascii=False) + "\n"
+                for row in batch
+            )
@@ -0,0 +1,131 @@
+"""학생 일괄 등록 (신규 지점 온보딩).
+
+모든 행을 먼저 검증하고, 하나라도 오류가 있으면 아무것도 넣지 않는다 (행별 오류 보고).
+통과하면 학생 / 최초 등록 이력 / 첫 사이클·스케줄을 executemany로 한 트랜잭션에 넣고
+읽기 모델도 한 번에 갱신한다. 커밋은 호출한 쪽(API, CLI)에서 한다.
+"""
+import csv
+import io
+
+from pydantic import ValidationError
+from sqlalchemy import insert, select, tuple_
+from sqlalchemy.orm import Session
+
+from app.constants import GRADE_CONFIG
+from app.models.enrollment_history import EnrollmentHistory
+from app.models.student import Student
+from app.schemas.student import StudentImportRow
+from app.services.class_group_cache import get_class_groups_including
+from app.services.cycle_service import start_cycles_bulk
+from app.services.read_model import refresh_student_summaries
+
+IMPORT_STATUSES = ("inquiry", "level_test", "active")
+
+
+class StudentImportError(Exception):
+    """검증 실패. errors: [{"row": 행 번호(1부터, CSV 헤더 제외), "errors": [메시지, ...]}]"""
+
+    def __init__(self, errors: list[dict]):
+        super().__init__(f"{len(errors)}개 행에 오류가 있습니다")
+        self.errors = errors
+
+
+# 엑셀(한국어 환경)은 CSV를 CP949(EUC-KR 확장)로 저장한다
+CSV_ENCODINGS = ("utf-8-sig", "cp949")
+
+
+def decode_csv(data: bytes) -> str:
+    """CSV 바이트 → 문자열. UTF-8(BOM 포함) → CP949 순서로 시도, 모두 실패하면 ValueError."""
+    for encoding in CSV_ENCODINGS:
+        try:
+            return data.decode(encoding)
+        except UnicodeDecodeError:
+            continue
+    raise ValueError("CSV 인코딩을 읽을 수 없습니다 (UTF-8 또는 CP949/EUC-KR로 저장해 주세요)")
+
+
+def parse_csv(text: str) -> list[dict]:
+    """헤더가 StudentImportRow 필드명인 CSV → 행 dict 목록. 빈 칸은 None."""
+    reader = csv.DictReader(io.StringIO(text.lstrip("\ufeff")))
+    return [
+        {key.strip(): (value.strip() or None) if value is not None else None for key, value in row.items() if key}
+        for row in reader
+    ]
+
+
+def validate_rows(db: Session, rows: list[dict]) -> list[StudentImportRow]:
+    """전체 행 검증 (스키마, 학년, 상태, 수업반, 파일 내/기존 학생 중복). 실패 시 StudentImportError."""
+    items: list[tuple[int, StudentImportRow]] = []
+    errors: list[dict] = []
+    for row_number, raw in enumerate(rows, start=1):
+        try:
+            items.append((row_number, StudentImportRow.model_validate(raw)))
+        except ValidationError as e:
+            errors.append({
+                "row": row_number,
+                "errors": [f"{'.'.join(map(str, err['loc']))}: {err['msg']}" for err in e.errors()],
+            })
+
+    groups = get_class_groups_including(db, [item.class_group_id for _, item in items])
+
+    # 이름 + 학부모 연락처가 같으면 같은 학생으로 본다 (재실행 시 중복 등록 방지)
+    keys = {(item.name, item.parent_phone) for _, item in items}
+    existing = set()
+    if keys:
+        existing = set(db.execute(
+            select(Student.name, Student.parent_phone).where(tuple_(Student.name, Student.parent_phone).in_(keys))
+        ).all())
+
+    seen: dict[tuple[str, str], int] = {}
+    for row_number, item in items:
+        problems = []
+        if item.grade not in GRADE_CONFIG:
+            problems.append(f"grade: 알 수 없는 학년입니다 ({item.grade})")
+        if item.enrollment_status not in IMPORT_STATUSES:
+            problems.append(f"enrollment_status: 등록할 수 없는 상태입니다 ({item.enrollment_status})")
+        group = groups.get(item.class_group_id)
+        if not group or not group.is_active:
+            problems.append(f"class_group_id: 수업반을 찾을 수 없습니다 ({item.class_group_id})")
+        if item.start_date and item.enrollment_status != "active":
+            problems.append("start_date: 수업중(active) 학생만 사이클을 시작할 수 있습니다")
+        key = (item.name, item.parent_phone)
+        if key in seen:
+            problems.append(f"{seen[key]}행과 같은 학생입니다")
+        elif key in existing:
+            problems.append("이미 등록된 학생입니다")
+        seen.setdefault(key, row_number)
+        if problems:
+            errors.append({"row": row_number, "errors": problems})
+
+    if errors:
+        raise StudentImportError(sorted(errors, key=lambda e: e["row"]))
+    return [item for _, item in items]
+
+
+def import_students(db: Session, rows: list[dict], dry_run: bool = False) -> dict:
+    """검증 후 일괄 등록. 학생 수와 무관하게 쿼리 수 고정."""
+    items = validate_rows(db, rows)
+    result = {"validated": len(items), "created": 0, "cycles_started": 0, "student_ids": []}
+    if dry_run or not items:
+        return result
+
+    db.execute(insert(Student), [item.model_dump(exclude={"start_date"}) for item in items])
+    # (이름, 학부모 연락처)는 검증에서 유일함을 확인했으므로 그 키로 새 id를 찾는다
+    # (RETURNING 순서 보장을 요구하면 SQLite는 행마다 INSERT를 따로 실행한다)
+    id_by_key = {
+        (name, parent_phone): sid
+        for sid, name, parent_phone in db.execute(
+            select(Student.id, Student.name, Student.parent_phone)
+            .where(tuple_(Student.name, Student.parent_phone).in_([(i.name, i.parent_phone) for i in items]))
+        )
+    }
+    student_ids = [id_by_key[(item.name, item.parent_phone)] for item in items]
+    db.execute(insert(EnrollmentHistory), [
+        {"student_id": sid, "from_status": None, "to_status": item.enrollment_status}
+        for sid, item in zip(student_ids, items)
+    ])
+    started = start_cycles_bulk(db, {sid: item.start_date for sid, item in zip(student_ids, items) if item.start_date})
+    refresh_student_summaries(db, student_ids)
+
+    result.update(created=len(student_ids), cycles_started=len(started), student_ids=student_ids)
+    return result
@@ -0,0 +1,121 @@
+"""안내 문자 템플릿.
+
+템플릿은 DB(message_templates)에 두고, 처음 쓸 때 한 번 파싱·검증해 캐시한다.
+템플릿 수정 API가 커밋되면 캐시를 비운다. 단건/일괄 안내 문자 생성이 같은 경로를 쓴다.
+
+자리표시자: {student_name} {grade_label} {cycle_number} {total_count} {amount} {class_group_name}
+({amount}는 천 단위 쉼표가 들어간 문자열)
+"""
+from dataclasses import dataclass
+from string import Formatter
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.cache import TTLCache, invalidate_on_commit
+from app.config import settings
+from app.constants import GRADE_CONFIG
+from app.models.class_group import ClassGroup
+from app.models.cycle import Cycle
+from app.models.message_template import MessageTemplate
+from app.models.payment import Payment
+from app.models.student import Student
+
+PAYMENT_NOTICE = "payment_notice"
+
+PLACEHOLDERS = {
+    PAYMENT_NOTICE: frozenset({
+        "student_name", "grade_label", "cycle_number", "total_count", "amount", "class_group_name",
+    }),
+}
+
+DEFAULT_TEMPLATES = {
+    PAYMENT_NOTICE: (
+        "안녕하세요, 수학공부방입니다.\n"
+        "\n"
+        "{student_name} 학생({grade_label})의\n"
+        "{cycle_number}회차 수업({total_count}회)이 완료되었습니다.\n"
+        "\n"
+        "수업료: {amount}원\n"
+        "\n"
+        "입금 확인 후 다음 회차 수업이 시작됩니다.\n"
+        "감사합니다."
+    ),
+}
+
+template_cache = TTLCache("message_templates", settings.template_cache_ttl_seconds, maxsize=16)
+
+
+class TemplateError(ValueError):
+    """템플릿 문법 오류 또는 허용되지 않은 자리표시자."""
+
+
+@dataclass(frozen=True)
+class CompiledTemplate:
+    name: str
+    body: str
+    fields: frozenset[str]
+    # (문자 그대로의 부분, 뒤따르는 자리표시자 또는 None) - 컴파일 때 한 번만 파싱
+    segments: tuple[tuple[str, str | None], ...]
+
+    def render(self, values: dict) -> str:
+        # 다시 파싱하지 않고 조각과 값을 이어 붙인다 (str.format_map의 약 절반)
+        parts = []
+        for literal, field in self.segments:
+            parts.append(literal)
+            if field is not None:
+                parts.append(str(values[field]))
+        return "".join(parts)
+
+
+def compile_template(name: str, body: str) -> CompiledTemplate:
+    """템플릿 파싱 + 자리표시자 검증. 서식 지정자/속성 접근({a.b}, {a[0]}, {a:>5})은 허용하지 않는다."""
+    allowed = PLACEHOLDERS[name]
+    fields = set()
+    try:
+        parsed = list(Formatter().parse(body))
+    except ValueError as e:
+        raise TemplateError(f"템플릿 문법 오류: {e}")
+    for _, field, spec, conversion in parsed:
+        if field is None:
+            continue
+        if field not in allowed or spec or conversion:
+            raise TemplateError(f"사용할 수 없는 자리표시자입니다: {{{field}}}")
+        fields.add(field)
+    segments = tuple((literal, field) for literal, field, _, _ in parsed)
+    return CompiledTemplate(name, body, frozenset(fields), segments)
+
+
+def _load(db: Session, name: str) -> CompiledTemplate:
+    body = db.execute(select(MessageTemplate.body).where(MessageTemplate.name == name)).scalar_one_or_none()
+    return compile_template(name, body if body is not None else DEFAULT_TEMPLATES[name])
+
+
+def get_template(db: Session, name: str) -> CompiledTemplate:
+    return template_cache.get_or_set(name, lambda: _load(db, name))
+
+
+def save_template(db: Session, name: str, body: str) -> CompiledTemplate:
+    """검증 후 저장 (커밋은 호출한 쪽). 커밋되면 캐시가 비워진다."""
+    compiled = compile_template(name, body)
+    template = db.execute(select(MessageTemplate).where(MessageTemplate.name == name)).scalar_one_or_none()
+    if template:
+        template.body = body
+    else:
+        db.add(MessageTemplate(name=name, body=body))
+    invalidate_on_commit(db, template_cache)
+    return compiled
+
+
+def payment_notice_values(
+    payment: Payment, student: Student | None, cycle: Cycle | None, group: ClassGroup | None
+) -> dict:
+    grade_cfg = GRADE_CONFIG.get(student.grade, {}) if student else {}
+    return {
+        "student_name": student.name if student else "학생",
+        "grade_label": grade_cfg.get("label", ""),
+        "cycle_number": cycle.cycle_number if cycle else 0,
+        "total_count": cycle.total_count if cycle else 8,
+        "amount": f"{payment.amount:,}",
+        "class_group_name": group.name if group else "",
+    }
@@ -0,0 +1,177 @@
+"""대시보드 읽기 모델(student_summaries) 유지.
+
+정규화 테이블을 바꾸는 서비스/라우터가 같은 트랜잭션 안에서 호출한다.
+- refresh_student_summary: 학생 1명의 행을 다시 계산 (상태 변경, 사이클 시작/완료, 납부)
+- refresh_student_summaries: 여러 학생을 한 번에 (일괄 등록, 일괄 사이클 시작)
+- apply_cycle_count_delta: 출석 변경 시 회차만 증감
+- rebuild_read_model: 전체 재생성 (최초 도입, 정합성 복구)
+
+학생 목록에 보이는 변경은 모두 여기를 거치므로, 학생 목록 ETag 버전(students_version)도 여기서 올린다.
+"""
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.orm import Session
+
+from app.cache import ResourceVersion, invalidate_on_commit
+from app.models.class_group import ClassGroup
+from app.models.cycle import Cycle
+from app.models.payment import Payment
+from app.models.student import Student
+from app.models.student_summary import StudentSummary
+from app.services.enrollment_service import build_status_dates_map, get_status_dates_map, status_dates_select
+
+students_version = ResourceVersion("students")
+
+
+def mark_students_changed(db: Session) -> None:
+    """학생 목록 응답이 바뀌는 변경. 커밋되면 학생 목록 ETag 버전을 올린다."""
+    invalidate_on_commit(db, students_version)
+
+
+def _summary_row(
+    student: Student,
+    group: ClassGroup | None,
+    cycle: Cycle | None,
+    payment: Payment | None,
+    status_dates: dict,
+) -> dict:
+    return {
+        "student_id": student.id,
+        "name": student.name,
+        "grade": student.grade,
+        "enrollment_status": student.enrollment_status,
+        "class_group_id": student.class_group_id,
+        "class_group_name": group.name if group else None,
+        "start_time": group.start_time if group else None,
+        "current_cycle_id": cycle.id if cycle else None,
+        "current_cycle_number": cycle.cycle_number if cycle else None,
+        "current_cycle_status": cycle.status if cycle else None,
+        "current_count": cycle.current_count if cycle else None,
+        "total_count": cycle.total_count if cycle else None,
+        "pending_payment_id": payment.id if payment else None,
+        "pending_amount": payment.amount if payment else None,
+        **status_dates,
+    }
+
+
+def refresh_student_summary(db: Session, student_id: int) -> None:
+    """학생 1명의 읽기 모델 행을 정규화 테이블 기준으로 다시 계산한다."""
+    mark_students_changed(db)
+    db.flush()
+    student = db.get(Student, student_id)
+    if not student:
+        db.execute(delete(StudentSummary).where(StudentSummary.student_id == student_id))
+        return
+
+    group = db.get(ClassGroup, student.class_group_id)
+    cycle = (
+        db.query(Cycle)
+        .filter(Cycle.student_id == student_id)
+        .order_by(Cycle.cycle_number.desc())
+        .first()
+    )
+    payment = (
+        db.query(Payment)
+        .filter(Payment.student_id == student_id, Payment.status == "pending")
+        .order_by(Payment.id.desc())
+        .first()
+    )
+    status_dates = get_status_dates_map(db, [student_id])[student_id]
+    db.merge(StudentSummary(**_summary_row(student, group, cycle, payment, status_dates)))
+    db.flush()
+
+
+def apply_cycle_count_delta(db: Session, cycle_id: int, delta: int) -> None:
+    """출석 변경분만큼 읽기 모델의 current_count를 증감."""
+    mark_students_changed(db)
+    db.execute(
+        update(StudentSummary)
+        .where(StudentSummary.current_cycle_id == cycle_id)
+        .values(current_count=StudentSummary.current_count + delta)
+    )
+
+
+def set_cycle_count(db: Session, cycle_id: int, count: int) -> None:
+    mark_students_changed(db)
+    db.execute(
+        update(StudentSummary)
+        .where(StudentSummary.current_cycle_id == cycle_id)
+        .values(current_count=count)
+    )
+
+
+def refresh_class_group(db: Session, group: ClassGroup) -> None:
+    """수업반 이름/시작 시간 변경을 소속 학생 행에 반영."""
+    mark_students_changed(db)
+    db.execute(
+        update(StudentSummary)
+        .where(StudentSummary.class_group_id == group.id)
+        .values(class_group_name=group.name, start_time=group.start_time)
+    )
+
+
+def _summary_rows(db: Session, student_ids: list[int] | None = None) -> list[dict]:
+    """학생들(None이면 전체)의 읽기 모델 행 계산. 학생 수와 무관하게 쿼리 수 고정."""
+    latest_cycle = select(
+        Cycle.id,
+        func.row_number().over(partition_by=Cycle.student_id, order_by=Cycle.cycle_number.desc()).label("rn"),
+    )
+    latest_pending = select(func.max(Payment.id)).where(Payment.status == "pending")
+    student_stmt = select(Student)
+    if student_ids is not None:
+        latest_cycle = latest_cycle.where(Cycle.student_id.in_(student_ids))
+        latest_pending = latest_pending.where(Payment.student_id.in_(student_ids))
+        student_stmt = student_stmt.where(Student.id.in_(student_ids))
+    latest_cycle = latest_cycle.subquery()
+
+    cycles = {
+        c.student_id: c
+        for c in db.execute(
+            select(Cycle).join(latest_cycle, latest_cycle.c.id == Cycle.id).where(latest_cycle.c.rn == 1)
+        ).scalars()
+    }
+    payments = {
+        p.student_id: p
+        for p in db.execute(
+            select(Payment).where(Payment.id.in_(latest_pending.group_by(Payment.student_id)))
+        ).scalars()
+    }
+    groups = {g.id: g for g in db.execute(select(ClassGroup)).scalars()}
+    students = db.execute(student_stmt).scalars().all()
+    ids = [s.id for s in students]
+    status_dates = build_status_dates_map(ids, db.execute(status_dates_select(student_ids)).all())
+
+    return [
+        _summary_row(s, groups.get(s.class_group_id), cycles.get(s.id), payments.get(s.id), status_dates[s.id])
+        for s in students
+    ]
+
+
+def rebuild_read_model(db: Session) -> int:
+    """읽기 모델 전체 재생성. 학생 수와 무관하게 쿼리 수 고정, 생성한 행 수 반환."""
+    mark_students_changed(db)
+    rows = _summary_rows(db)
+    db.execute(delete(StudentSummary))
+    if rows:
+        db.execute(insert(StudentSummary), rows)
+    db.flush()
+    return len(rows)
+
+
+def refresh_student_summaries(db: Session, student_ids: list[int]) -> None:
+    """여러 학생의 읽기 모델 행을 한 번에 다시 계산 (일괄 등록/일괄 사이클 시작용)."""
+    if not student_ids:
+        return
+    mark_students_changed(db)
+    db.flush()
+    rows = _summary_rows(db, student_ids)
+    db.execute(delete(StudentSummary).where(StudentSummary.student_id.in_(student_ids)))
+    if rows:
+        db.execute(insert(StudentSummary), rows)
+    db.flush()
+
+
+def ensure_read_model(db: Session) -> None:
+    """읽기 모델이 비어 있는데 학생이 있으면 (기존 DB 최초 기동) 전체 생성."""
+    if db.query(StudentSummary).first() is None and db.query(Student).first() is not None:
+        rebuild_read_model(db)
+        db.commit()
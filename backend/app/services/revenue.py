@@ -0,0 +1,157 @@
+"""수업료 수납/미수 요약: 월별 납부·미납 합계, 납부 방법별, 학년별(GRADE_CONFIG), 수업반별.
+
+- 월별 집계(payment_monthly)는 같은 트랜잭션에서 update_payment_rollup으로 증감한다
+  - 청구 생성(_create_next_payment): 청구월 미납 +1
+  - 납부 확인(confirm_payment): 청구월 미납 -1, 납부월 납부(방법별) +1
+  - 학생 학년/수업반 변경(move_student_payments): 그 학생의 수업료를 새 학년/수업반으로 옮김
+- 조회는 집계 테이블만 읽는다 (payments 전체를 훑지 않고 쿼리 1회)
+- rebuild_payment_rollup: 전체 재생성 (최초 도입, 정합성 복구)
+"""
+from typing import Iterable
+
+from sqlalchemy import case, delete, func, insert, literal_column, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.constants import GRADE_CONFIG
+from app.models.class_group import ClassGroup
+from app.models.payment import Payment
+from app.models.payment_monthly import PaymentMonthly
+from app.models.student import Student
+from app.services.rollup import add_to_rollup, month_expr, month_key
+
+KEY_COLUMNS = ["month", "status", "payment_method", "grade", "class_group_id"]
+
+# (월, 상태, 납부 방법, 학년, 수업반 id, 금액)
+PaymentEntry = tuple[str, str, str, str, int, int]
+
+
+def payment_entry(payment: Payment, grade: str, class_group_id: int) -> PaymentEntry:
+    """수업료 1건이 집계에 들어가는 키 + 금액. 납부 완료는 납부월, 미납은 청구월."""
+    when = (payment.paid_at or payment.created_at) if payment.status == "paid" else payment.created_at
+    return (
+        month_key(when), payment.status, payment.payment_method or "", grade, class_group_id, payment.amount,
+    )
+
+
+def update_payment_rollup(
+    db: Session, added: Iterable[PaymentEntry] = (), removed: Iterable[PaymentEntry] = ()
+) -> None:
+    """추가/제거된 수업료만큼 월별 집계를 증감 (키별 upsert 1회)."""
+    delta: dict[tuple, list[int]] = {}
+    for sign, entries in ((1, added), (-1, removed)):
+        for *key, amount in entries:
+            totals = delta.setdefault(tuple(key), [0, 0])
+            totals[0] += sign
+            totals[1] += sign * amount
+    rows = [
+        {**dict(zip(KEY_COLUMNS, key)), "count": count, "amount": amount}
+        for key, (count, amount) in delta.items()
+        if count or amount
+    ]
+    add_to_rollup(db, PaymentMonthly, KEY_COLUMNS, rows)
+
+
+def move_student_payments(
+    db: Session, student_id: int, old: tuple[str, int], new: tuple[str, int]
+) -> None:
+    """학생의 (학년, 수업반)이 바뀌면 그 학생의 수업료 집계를 새 학년/수업반으로 옮긴다."""
+    if old == new:
+        return
+    payments = db.execute(select(Payment).where(Payment.student_id == student_id)).scalars().all()
+    update_payment_rollup(
+        db,
+        added=[payment_entry(p, *new) for p in payments],
+        removed=[payment_entry(p, *old) for p in payments],
+    )
+
+
+def rebuild_payment_rollup(db: Session) -> int:
+    """수업료 전체를 GROUP BY 1회로 다시 집계하고, 만든 집계 행 수를 반환한다."""
+    when = case(
+        (Payment.status == literal_column("'paid'"), func.coalesce(Payment.paid_at, Payment.created_at)),
+        else_=Payment.created_at,
+    )
+    month = month_expr(db, when)
+    method = func.coalesce(Payment.payment_method, literal_column("''"))
+    db.execute(delete(PaymentMonthly))
+    db.execute(insert(PaymentMonthly).from_select(
+        [*KEY_COLUMNS, "count", "amount"],
+        select(month, Payment.status, method, Student.grade, Student.class_group_id, func.count(), func.sum(Payment.amount))
+        .join(Student, Student.id == Payment.student_id)
+        .group_by(month, Payment.status, method, Student.grade, Student.class_group_id),
+    ))
+    db.flush()
+    return db.execute(select(func.count()).select_from(PaymentMonthly)).scalar()
+
+
+def ensure_payment_rollup(db: Session) -> None:
+    """집계가 비어 있는데 수업료가 있으면 (기존 DB 최초 기동) 전체 생성."""
+    if db.query(PaymentMonthly).first() is None and db.query(Payment).first() is not None:
+        rebuild_payment_rollup(db)
+        db.commit()
+
+
+def _amounts() -> dict:
+    return {"paid_count": 0, "paid_amount": 0, "pending_count": 0, "pending_amount": 0}
+
+
+def _period(month: str | None) -> dict:
+    return {"month": month, **_amounts(), "by_method": {}, "by_grade": {}, "by_class_group": {}}
+
+
+def _add(period: dict, row: dict, class_group_name: str | None) -> None:
+    prefix = "paid" if row["status"] == "paid" else "pending"
+    grade = period["by_grade"].get(row["grade"])
+    if grade is None:
+        label = GRADE_CONFIG.get(row["grade"], {}).get("label", row["grade"])
+        grade = period["by_grade"][row["grade"]] = {"grade": row["grade"], "label": label, **_amounts()}
+    group = period["by_class_group"].get(row["class_group_id"])
+    if group is None:
+        group = period["by_class_group"][row["class_group_id"]] = {
+            "class_group_id": row["class_group_id"], "class_group_name": class_group_name, **_amounts(),
+        }
+    for bucket in (period, grade, group):
+        bucket[f"{prefix}_count"] += row["count"]
+        bucket[f"{prefix}_amount"] += row["amount"]
+    if row["status"] == "paid":
+        method = row["payment_method"] or "unknown"
+        period["by_method"][method] = period["by_method"].get(method, 0) + row["amount"]
+
+
+def _finish(period: dict) -> dict:
+    grade_order = {grade: i for i, grade in enumerate(GRADE_CONFIG)}
+    period["by_grade"] = sorted(period["by_grade"].values(), key=lambda g: grade_order.get(g["grade"], len(grade_order)))
+    period["by_class_group"] = sorted(period["by_class_group"].values(), key=lambda g: g["class_group_id"])
+    return period
+
+
+async def get_revenue_summary(
+    db: AsyncSession, month_from: str, month_to: str, class_group_id: int | None = None
+) -> dict:
+    """기간 합계 + 월별 수납/미수 요약 (집계 테이블 쿼리 1회)."""
+    # ORM 객체 대신 컬럼 행으로 읽는다 (집계 행 수천 개의 identity map 비용 제거)
+    stmt = (
+        select(*(getattr(PaymentMonthly, name) for name in [*KEY_COLUMNS, "count", "amount"]), ClassGroup.name)
+        .outerjoin(ClassGroup, ClassGroup.id == PaymentMonthly.class_group_id)
+        .where(PaymentMonthly.month >= month_from, PaymentMonthly.month <= month_to)
+        .order_by(PaymentMonthly.month)
+    )
+    if class_group_id:
+        stmt = stmt.where(PaymentMonthly.class_group_id == class_group_id)
+
+    total = _period(None)
+    months: dict[str, dict] = {}
+    for *row, class_group_name in (await db.execute(stmt)).all():
+        row = dict(zip([*KEY_COLUMNS, "count", "amount"], row))
+        if not row["count"] and not row["amount"]:
+            continue
+        month = months.setdefault(row["month"], _period(row["month"]))
+        _add(month, row, class_group_name)
+        _add(total, row, class_group_name)
+    return {
+        "month_from": month_from,
+        "month_to": month_to,
+        "total": _finish(total),
+        "months": [_finish(month) for month in months.values()],
+    }
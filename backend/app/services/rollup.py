@@ -0,0 +1,39 @@
+"""월별 집계 테이블 공용 도구 (출석 통계, 수업료 수납/미수 요약).
+
+- month_key / month_expr: 월 키 "YYYY-MM" (파이썬 값 / SQL 식)
+- add_to_rollup: 키별 증감분을 upsert 1회로 반영 (SQLite / PostgreSQL)
+"""
+from datetime import date
+from typing import Sequence
+
+from sqlalchemy import func, literal_column
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+# 월 쿼리 파라미터 형식 ("2026-03")
+MONTH_PATTERN = r"^\d{4}-(0[1-9]|1[0-2])$"
+
+
+def month_key(d: date) -> str:
+    return f"{d.year:04d}-{d.month:02d}"
+
+
+def month_expr(db: Session, column):
+    """날짜/일시 컬럼 → "YYYY-MM" SQL 식. (GROUP BY에 같은 식을 쓰도록 바인드 파라미터 없이)"""
+    if db.get_bind().dialect.name == "postgresql":
+        return func.to_char(column, literal_column("'YYYY-MM'"))
+    return func.strftime(literal_column("'%Y-%m'"), column)
+
+
+def add_to_rollup(db: Session, model, key_columns: Sequence[str], rows: list[dict]) -> None:
+    """rows의 키 컬럼이 같은 행이 있으면 나머지(값) 컬럼을 더하고, 없으면 새로 넣는다."""
+    if not rows:
+        return
+    dialect = postgresql if db.get_bind().dialect.name == "postgresql" else sqlite
+    stmt = dialect.insert(model)
+    value_columns = [name for name in rows[0] if name not in key_columns]
+    stmt = stmt.on_conflict_do_update(
+        index_elements=list(key_columns),
+        set_={name: getattr(model, name) + stmt.excluded[name] for name in value_columns},
+    )
+    db.execute(stmt, rows)
@@ -0,0 +1,75 @@
+"""수업 요일 기반 날짜 계산기.
+
+하루씩 걸으며 요일을 비교하는 대신, 수업반 요일을 7비트 마스크로 바꾸고
+(마스크, 시작 요일)별 오프셋 표를 미리 계산해 N번째 수업일을 산술로 구한다.
+
+    N번째(0부터) 수업일 = 시작일 + 7 * (N // 주당 수업수) + offsets[N % 주당 수업수]
+"""
+from datetime import date, timedelta
+from functools import lru_cache
+
+# Python weekday() → 요일 문자열 매핑
+WEEKDAY_MAP = {0: "mon", 1: "tue", 2: "wed", 3: "thu", 4: "fri", 5: "sat", 6: "sun"}
+WEEKDAY_INDEX = {name: i for i, name in WEEKDAY_MAP.items()}
+
+
+def weekday_mask(days_of_week: list[str]) -> int:
+    """["mon", "wed"] → 0b0000101 (bit i = weekday() i)."""
+    mask = 0
+    for name in days_of_week:
+        if name in WEEKDAY_INDEX:
+            mask |= 1 << WEEKDAY_INDEX[name]
+    return mask
+
+
+@lru_cache(maxsize=None)
+def _forward_offsets(mask: int, start_weekday: int) -> tuple[int, ...]:
+    """시작 요일 기준 한 주 안의 수업일 오프셋 (0~6, 오름차순)."""
+    return tuple(
+        offset for offset in range(7)
+        if mask & (1 << ((start_weekday + offset) % 7))
+    )
+
+
+@lru_cache(maxsize=None)
+def _backward_offset(mask: int, weekday: int) -> int | None:
+    """해당 요일 기준 가장 가까운 과거/당일 수업일까지의 일수."""
+    for offset in range(7):
+        if mask & (1 << ((weekday - offset) % 7)):
+            return offset
+    return None
+
+
+def class_dates(start_date: date, mask: int, count: int) -> list[date]:
+    """start_date(포함) 이후 수업일 count개를 반환한다. 수업 요일이 없으면 []."""
+    offsets = _forward_offsets(mask, start_date.weekday())
+    per_week = len(offsets)
+    if not per_week:
+        return []
+    base = start_date.toordinal()
+    return [
+        date.fromordinal(base + 7 * (n // per_week) + offsets[n % per_week])
+        for n in range(count)
+    ]
+
+
+def next_class_dates(after_date: date, mask: int, count: int = 1) -> list[date]:
+    """after_date 다음 날부터 수업일 count개를 반환한다."""
+    return class_dates(after_date + timedelta(days=1), mask, count)
+
+
+def latest_class_date(on_or_before: date, mask: int) -> date | None:
+    """on_or_before(포함) 이전 가장 최근 수업일. 수업 요일이 없으면 None."""
+    offset = _backward_offset(mask, on_or_before.weekday())
+    if offset is None:
+        return None
+    return on_or_before - timedelta(days=offset)
+
+
+def bulk_class_dates(requests: list[tuple[date, int]], count: int) -> list[list[date]]:
+    """(시작일, 마스크) 목록의 스케줄을 한 번에 계산한다 (학기 전체 재생성 등).
+
+    같은 (마스크, 시작 요일) 조합은 오프셋 표를 공유하므로
+    수천 건이어도 표 계산은 최대 128 × 7회로 끝난다.
+    """
+    return [class_dates(start_date, mask, count) for start_date, mask in requests]
@@ -0,0 +1,183 @@
+"""동기 vs 비동기 조회 API 부하 테스트.
+
+임시 DB(또는 --database-url)에 학생/출석/수업료 데이터를 만든 뒤,
+같은 쿼리를 쓰는 두 경로를 동시 요청 C개로 호출해 처리량을 비교한다.
+
+- async: 실제 라우터의 async 엔드포인트 (get_async_db)
+- sync : 같은 select 문을 동기 Session으로 실행하는 def 엔드포인트 (스레드풀)
+
+사용법 (backend/ 에서):
+    python -m benchmarks.bench_async_load [--requests 400] [--concurrency 50]
+    python -m benchmarks.bench_async_load --database-url postgresql+psycopg://.../bench
+"""
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+import httpx
+from fastapi import Depends, FastAPI
+from sqlalchemy import create_engine, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, joinedload, selectinload, sessionmaker
+
+from app.database import Base, async_url, get_async_db
+from app.main import app as real_app
+from app.models.attendance import Attendance
+from app.models.class_group import ClassGroup
+from app.models.cycle import Cycle
+from app.models.payment import Payment
+from app.models.student import Student
+from app.routers import attendance, payments, students
+from app.services.enrollment_service import get_status_dates_map
+
+DAY = date(2026, 3, 2)
+ENDPOINTS = [
+    f"/api/attendance/daily/{DAY.isoformat()}",
+    "/api/students",
+    "/api/payments",
+    "/api/cycles/alerts",
+]
+
+
+def _seed(db: Session, n_students: int) -> None:
+    groups = [
+        ClassGroup(name=f"반{i}", days_of_week='["mon", "wed"]', start_time=f"{14 + i}:00", default_duration_minutes=90)
+        for i in range(5)
+    ]
+    db.add_all(groups)
+    db.flush()
+    for i in range(n_students):
+        student = Student(
+            name=f"학생{i:04d}", phone="010-0000-0000", school="테스트초", grade="elementary",
+            parent_phone="010-1111-1111", class_group_id=groups[i % 5].id, enrollment_status="active",
+        )
+        db.add(student)
+        db.flush()
+        done = Cycle(student_id=student.id, cycle_number=1, current_count=8, status="completed",
+                     started_at=DAY - timedelta(days=28), completed_at=DAY - timedelta(days=1))
+        current = Cycle(student_id=student.id, cycle_number=2, current_count=8, started_at=DAY)
+        db.add_all([done, current])
+        db.flush()
+        db.add(Payment(student_id=student.id, cycle_id=done.id, amount=240000, created_at=datetime(2026, 3, 1)))
+        db.add_all([
+            Attendance(student_id=student.id, cycle_id=current.id, date=DAY + timedelta(days=7 * w + d), status="present")
+            for w in range(4) for d in (0, 2)
+        ])
+    db.commit()
+
+
+def _sync_app(session_factory) -> FastAPI:
+    """실제 라우터와 같은 select 문을 동기 세션으로 실행하는 비교용 앱."""
+    app = FastAPI()
+
+    def get_sync_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    @app.get("/api/attendance/daily/{day}")
+    def daily(day: date, db: Session = Depends(get_sync_db)):
+        rows = db.execute(attendance._board_select().where(Attendance.date == day)).all()
+        return [attendance._row_to_response(*row) for row in rows]
+
+    @app.get("/api/students")
+    def student_list(db: Session = Depends(get_sync_db)):
+        stmt = select(Student).options(joinedload(Student.class_group), selectinload(Student.cycles))
+        items = db.execute(stmt.where(Student.enrollment_status != "stopped").order_by(Student.name)).scalars().all()
+        dates = get_status_dates_map(db, [s.id for s in items])
+        return [students._to_response(s, db, dates[s.id]) for s in items]
+
+    @app.get("/api/payments")
+    def payment_list(db: Session = Depends(get_sync_db)):
+        rows = db.execute(payments._payment_select().order_by(Payment.created_at.desc())).all()
+        return [payments._row_to_response(*row) for row in rows]
+
+    @app.get("/api/cycles/alerts")
+    def alerts(db: Session = Depends(get_sync_db)):
+        stmt = (
+            select(Cycle, Student, ClassGroup)
+            .join(Student, Student.id == Cycle.student_id)
+            .outerjoin(ClassGroup, ClassGroup.id == Student.class_group_id)
+            .where(Cycle.status == "completed", Student.enrollment_status == "active")
+            .order_by(Cycle.completed_at.desc())
+        )
+        return [
+            {"cycle_id": c.id, "student_id": s.id, "student_name": s.name, "class_group_name": g.name if g else ""}
+            for c, s, g in db.execute(stmt).all()
+        ]
+
+    return app
+
+
+async def _load(app, n_requests: int, concurrency: int) -> list[float]:
+    """엔드포인트를 돌아가며 n_requests회 호출, 요청별 지연(초) 목록 반환."""
+    latencies: list[float] = []
+    semaphore = asyncio.Semaphore(concurrency)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def one(i: int):
+            async with semaphore:
+                started = time.perf_counter()
+                res = await client.get(ENDPOINTS[i % len(ENDPOINTS)])
+                res.raise_for_status()
+                latencies.append(time.perf_counter() - started)
+
+        await asyncio.gather(*(one(i) for i in range(n_requests)))
+    return latencies
+
+
+def _report(label: str, latencies: list[float], elapsed: float) -> None:
+    ordered = sorted(latencies)
+    p95 = ordered[int(len(ordered) * 0.95) - 1]
+    print(
+        f"  {label:<5}: {len(latencies) / elapsed:8.1f} req/s  "
+        f"p50 {statistics.median(ordered) * 1000:7.1f} ms  p95 {p95 * 1000:7.1f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--database-url")
+    parser.add_argument("--students", type=int, default=300)
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        url = args.database_url or f"sqlite:///{Path(tmp) / 'bench.db'}"
+        sync_engine = create_engine(url)
+        Base.metadata.drop_all(sync_engine)
+        Base.metadata.create_all(sync_engine)
+        SyncSession = sessionmaker(bind=sync_engine, autoflush=False)
+        with SyncSession() as db:
+            _seed(db, args.students)
+
+        aengine = create_async_engine(async_url(url))
+        AsyncSession = async_sessionmaker(aengine, autoflush=False, expire_on_commit=False)
+
+        async def override_get_async_db():
+            async with AsyncSession() as session:
+                yield session
+
+        real_app.dependency_overrides[get_async_db] = override_get_async_db
+        sync_app = _sync_app(SyncSession)
+
+        print(f"학생 {args.students}명, 요청 {args.requests}회, 동시 {args.concurrency}")
+        for label, target in (("sync", sync_app), ("async", real_app)):
+            started = time.perf_counter()
+            latencies = asyncio.run(_load(target, args.requests, args.concurrency))
+            _report(label, latencies, time.perf_counter() - started)
+
+        real_app.dependency_overrides.clear()
+        asyncio.run(aengine.dispose())
+        sync_engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+"""API 엔드포인트 벤치마크: 합성 데이터(app.seed_synthetic) 위에서 지연 백분위 + SQL 문 수.
+
+임시 SQLite 파일(또는 --database-url의 빈 DB)에 지점 × 학생 × 연도 데이터를 만든 뒤,
+각 라우터의 엔드포인트를 --repeat회씩 순서대로 호출해 p50/p95/p99 지연과 요청당 SQL 문 수를 잰다.
+(SQL 문 수는 debug 모드의 X-DB-Query-Count 헤더 - app/profiling.py. 스트리밍 내보내기는
+ 본문을 응답 후에 만들어 헤더에 잡히지 않으므로 지연만 비교한다)
+
+회귀 검사:
+    python -m benchmarks.bench_endpoints --save baseline.json      # 기준 저장
+    python -m benchmarks.bench_endpoints --compare baseline.json   # SQL 문 수 증가 또는
+                                                                   # p95가 --tolerance배 초과 시 종료 코드 1
+
+사용법 (backend/ 에서):
+    python -m benchmarks.bench_endpoints [--branches 3] [--students 300] [--years 2] [--repeat 30]
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+# app.main 이전에 설정: 앱 lifespan이 기본 DB(math_academy.db)에 테이블 생성/시드/집계를 하지 않도록
+os.environ["TESTING"] = "1"
+
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import sessionmaker
+
+from app.cache import clear_all_caches
+from app.config import Settings, settings
+from app.database import Base, create_async_db_engine, create_db_engine, get_async_db, get_db
+from app.main import app
+from app.migrate import ensure_indexes
+from app.models.attendance import Attendance
+from app.models.class_group import ClassGroup
+from app.models.payment import Payment
+from app.models.student import Student
+from app.seed_synthetic import generate_synthetic_data
+
+END_DATE = date(2026, 10, 1)
+
+
+def _endpoints(db) -> list[tuple[str, str, dict | None]]:
+    """(메서드, URL, JSON 본문). 쓰기는 데이터를 바꾸지 않는(반복 가능한) 요청만."""
+    group_id = db.execute(select(ClassGroup.id).order_by(ClassGroup.id)).scalar()
+    student_id = db.execute(
+        select(Student.id).where(Student.enrollment_status == "active").order_by(Student.id)
+    ).scalar()
+    payment_id = db.execute(select(Payment.id).where(Payment.status == "pending").order_by(Payment.id)).scalar()
+    day = END_DATE - timedelta(days=(END_DATE.weekday() - 0) % 7)  # 가장 최근 월요일
+    att_id = db.execute(select(Attendance.id).where(Attendance.date == day).order_by(Attendance.id)).scalar()
+    month_ago = (END_DATE - timedelta(days=30)).isoformat()
+    year_ago = f"{END_DATE.year - 1:04d}-{END_DATE.month:02d}"
+
+    return [
+        ("GET", "/api/health", None),
+        ("GET", "/api/grades", None),
+        ("GET", "/api/class-groups", None),
+        ("GET", f"/api/class-groups/{group_id}", None),
+        ("GET", "/api/students", None),
+        ("GET", f"/api/students?class_group_id={group_id}", None),
+        ("GET", "/api/students?enrollment_status=all", None),
+        ("GET", "/api/students?enrollment_status=all&format=columnar", None),
+        ("GET", f"/api/students/{student_id}", None),
+        ("GET", f"/api/students/{student_id}/history", None),
+        ("GET", f"/api/attendance/daily/{day.isoformat()}", None),
+        ("GET", f"/api/attendance/daily/{day.isoformat()}?format=columnar", None),
+        ("GET", f"/api/attendance/calendar?from={month_ago}&to={END_DATE.isoformat()}", None),
+        ("GET", f"/api/attendance/calendar?from={month_ago}&to={END_DATE.isoformat()}&class_group_id={group_id}", None),
+        ("GET", f"/api/attendance/stats?month_from={year_ago}&group_by=month&group_by=class_group", None),
+        ("GET", f"/api/attendance/stats?month_from={year_ago}&group_by=student", None),
+        ("GET", "/api/cycles/alerts", None),
+        ("GET", "/api/payments", None),
+        ("GET", "/api/payments?status=pending", None),
+        ("GET", "/api/payments?limit=500", None),
+        ("GET", "/api/payments?limit=500&format=columnar", None),
+        ("GET", f"/api/payments?class_group_id={group_id}&date_from={month_ago}", None),
+        ("GET", f"/api/payments/summary?month_from={year_ago}", None),
+        ("GET", f"/api/payments/{payment_id}", None),
+        ("GET", "/api/dashboard/students", None),
+        ("GET", "/api/dashboard/stats", None),
+        ("GET", "/api/message-templates/payment_notice", None),
+        ("GET", f"/api/exports/attendance?date_from={month_ago}", None),
+        ("GET", f"/api/exports/payments?date_from={month_ago}&format=ndjson", None),
+        ("PUT", f"/api/attendance/{att_id}", {"status": "present", "counts_toward_cycle": True}),
+        ("POST", f"/api/payments/{payment_id}/message", None),
+    ]
+
+
+def _percentile(ordered: list[float], pct: float) -> float:
+    return ordered[min(len(ordered) - 1, max(0, round(len(ordered) * pct) - 1))]
+
+
+def run(client: TestClient, endpoints, repeat: int) -> dict[str, dict]:
+    results = {}
+    for method, url, body in endpoints:
+        latencies, queries = [], []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            res = client.request(method, url, json=body)
+            latencies.append((time.perf_counter() - started) * 1000)
+            res.raise_for_status()
+            queries.append(None if url.startswith("/api/exports/") else int(res.headers["X-DB-Query-Count"]))
+        ordered = sorted(latencies)
+        results[f"{method} {url}"] = {
+            "p50_ms": round(statistics.median(ordered), 2),
+            "p95_ms": round(_percentile(ordered, 0.95), 2),
+            "p99_ms": round(_percentile(ordered, 0.99), 2),
+            # 첫 호출은 캐시가 비어 있으므로 최대값 = 캐시 미스 시 SQL 문 수
+            "queries": None if None in queries else max(queries),
+        }
+    return results
+
+
+def compare(results: dict[str, dict], baseline: dict[str, dict], tolerance: float) -> list[str]:
+    """기준 대비 회귀 목록 (SQL 문 수 증가, p95 tolerance배 초과)."""
+    regressions = []
+    for name, current in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        if current["queries"] is not None and base["queries"] is not None and current["queries"] > base["queries"]:
+            regressions.append(f"{name}: SQL {base['queries']} → {current['queries']}")
+        if current["p95_ms"] > base["p95_ms"] * tolerance:
+            regressions.append(f"{name}: p95 {base['p95_ms']} → {current['p95_ms']} ms")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--database-url", help="빈 DB (기본: 임시 SQLite 파일)")
+    parser.add_argument("--branches", type=int, default=3)
+    parser.add_argument("--students", type=int, default=300, help="지점당 학생 수")
+    parser.add_argument("--years", type=float, default=2)
+    parser.add_argument("--repeat", type=int, default=30)
+    parser.add_argument("--save", type=Path, help="결과를 JSON으로 저장 (기준)")
+    parser.add_argument("--compare", type=Path, help="기준 JSON과 비교")
+    parser.add_argument("--tolerance", type=float, default=1.5, help="p95 허용 배수")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        config = Settings(database_url=args.database_url or f"sqlite:///{Path(tmp) / 'bench.db'}")
+        engine = create_db_engine(config)
+        Base.metadata.create_all(engine)
+        ensure_indexes(engine)
+        SyncSession = sessionmaker(bind=engine, autoflush=False)
+        with SyncSession() as db:
+            started = time.perf_counter()
+            counts = generate_synthetic_data(db, args.branches, args.students, args.years, END_DATE)
+            db.commit()
+            print(f"데이터 생성 {time.perf_counter() - started:.1f}s: "
+                  + ", ".join(f"{table} {count:,}" for table, count in counts.items()))
+            endpoints = _endpoints(db)
+
+        async_engine = create_async_db_engine(config)
+        AsyncSession = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+        def override_get_db():
+            with SyncSession() as db:
+                yield db
+
+        async def override_get_async_db():
+            async with AsyncSession() as session:
+                yield session
+
+        app.dependency_overrides[get_db] = override_get_db
+        app.dependency_overrides[get_async_db] = override_get_async_db
+        settings.debug = True
+        clear_all_caches()  # 첫 호출이 항상 캐시 미스가 되도록
+        try:
+            with TestClient(app) as client:
+                results = run(client, endpoints, args.repeat)
+        finally:
+            app.dependency_overrides.clear()
+            engine.dispose()
+
+    print(f"\n{'엔드포인트':<70} {'p50':>8} {'p95':>8} {'p99':>8} {'SQL':>4}  (ms, {args.repeat}회)")
+    for name, r in results.items():
+        print(f"{name[:70]:<70} {r['p50_ms']:8.2f} {r['p95_ms']:8.2f} {r['p99_ms']:8.2f} {'-' if r['queries'] is None else r['queries']:>4}")
+
+    if args.save:
+        args.save.write_text(json.dumps(results, ensure_ascii=False, indent=2))
+    if args.compare:
+        regressions = compare(results, json.loads(args.compare.read_text()), args.tolerance)
+        if regressions:
+            print("\n회귀:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print("\n기준 대비 회귀 없음")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
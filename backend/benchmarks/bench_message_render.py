@@ -0,0 +1,83 @@
+"""안내 문자 렌더링 마이크로 벤치마크: 기존 f-string 조립 vs 컴파일된 템플릿.
+
+같은 (수업료, 학생, 사이클, 수업반) 행 N건에 대해 문자열을 만들고, 결과가 같은지 확인한다.
+템플릿 경로는 일괄 안내 API와 같이 템플릿을 한 번 꺼내 N번 render한다.
+
+사용법 (backend/ 에서):
+    python -m benchmarks.bench_message_render [건수]
+"""
+import random
+import sys
+import timeit
+from types import SimpleNamespace
+
+from app.constants import GRADE_CONFIG
+from app.services.message_template import (
+    DEFAULT_TEMPLATES,
+    PAYMENT_NOTICE,
+    compile_template,
+    payment_notice_values,
+)
+
+
+def legacy_message(payment, student, cycle) -> str:
+    """payments.generate_message의 기존 f-string 조립."""
+    grade_cfg = GRADE_CONFIG.get(student.grade, {}) if student else {}
+
+    student_name = student.name if student else "학생"
+    grade_label = grade_cfg.get("label", "")
+    cycle_number = cycle.cycle_number if cycle else 0
+    amount_str = f"{payment.amount:,}"
+
+    return (
+        f"안녕하세요, 수학공부방입니다.\n"
+        f"\n"
+        f"{student_name} 학생({grade_label})의\n"
+        f"{cycle_number}회차 수업(8회)이 완료되었습니다.\n"
+        f"\n"
+        f"수업료: {amount_str}원\n"
+        f"\n"
+        f"입금 확인 후 다음 회차 수업이 시작됩니다.\n"
+        f"감사합니다."
+    )
+
+
+def main(n: int = 10000) -> None:
+    rng = random.Random(0)
+    grades = list(GRADE_CONFIG)
+    rows = []
+    for i in range(n):
+        grade = rng.choice(grades)
+        rows.append((
+            SimpleNamespace(amount=GRADE_CONFIG[grade]["tuition"]),
+            SimpleNamespace(name=f"학생{i:05d}", grade=grade),
+            SimpleNamespace(cycle_number=rng.randint(1, 30), total_count=8),
+            SimpleNamespace(name=f"반{i % 12}"),
+        ))
+
+    template = compile_template(PAYMENT_NOTICE, DEFAULT_TEMPLATES[PAYMENT_NOTICE])
+    assert [legacy_message(p, s, c) for p, s, c, _ in rows] == [
+        template.render(payment_notice_values(*row)) for row in rows
+    ]
+
+    runs = 5
+    legacy = min(timeit.repeat(lambda: [legacy_message(p, s, c) for p, s, c, _ in rows], number=1, repeat=runs))
+    render = min(timeit.repeat(
+        lambda: [template.render(payment_notice_values(*row)) for row in rows], number=1, repeat=runs,
+    ))
+    compile_each = min(timeit.repeat(
+        lambda: [
+            compile_template(PAYMENT_NOTICE, DEFAULT_TEMPLATES[PAYMENT_NOTICE]).render(payment_notice_values(*row))
+            for row in rows
+        ],
+        number=1, repeat=runs,
+    ))
+
+    print(f"안내 문자 {n}건 (best of {runs})")
+    print(f"  기존 f-string       : {legacy * 1000:8.2f} ms")
+    print(f"  템플릿 (1회 컴파일) : {render * 1000:8.2f} ms  ({n / render:,.0f}건/초)")
+    print(f"  템플릿 (매번 컴파일): {compile_each * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
@@ -0,0 +1,51 @@
+"""수업일 계산 마이크로 벤치마크: 기존 하루 단위 탐색 vs 요일 마스크 산술 계산.
+
+사용법 (backend/ 에서):
+    python -m benchmarks.bench_schedule [스케줄 수]
+"""
+import random
+import sys
+import timeit
+from datetime import date, timedelta
+
+from app.services.schedule_calculator import WEEKDAY_MAP, bulk_class_dates, class_dates, weekday_mask
+
+
+def legacy_schedule(start_date: date, days_of_week: list[str], count: int = 8) -> list[date]:
+    """cycle_service.generate_schedule의 기존 날짜 탐색 루프."""
+    schedule_dates: list[date] = []
+    current = start_date
+    for _ in range(365):
+        day_name = WEEKDAY_MAP[current.weekday()]
+        if day_name in days_of_week:
+            schedule_dates.append(current)
+            if len(schedule_dates) >= count:
+                break
+        current += timedelta(days=1)
+    return schedule_dates
+
+
+def main(n: int = 5000) -> None:
+    rng = random.Random(0)
+    groups = [["mon", "wed"], ["tue", "thu"], ["mon", "wed", "fri"], ["sat"]]
+    jobs = [
+        (date(2026, 3, 2) + timedelta(days=rng.randrange(120)), rng.choice(groups))
+        for _ in range(n)
+    ]
+    masked = [(start, weekday_mask(days)) for start, days in jobs]
+
+    assert [legacy_schedule(s, d) for s, d in jobs] == bulk_class_dates(masked, 8)
+
+    runs = 5
+    legacy = min(timeit.repeat(lambda: [legacy_schedule(s, d) for s, d in jobs], number=1, repeat=runs))
+    single = min(timeit.repeat(lambda: [class_dates(s, m, 8) for s, m in masked], number=1, repeat=runs))
+    bulk = min(timeit.repeat(lambda: bulk_class_dates(masked, 8), number=1, repeat=runs))
+
+    print(f"스케줄 {n}건 × 8회차 (best of {runs})")
+    print(f"  기존 탐색 루프   : {legacy * 1000:8.2f} ms")
+    print(f"  class_dates     : {single * 1000:8.2f} ms  (x{legacy / single:.1f})")
+    print(f"  bulk_class_dates: {bulk * 1000:8.2f} ms  (x{legacy / bulk:.1f})")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
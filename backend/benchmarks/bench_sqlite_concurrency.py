@@ -0,0 +1,105 @@
+"""SQLite 프로필별 동시성 벤치마크: 출석 쓰기가 진행되는 동안의 읽기 처리량.
+
+임시 DB 파일에 출석 데이터를 만든 뒤, 쓰기 스레드 1개가 출석 상태를 계속 변경/커밋하고
+읽기 스레드 N개가 일별 출석부 쿼리를 반복한다. 프로필별 초당 읽기 수를 비교한다.
+
+사용법 (backend/ 에서):
+    python -m benchmarks.bench_sqlite_concurrency [초] [읽기 스레드 수]
+"""
+import sys
+import tempfile
+import threading
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+from sqlalchemy import create_engine, text
+
+from app.config import Settings
+from app.database import apply_sqlite_profile
+
+STUDENTS = 200
+DAYS = 60
+START = date(2026, 3, 2)
+
+DAILY_BOARD_SQL = text(
+    "SELECT a.id, a.status, s.name, c.current_count FROM attendance a "
+    "JOIN students s ON s.id = a.student_id JOIN cycles c ON c.id = a.cycle_id "
+    "WHERE a.date = :d"
+)
+
+
+def _prepare(path: Path) -> None:
+    """인덱스 포함 최소 스키마 + 출석 데이터 생성."""
+    engine = create_engine(f"sqlite:///{path}")
+    with engine.begin() as conn:
+        conn.exec_driver_sql("CREATE TABLE students (id INTEGER PRIMARY KEY, name TEXT)")
+        conn.exec_driver_sql("CREATE TABLE cycles (id INTEGER PRIMARY KEY, student_id INTEGER, current_count INTEGER)")
+        conn.exec_driver_sql(
+            "CREATE TABLE attendance (id INTEGER PRIMARY KEY, student_id INTEGER, cycle_id INTEGER, date DATE, status TEXT)"
+        )
+        conn.exec_driver_sql("CREATE INDEX ix_attendance_date ON attendance (date)")
+        conn.execute(text("INSERT INTO students VALUES (:id, :name)"),
+                     [{"id": i, "name": f"학생{i}"} for i in range(1, STUDENTS + 1)])
+        conn.execute(text("INSERT INTO cycles VALUES (:id, :id, 8)"), [{"id": i} for i in range(1, STUDENTS + 1)])
+        conn.execute(
+            text("INSERT INTO attendance (student_id, cycle_id, date, status) VALUES (:s, :s, :d, 'present')"),
+            [{"s": s, "d": START + timedelta(days=d)} for d in range(DAYS) for s in range(1, STUDENTS + 1)],
+        )
+    engine.dispose()
+
+
+def run(profile: str, seconds: float, readers: int) -> tuple[float, int, int]:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "bench.db"
+        _prepare(path)
+        engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False, "timeout": 30})
+        apply_sqlite_profile(engine, Settings(sqlite_profile=profile))
+
+        stop = threading.Event()
+        reads = [0] * readers
+        writes = [0]
+
+        def reader(idx: int):
+            with engine.connect() as conn:
+                n = 0
+                while not stop.is_set():
+                    conn.execute(DAILY_BOARD_SQL, {"d": START + timedelta(days=n % DAYS)}).fetchall()
+                    conn.rollback()
+                    n += 1
+                reads[idx] = n
+
+        def writer():
+            n = 0
+            with engine.connect() as conn:
+                while not stop.is_set():
+                    conn.execute(
+                        text("UPDATE attendance SET status = :st WHERE id = :id"),
+                        {"st": "late" if n % 2 else "present", "id": n % (STUDENTS * DAYS) + 1},
+                    )
+                    conn.commit()
+                    n += 1
+            writes[0] = n
+
+        threads = [threading.Thread(target=reader, args=(i,)) for i in range(readers)]
+        threads.append(threading.Thread(target=writer))
+        for t in threads:
+            t.start()
+        time.sleep(seconds)
+        stop.set()
+        for t in threads:
+            t.join()
+        engine.dispose()
+        return sum(reads) / seconds, sum(reads), writes[0]
+
+
+def main(seconds: float = 3.0, readers: int = 4) -> None:
+    print(f"읽기 스레드 {readers}개 + 쓰기 스레드 1개, {seconds:.0f}초")
+    for profile in ("default", "performance"):
+        rps, total_reads, total_writes = run(profile, seconds, readers)
+        print(f"  {profile:<12}: 읽기 {rps:8.1f}/s (총 {total_reads}), 쓰기 커밋 {total_writes}")
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    main(float(args[0]) if args else 3.0, int(args[1]) if len(args) > 1 else 4)
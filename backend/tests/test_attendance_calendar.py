@@ -0,0 +1,64 @@
+"""주간/월간 출석 달력 API 테스트."""
+
+
+def _calendar(client, **params):
+    return client.get("/api/attendance/calendar", params={"from": "2026-03-01", "to": "2026-03-31", **params})
+
+
+def _add_student(client, group_id, name):
+    student = client.post("/api/students", json={
+        "name": name, "phone": "010-0000-0001", "school": "서울초", "grade": "elementary",
+        "parent_phone": "010-0000-0002", "class_group_id": group_id, "enrollment_status": "active",
+    }).json()
+    client.post(f"/api/students/{student['id']}/start-cycle", json={"start_date": "2026-03-02"})
+    return student
+
+
+class TestAttendanceCalendar:
+    """날짜 → 수업반 구간 + 열 단위 출석."""
+
+    def test_month_view(self, client, seed_student):
+        """월수반 8회차 → 수업일 8일, 날짜별 구간 1개."""
+        res = _calendar(client)
+        assert res.status_code == 200
+        data = res.json()
+        assert [d["date"] for d in data["days"]][:3] == ["2026-03-02", "2026-03-04", "2026-03-09"]
+        assert len(data["days"]) == 8
+        assert data["days"][1]["blocks"] == [{"class_group_id": seed_student["class_group_id"], "start": 1, "count": 1}]
+        assert len(data["attendance"]["id"]) == 8
+        assert set(data["attendance"]["status"]) == {"present"}
+        assert data["students"] == {"id": [seed_student["id"]], "name": ["김테스트"]}
+        assert data["class_groups"]["start_time"] == ["14:30"]
+
+    def test_blocks_ordered_by_start_time(self, client, seed_student):
+        """같은 날 여러 수업반 → 시작 시간순 구간, 구간 안은 이름순."""
+        early = client.post("/api/class-groups", json={
+            "name": "오전반", "days_of_week": ["mon"], "start_time": "10:00", "default_duration_minutes": 90,
+        }).json()
+        _add_student(client, early["id"], "하학생")
+        _add_student(client, early["id"], "가학생")
+
+        data = _calendar(client, to="2026-03-02").json()
+        [day] = data["days"]
+        assert day["blocks"] == [
+            {"class_group_id": early["id"], "start": 0, "count": 2},
+            {"class_group_id": seed_student["class_group_id"], "start": 2, "count": 1},
+        ]
+        names = dict(zip(data["students"]["id"], data["students"]["name"]))
+        assert [names[sid] for sid in data["attendance"]["student_id"]] == ["가학생", "하학생", "김테스트"]
+
+    def test_class_group_filter(self, client, seed_student):
+        """수업반 필터."""
+        assert len(_calendar(client, class_group_id=seed_student["class_group_id"]).json()["days"]) == 8
+        assert _calendar(client, class_group_id=seed_student["class_group_id"] + 1).json()["days"] == []
+
+    def test_invalid_range(self, client):
+        """역순 / 최대 기간 초과 → 400."""
+        assert _calendar(client, to="2026-02-01").status_code == 400
+        assert _calendar(client, to="2026-06-30").status_code == 400
+
+    def test_single_query(self, client, seed_student, count_queries):
+        """기간/학생 수와 무관하게 쿼리 1회."""
+        with count_queries() as counter:
+            _calendar(client)
+        assert counter["count"] == 1
@@ -0,0 +1,120 @@
+"""출석 통계 API + 월별 출석 집계(attendance_monthly) 유지 테스트."""
+from datetime import date
+
+from app.models.attendance_monthly import AttendanceMonthly
+from app.services.attendance_stats import rebuild_attendance_rollup
+from app.services.rollup import month_key
+from app.services.schedule_calculator import class_dates, weekday_mask
+
+MARCH = {"month_from": "2026-03", "month_to": "2026-03"}
+
+
+def _rollup(db) -> dict:
+    db.expire_all()
+    return {
+        (r.month, r.student_id, r.status, r.excuse_reason): r.count
+        for r in db.query(AttendanceMonthly).all()
+        if r.count
+    }
+
+
+def _mark(client, group_id, day, **data):
+    att = client.get(f"/api/attendance/daily/{day}?class_group_id={group_id}").json()[0]
+    client.put(f"/api/attendance/{att['id']}", json=data)
+
+
+class TestAttendanceStats:
+    """월/학생/수업반별 출석률과 결석 사유."""
+
+    def test_monthly_rates_and_reasons(self, client, seed_student):
+        """지각 1 + 미차감 결석 1(스케줄 연장) → 9회 중 8회 출석."""
+        group_id = seed_student["class_group_id"]
+        _mark(client, group_id, "2026-03-04", status="late")
+        _mark(client, group_id, "2026-03-09", status="absent_excused",
+              counts_toward_cycle=False, excuse_reason="sick_leave")
+
+        res = client.get("/api/attendance/stats", params=MARCH)
+        assert res.status_code == 200
+        [row] = res.json()
+        assert row["month"] == "2026-03"
+        assert row["student_id"] is None
+        assert row["students"] == 1
+        assert row["total"] == 9  # 8회 + 연장 1회 (3/30)
+        assert (row["present"], row["late"], row["absent_excused"]) == (7, 1, 1)
+        assert row["attendance_rate"] == round(8 / 9, 4)
+        assert row["absence_reasons"] == {"sick_leave": 1}
+
+    def test_group_by_student_and_class_group(self, client, seed_student):
+        """group_by 조합 + 수업반 필터."""
+        group_id = seed_student["class_group_id"]
+        _mark(client, group_id, "2026-03-02", status="absent")
+
+        rows = client.get("/api/attendance/stats", params={
+            **MARCH, "group_by": ["class_group", "student"], "class_group_id": group_id,
+        }).json()
+        assert len(rows) == 1
+        assert rows[0]["month"] is None
+        assert rows[0]["student_name"] == "김테스트"
+        assert rows[0]["class_group_name"] == "테스트반"
+        assert rows[0]["absence_reasons"] == {"none": 1}
+
+        other = client.get("/api/attendance/stats", params={**MARCH, "class_group_id": group_id + 1}).json()
+        assert other == []
+
+    def test_current_month_counts_only_held_classes(self, client, seed_class_group):
+        """이번 달은 오늘까지의 수업만 (미리 만든 앞으로의 스케줄 제외)."""
+        today = date.today()
+        student = client.post("/api/students", json={
+            "name": "이번달", "phone": "010-0000-0001", "school": "서울초", "grade": "elementary",
+            "parent_phone": "010-0000-0002", "class_group_id": seed_class_group["id"], "enrollment_status": "active",
+        }).json()
+        client.post(f"/api/students/{student['id']}/start-cycle", json={"start_date": today.replace(day=1).isoformat()})
+
+        held = [d for d in class_dates(today.replace(day=1), weekday_mask(["mon", "wed"]), 8) if d <= today]
+        rows = client.get("/api/attendance/stats", params={"month_from": month_key(today)}).json()
+        assert [r["total"] for r in rows] == ([len(held)] if held else [])
+
+    def test_invalid_range(self, client):
+        """월 형식/순서 검증."""
+        assert client.get("/api/attendance/stats", params={"month_from": "2026-13"}).status_code == 422
+        assert client.get("/api/attendance/stats", params={
+            "month_from": "2026-05", "month_to": "2026-03",
+        }).status_code == 400
+
+    def test_query_count_independent_of_range(self, client, seed_student, count_queries):
+        """기간이 길어도 쿼리 2회."""
+        with count_queries() as counter:
+            client.get("/api/attendance/stats", params={
+                "month_from": "2020-01", "month_to": "2026-12", "group_by": ["student", "month"],
+            })
+        assert counter["count"] == 2
+
+
+class TestAttendanceRollup:
+    """출석 변경 시 증분 갱신 = 전체 재생성."""
+
+    def test_incremental_matches_rebuild(self, client, db, seed_student):
+        """단건/일괄 변경 + 스케줄 연장 후에도 재집계 결과와 같다."""
+        group_id = seed_student["class_group_id"]
+        _mark(client, group_id, "2026-03-04", status="absent", counts_toward_cycle=False, excuse_reason="school_event")
+        _mark(client, group_id, "2026-03-04", status="present")
+        client.post("/api/attendance/bulk", json={
+            "date": "2026-03-11",
+            "items": [{"student_id": seed_student["id"], "status": "early_leave"}],
+        })
+
+        incremental = _rollup(db)
+        assert incremental[("2026-03", seed_student["id"], "early_leave", "")] == 1
+        rebuild_attendance_rollup(db)
+        db.commit()
+        assert _rollup(db) == incremental
+
+    def test_memo_only_change_skips_rollup(self, client, seed_student, count_queries):
+        """상태/사유가 그대로면 집계 upsert 없음."""
+        group_id = seed_student["class_group_id"]
+        att = client.get(f"/api/attendance/daily/2026-03-02?class_group_id={group_id}").json()[0]
+        with count_queries() as counter:
+            client.put(f"/api/attendance/{att['id']}", json={"status": "present", "memo": "메모"})
+        with count_queries() as changed:
+            client.put(f"/api/attendance/{att['id']}", json={"status": "late", "memo": "메모"})
+        assert changed["count"] == counter["count"] + 1
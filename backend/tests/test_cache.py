@@ -0,0 +1,135 @@
+"""프로세스 내 캐시 테스트."""
+from sqlalchemy import text
+
+from app.cache import TTLCache, invalidate_on_commit
+from app.models.class_group import ClassGroup
+
+
+class TestTTLCache:
+    """TTL + LRU 동작과 히트/미스 카운터."""
+
+    def test_hit_and_miss_counters(self):
+        """조회 결과에 따라 히트/미스 집계."""
+        cache = TTLCache("test_counters", ttl_seconds=60)
+        assert cache.get("a") is None
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+        assert cache.stats() == {"size": 1, "hits": 1, "misses": 1, "version": 0}
+
+    def test_lru_eviction(self):
+        """maxsize 초과 시 가장 오래 안 쓴 키부터 제거."""
+        cache = TTLCache("test_lru", ttl_seconds=60, maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+
+    def test_zero_ttl_disables(self):
+        """ttl 0 → 저장하지 않음."""
+        cache = TTLCache("test_disabled", ttl_seconds=0)
+        cache.set("a", 1)
+        assert cache.get("a") is None
+
+
+    def test_get_or_set_skips_stale_value(self):
+        """값을 만드는 사이 무효화되면 그 (옛) 값은 캐시하지 않는다."""
+        cache = TTLCache("test_race", ttl_seconds=60)
+
+        def load_then_commit_elsewhere():
+            cache.invalidate()  # 다른 요청의 커밋
+            return "old"
+
+        assert cache.get_or_set("a", load_then_commit_elsewhere) == "old"
+        assert cache.get("a") is None
+        assert cache.get_or_set("a", lambda: "new") == "new"
+        assert cache.get("a") == "new"
+
+
+class TestInvalidateOnCommit:
+    """세션 커밋 시점 무효화."""
+
+    def test_commit_invalidates(self, db):
+        """커밋 후에 무효화."""
+        cache = TTLCache("test_commit", ttl_seconds=60)
+        cache.set("a", 1)
+        invalidate_on_commit(db, cache)
+        assert cache.get("a") == 1  # 커밋 전에는 유지
+        db.commit()
+        assert cache.get("a") is None
+
+    def test_rollback_keeps_cache(self, db):
+        """롤백된 변경은 캐시를 비우지 않음."""
+        cache = TTLCache("test_rollback", ttl_seconds=60)
+        cache.set("a", 1)
+        db.execute(text("SELECT 1"))  # 트랜잭션 시작 (실제 변경 API와 동일)
+        invalidate_on_commit(db, cache)
+        db.rollback()
+        db.commit()
+        assert cache.get("a") == 1
+
+
+class TestClassGroupCache:
+    """수업반 캐시: 조회는 캐시에서, 변경 API 커밋 시 무효화."""
+
+    def test_repeated_list_hits_cache(self, client, seed_class_group, count_queries):
+        """두 번째 목록 조회부터는 DB를 조회하지 않는다."""
+        client.get("/api/class-groups")
+        with count_queries() as counter:
+            res = client.get("/api/class-groups")
+            client.get(f"/api/class-groups/{seed_class_group['id']}")
+        assert res.json()[0]["days_of_week"] == ["mon", "wed"]
+        assert counter["count"] == 0
+        assert client.get("/api/cache/stats").json()["class_groups"]["hits"] >= 2
+
+    def test_update_invalidates(self, client, seed_class_group):
+        """수정 후 조회하면 바뀐 요일이 보이고 버전이 올라간다."""
+        client.get("/api/class-groups")
+        version = client.get("/api/cache/stats").json()["class_groups"]["version"]
+        client.put(f"/api/class-groups/{seed_class_group['id']}", json={
+            "name": "테스트반", "days_of_week": ["tue", "thu"],
+            "start_time": "14:30", "default_duration_minutes": 90,
+        })
+        assert client.get("/api/class-groups").json()[0]["days_of_week"] == ["tue", "thu"]
+        assert client.get("/api/cache/stats").json()["class_groups"]["version"] > version
+
+    def test_create_and_delete_invalidate(self, client, seed_class_group):
+        """생성/삭제가 목록에 바로 반영된다."""
+        client.get("/api/class-groups")
+        created = client.post("/api/class-groups", json={
+            "name": "새반", "days_of_week": ["fri"], "start_time": "16:00", "default_duration_minutes": 120,
+        }).json()
+        assert len(client.get("/api/class-groups").json()) == 2
+        client.delete(f"/api/class-groups/{created['id']}")
+        assert [g["id"] for g in client.get("/api/class-groups").json()] == [seed_class_group["id"]]
+        assert client.get(f"/api/class-groups/{created['id']}").status_code == 404
+
+    def test_unknown_id_does_not_reload_all(self, client, db, seed_class_group, count_queries):
+        """없는 id는 그 행만 조회하고 캐시는 그대로, 캐시 밖에서 추가된 수업반은 찾는다."""
+        client.get("/api/class-groups")
+        version = client.get("/api/cache/stats").json()["class_groups"]["version"]
+        with count_queries() as counter:
+            assert client.get(f"/api/class-groups/{seed_class_group['id'] + 100}").status_code == 404
+        assert counter["count"] == 1
+        assert client.get("/api/cache/stats").json()["class_groups"]["version"] == version
+
+        group = ClassGroup(name="CLI반", days_of_week='["fri"]', start_time="16:00", default_duration_minutes=120)
+        db.add(group)
+        db.commit()
+        assert client.get(f"/api/class-groups/{group.id}").json()["name"] == "CLI반"
+        assert len(client.get("/api/class-groups").json()) == 2
+
+    def test_start_cycle_uses_updated_days(self, client, seed_student):
+        """수업반 요일 변경 후 시작한 사이클은 새 요일로 스케줄된다."""
+        group_id = seed_student["class_group_id"]
+        client.put(f"/api/class-groups/{group_id}", json={
+            "name": "테스트반", "days_of_week": ["fri"], "start_time": "14:30", "default_duration_minutes": 90,
+        })
+        cycle_id = seed_student["current_cycle"]["id"]
+        client.post(f"/api/cycles/{cycle_id}/complete")
+        client.post(f"/api/students/{seed_student['id']}/start-cycle", json={"start_date": "2026-05-01"})
+        student = client.get(f"/api/students/{seed_student['id']}").json()
+        board = client.get("/api/attendance/daily/2026-05-08").json()
+        assert student["current_cycle"]["cycle_number"] == 2
+        assert any(row["student_id"] == seed_student["id"] for row in board)
@@ -0,0 +1,86 @@
+"""큰 목록 API의 열 단위(columnar) JSON 형식 테스트."""
+from datetime import datetime
+
+from app.columnar import COLUMNAR_MEDIA_TYPE
+from app.models.payment import Payment
+
+
+def _decode(body: dict) -> list[dict]:
+    """열 단위 응답 → 행 객체 목록 (사전 인코딩 해제, 중첩 열은 다시 객체로)."""
+    columns = {
+        name: [None if v is None else body["dictionaries"][name][v] for v in values]
+        if name in body["dictionaries"] else values
+        for name, values in body["columns"].items()
+    }
+    rows = []
+    for i in range(body["count"]):
+        row: dict = {}
+        for name, values in columns.items():
+            field, _, sub = name.partition(".")
+            if sub:
+                row.setdefault(field, {})[sub] = values[i]
+            else:
+                row[field] = values[i]
+        rows.append(row)
+    return rows
+
+
+def _same_nested_nulls(rows: list[dict]) -> list[dict]:
+    """JSON 형식의 null 중첩 객체는 열 단위에서 모든 하위 열이 None."""
+    for row in rows:
+        for key, value in row.items():
+            if isinstance(value, dict) and all(v is None for v in value.values()):
+                row[key] = None
+    return rows
+
+
+class TestColumnarFormat:
+    """format=columnar / Accept 헤더 → 같은 데이터를 열 단위로."""
+
+    def test_attendance_matches_json(self, client, seed_student):
+        """일일 출석부: 디코딩하면 JSON 형식과 같고, 반복 문자열은 사전 인코딩."""
+        path = "/api/attendance/daily/2026-03-02"
+        res = client.get(f"{path}?format=columnar")
+        assert res.headers["content-type"] == COLUMNAR_MEDIA_TYPE
+        body = res.json()
+        assert _decode(body) == client.get(path).json()
+        assert body["dictionaries"]["student_name"] == ["김테스트"]
+        assert body["columns"]["student_name"] == [0]
+
+    def test_students_via_accept_header(self, client, seed_student):
+        """학생 목록: Accept 헤더로도 선택, 현재 사이클은 current_cycle.* 열."""
+        res = client.get("/api/students", headers={"Accept": COLUMNAR_MEDIA_TYPE})
+        body = res.json()
+        assert body["columns"]["current_cycle.id"] == [seed_student["current_cycle"]["id"]]
+        assert _same_nested_nulls(_decode(body)) == client.get("/api/students").json()
+
+    def test_payments_keep_cursor(self, client, db, seed_student):
+        """수업료 목록: 디코딩 결과 같고 다음 페이지 커서 헤더 유지."""
+        for day, method in ((2, "cash"), (3, None), (4, "cash")):
+            db.add(Payment(
+                student_id=seed_student["id"], cycle_id=seed_student["current_cycle"]["id"], amount=240000,
+                status="paid" if method else "pending", payment_method=method, created_at=datetime(2026, 3, day),
+            ))
+        db.commit()
+        res = client.get("/api/payments?limit=1&format=columnar")
+        assert res.headers["x-next-cursor"] == client.get("/api/payments?limit=1").headers["x-next-cursor"]
+        body = client.get("/api/payments?format=columnar").json()
+        assert body["dictionaries"]["payment_method"] == ["cash"]
+        assert body["columns"]["payment_method"] == [0, None, 0]
+        assert _decode(body) == client.get("/api/payments").json()
+
+    def test_empty_and_invalid_format(self, client):
+        """빈 목록은 빈 열, 알 수 없는 format은 422."""
+        body = client.get("/api/payments?format=columnar").json()
+        assert body["count"] == 0
+        assert body["columns"]["id"] == []
+        assert client.get("/api/payments?format=xml").status_code == 422
+
+    def test_etag_per_representation(self, client, seed_student):
+        """같은 URL이라도 JSON과 열 단위 형식의 ETag는 다르다."""
+        json_etag = client.get("/api/students").headers["etag"]
+        res = client.get("/api/students", headers={"Accept": COLUMNAR_MEDIA_TYPE, "If-None-Match": json_etag})
+        assert res.status_code == 200
+        assert res.headers["vary"] == "Accept"
+        again = client.get("/api/students", headers={"Accept": COLUMNAR_MEDIA_TYPE, "If-None-Match": res.headers["etag"]})
+        assert again.status_code == 304
@@ -5,6 +5,16 @@
 3. 사이클 완료 → Payment 자동 생성
 4. 수업등록 상태 변경 + 이력
 """
+from datetime import date
+
+from sqlalchemy import event
+
+from app.models.attendance import Attendance
+from app.models.cycle import Cycle
+from app.models.student_summary import StudentSummary
+from app.services import alert_service
+from app.services.cycle_service import check_cycle_counts
+from tests.conftest import engine
 
 
 class TestScheduleGeneration:
@@ -47,6 +57,50 @@ class TestScheduleGeneration:
         assert cycle["status"] == "in_progress"
 
 
+class TestDailyBoard:
+    """일별 출석부 조회 (단일 JOIN 쿼리)."""
+
+    def _add_active_students(self, client, group_id, n):
+        for i in range(n):
+            student = client.post("/api/students", json={
+                "name": f"추가학생{i:02d}",
+                "phone": "010-0000-0000",
+                "school": "테스트초",
+                "grade": "elementary",
+                "parent_phone": "010-1111-1111",
+                "class_group_id": group_id,
+                "enrollment_status": "active",
+            }).json()
+            client.post(f"/api/students/{student['id']}/start-cycle", json={"start_date": "2026-03-02"})
+
+    def test_daily_board_single_query(self, client, seed_student, count_queries):
+        """학생 수와 무관하게 출석부 조회는 쿼리 1회."""
+        group_id = seed_student["class_group_id"]
+        self._add_active_students(client, group_id, 10)
+
+        with count_queries() as counter:
+            records = client.get(f"/api/attendance/daily/2026-03-02?class_group_id={group_id}").json()
+
+        assert len(records) == 11
+        assert counter["count"] == 1
+        row = [r for r in records if r["student_id"] == seed_student["id"]][0]
+        assert row["student_name"] == "김테스트"
+        assert row["class_group_name"] == "테스트반"
+        assert row["start_time"] == "14:30"
+        assert row["current_count"] == 8
+
+    def test_class_group_filter_excludes_inactive(self, client, seed_student):
+        """수업반 필터 시 수업중이 아닌 학생의 출석은 제외."""
+        group_id = seed_student["class_group_id"]
+        client.post(f"/api/students/{seed_student['id']}/status", json={"status": "stopped"})
+
+        filtered = client.get(f"/api/attendance/daily/2026-03-02?class_group_id={group_id}").json()
+        assert filtered == []
+
+        unfiltered = client.get("/api/attendance/daily/2026-03-02").json()
+        assert len(unfiltered) == 1
+
+
 class TestExcusedAbsence:
     """미차감 결석 → 스케줄 연장."""
 
@@ -90,6 +144,157 @@ class TestExcusedAbsence:
         assert student["current_cycle"]["current_count"] == 8  # 7 + 1(연장) = 8
 
 
+class TestIncrementalCount:
+    """current_count 증감 반영 + 정합성 점검."""
+
+    def _first_record(self, client, seed_student):
+        group_id = seed_student["class_group_id"]
+        return client.get(f"/api/attendance/daily/2026-03-02?class_group_id={group_id}").json()[0]
+
+    def test_toggle_back_to_counting_increments(self, client, db, seed_student):
+        """미차감 → 다시 차감으로 변경 시 연장분 포함 9회, 출석 기록과 일치."""
+        att = self._first_record(client, seed_student)
+        client.put(f"/api/attendance/{att['id']}", json={
+            "status": "absent_excused", "counts_toward_cycle": False, "excuse_reason": "sick_leave",
+        })
+        res = client.put(f"/api/attendance/{att['id']}", json={"status": "present"})
+
+        assert res.json()["current_count"] == 9
+        assert check_cycle_counts(db) == []
+
+    def test_edit_does_not_recount(self, client, seed_student):
+        """출석 수정 시 COUNT(*) 재계산 쿼리를 실행하지 않음."""
+        att = self._first_record(client, seed_student)
+        statements = []
+
+        def _collect(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", _collect)
+        try:
+            client.put(f"/api/attendance/{att['id']}", json={"status": "late"})
+        finally:
+            event.remove(engine, "before_cursor_execute", _collect)
+        assert not any("count(" in st.lower() for st in statements)
+
+    def test_check_detects_and_repairs_drift(self, db, seed_student):
+        """저장된 회차가 어긋나면 보고하고, repair 시 실제 값으로 수정."""
+        cycle_id = seed_student["current_cycle"]["id"]
+        db.query(Cycle).filter(Cycle.id == cycle_id).update({Cycle.current_count: 3})
+        db.commit()
+
+        assert check_cycle_counts(db) == [{"cycle_id": cycle_id, "stored": 3, "actual": 8}]
+        check_cycle_counts(db, repair=True)
+        db.commit()
+        assert check_cycle_counts(db) == []
+
+    def test_repair_updates_read_model_and_etag(self, client, db, seed_student):
+        """repair는 읽기 모델(대시보드)과 학생 목록 ETag, 알림 캐시도 갱신한다."""
+        cycle_id = seed_student["current_cycle"]["id"]
+        db.query(Cycle).filter(Cycle.id == cycle_id).update({Cycle.current_count: 3})
+        db.query(StudentSummary).filter(StudentSummary.current_cycle_id == cycle_id).update(
+            {StudentSummary.current_count: 3}
+        )
+        db.commit()
+        etag = client.get("/api/students").headers["etag"]
+        alerts_version = alert_service.alerts_cache.version
+
+        check_cycle_counts(db, repair=True)
+        db.commit()
+
+        [row] = client.get("/api/dashboard/students").json()
+        assert row["current_count"] == 8
+        assert client.get("/api/students", headers={"If-None-Match": etag}).status_code == 200
+        assert alert_service.alerts_cache.version > alerts_version
+        assert db.get(Cycle, cycle_id).current_count == 8
+
+
+class TestBulkAttendance:
+    """수업 단위 일괄 출석 처리."""
+
+    def test_bulk_update_applies_all_items(self, client, seed_student):
+        """여러 학생의 출석 상태를 한 번에 변경하고 출석부를 반환."""
+        group_id = seed_student["class_group_id"]
+        other = client.post("/api/students", json={
+            "name": "박추가",
+            "phone": "010-0000-0000",
+            "school": "테스트초",
+            "grade": "elementary",
+            "parent_phone": "010-1111-1111",
+            "class_group_id": group_id,
+            "enrollment_status": "active",
+        }).json()
+        client.post(f"/api/students/{other['id']}/start-cycle", json={"start_date": "2026-03-02"})
+
+        res = client.post("/api/attendance/bulk", json={
+            "date": "2026-03-02",
+            "items": [
+                {"student_id": seed_student["id"], "status": "late"},
+                {"student_id": other["id"], "status": "absent_excused",
+                 "counts_toward_cycle": False, "excuse_reason": "school_event"},
+            ],
+        })
+        assert res.status_code == 200
+        board = {r["student_id"]: r for r in res.json()}
+        assert board[seed_student["id"]]["status"] == "late"
+        assert board[other["id"]]["status"] == "absent_excused"
+        assert board[other["id"]]["current_count"] == 8  # 7 + 1(연장)
+
+        # 미차감 학생만 3.30(월)로 연장
+        extended = client.get(f"/api/attendance/daily/2026-03-30?class_group_id={group_id}").json()
+        assert [r["student_id"] for r in extended] == [other["id"]]
+
+    def test_bulk_missing_record_rolls_back(self, client, seed_student):
+        """스케줄이 없는 학생이 포함되면 404, 아무것도 변경되지 않음."""
+        res = client.post("/api/attendance/bulk", json={
+            "date": "2026-03-02",
+            "items": [
+                {"student_id": seed_student["id"], "status": "absent"},
+                {"student_id": 9999, "status": "present"},
+            ],
+        })
+        assert res.status_code == 404
+
+        records = client.get("/api/attendance/daily/2026-03-02").json()
+        assert records[0]["status"] == "present"
+
+
+    def test_bulk_rejects_ambiguous_items(self, client, db, seed_student):
+        """같은 학생 중복 → 400, 그날 기록이 2개인 학생 → 409 (어느 기록인지 모름), 변경 없음."""
+        sid = seed_student["id"]
+        res = client.post("/api/attendance/bulk", json={
+            "date": "2026-03-02",
+            "items": [{"student_id": sid, "status": "late"}, {"student_id": sid, "status": "absent"}],
+        })
+        assert res.status_code == 400
+
+        # 다음 사이클이 이전 사이클의 연장 스케줄과 같은 날에 잡힌 경우
+        cycle = Cycle(student_id=sid, cycle_number=2, current_count=8, total_count=8)
+        db.add(cycle)
+        db.flush()
+        db.add(Attendance(student_id=sid, cycle_id=cycle.id, date=date(2026, 3, 2), status="present"))
+        db.commit()
+        res = client.post("/api/attendance/bulk", json={
+            "date": "2026-03-02", "items": [{"student_id": sid, "status": "late"}],
+        })
+        assert res.status_code == 409
+        assert {r["status"] for r in client.get("/api/attendance/daily/2026-03-02").json()} == {"present"}
+
+    def test_bulk_response_follows_item_order(self, client, seed_student):
+        """응답은 요청 항목 순서."""
+        other = client.post("/api/students", json={
+            "name": "가나다", "phone": "010-0000-0000", "school": "테스트초", "grade": "elementary",
+            "parent_phone": "010-1111-1111", "class_group_id": seed_student["class_group_id"],
+            "enrollment_status": "active",
+        }).json()
+        client.post(f"/api/students/{other['id']}/start-cycle", json={"start_date": "2026-03-02"})
+        for order in ([seed_student["id"], other["id"]], [other["id"], seed_student["id"]]):
+            res = client.post("/api/attendance/bulk", json={
+                "date": "2026-03-02", "items": [{"student_id": sid, "status": "late"} for sid in order],
+            })
+            assert [r["student_id"] for r in res.json()] == order
+
+
 class TestCycleComplete:
     """사이클 완료 테스트."""
 
@@ -115,6 +320,168 @@ class TestCycleComplete:
         assert res.status_code == 400
 
 
+class TestCycleAlerts:
+    """사이클 알림 - 학생별 최신 사이클 기준, 캐시 + 무효화."""
+
+    def _complete_and_pay(self, client, cycle_id):
+        client.post(f"/api/cycles/{cycle_id}/complete")
+        payment = client.get("/api/payments").json()[0]
+        client.post(f"/api/payments/{payment['id']}/confirm", json={"payment_method": "transfer"})
+
+    def test_completed_cycle_alerted(self, client, seed_student):
+        """사이클 완료 → 알림 1건."""
+        client.post(f"/api/cycles/{seed_student['current_cycle']['id']}/complete")
+
+        alerts = client.get("/api/cycles/alerts").json()
+        assert len(alerts) == 1
+        assert alerts[0]["student_name"] == "김테스트"
+        assert alerts[0]["class_group_name"] == "테스트반"
+        assert alerts[0]["cycle_number"] == 1
+
+    def test_restarted_student_not_alerted(self, client, seed_student):
+        """다음 사이클을 이미 시작한 학생은 알림에서 제외."""
+        cycle_id = seed_student["current_cycle"]["id"]
+        self._complete_and_pay(client, cycle_id)
+        assert len(client.get("/api/cycles/alerts").json()) == 1
+
+        client.post(f"/api/cycles/{cycle_id}/start-next", json={"start_date": "2026-03-30"})
+        assert client.get("/api/cycles/alerts").json() == []
+
+    def test_stopped_student_not_alerted(self, client, seed_student):
+        """수업중이 아닌 학생은 제외 (상태 변경 시 캐시 무효화)."""
+        client.post(f"/api/cycles/{seed_student['current_cycle']['id']}/complete")
+        assert len(client.get("/api/cycles/alerts").json()) == 1
+
+        client.post(f"/api/students/{seed_student['id']}/status", json={"status": "stopped"})
+        assert client.get("/api/cycles/alerts").json() == []
+
+    def test_single_query_then_cached(self, client, seed_student, count_queries):
+        """첫 조회는 쿼리 1회, 변경 없으면 다음 조회는 DB 접근 없음."""
+        client.post(f"/api/cycles/{seed_student['current_cycle']['id']}/complete")
+
+        with count_queries() as first:
+            client.get("/api/cycles/alerts")
+        with count_queries() as second:
+            client.get("/api/cycles/alerts")
+
+        assert first["count"] == 1
+        assert second["count"] == 0
+
+    def test_not_cached_when_invalidated_during_query(self, client, seed_student, count_queries, monkeypatch):
+        """조회하는 사이 다른 요청의 커밋으로 무효화되면 그 결과는 캐시하지 않는다."""
+        real_select = alert_service.alerts_select
+
+        def select_then_commit_elsewhere():
+            alert_service.alerts_cache.invalidate()
+            return real_select()
+
+        monkeypatch.setattr(alert_service, "alerts_select", select_then_commit_elsewhere)
+        client.get("/api/cycles/alerts")
+        monkeypatch.setattr(alert_service, "alerts_select", real_select)
+        with count_queries() as again:
+            client.get("/api/cycles/alerts")
+        assert again["count"] == 1
+
+
+class TestCycleRollover:
+    """학기 전환 일괄 처리 - 완료 + 납부 확인된 사이클만 다음 사이클 시작."""
+
+    def _students(self, client, group_id, n, prefix="학생"):
+        """사이클을 시작한 수업중 학생 n명 (일괄 등록) → 학생 id 목록."""
+        return client.post("/api/students/import", json=[
+            {"name": f"{prefix}{i:02d}", "phone": "010-0000-0000", "school": "서울초", "grade": "elementary",
+             "parent_phone": f"010-{prefix}-{i:04d}", "class_group_id": group_id,
+             "enrollment_status": "active", "start_date": "2026-03-02"}
+            for i in range(n)
+        ]).json()["student_ids"]
+
+    def _complete(self, client, student_ids, pay=True):
+        for sid in student_ids:
+            cycle_id = client.get(f"/api/students/{sid}").json()["current_cycle"]["id"]
+            client.post(f"/api/cycles/{cycle_id}/complete")
+            if pay:
+                payment = client.get("/api/payments", params={"student_id": sid}).json()[0]
+                client.post(f"/api/payments/{payment['id']}/confirm", json={"payment_method": "transfer"})
+
+    def test_only_paid_cycles_rolled_over(self, client, seed_class_group):
+        """납부 확인된 학생만 다음 사이클 시작, 미납 학생은 알림에 남음."""
+        paid = self._students(client, seed_class_group["id"], 3)
+        unpaid = self._students(client, seed_class_group["id"], 1, prefix="미납")
+        self._complete(client, paid)
+        self._complete(client, unpaid, pay=False)
+
+        res = client.post("/api/cycles/rollover", json={"start_date": "2026-04-01"})
+        assert res.status_code == 200
+        body = res.json()
+        assert body["started"] == 3
+        assert {c["student_id"] for c in body["cycles"]} == set(paid)
+        assert {c["cycle_number"] for c in body["cycles"]} == {2}
+
+        student = client.get(f"/api/students/{paid[0]}").json()
+        assert student["current_cycle"]["cycle_number"] == 2
+        assert student["current_cycle"]["current_count"] == 8
+        board = client.get("/api/attendance/daily/2026-04-01").json()
+        assert {row["student_id"] for row in board} == set(paid)
+        assert [a["student_id"] for a in client.get("/api/cycles/alerts").json()] == unpaid
+
+        # 다시 실행해도 이미 시작한 학생은 대상이 아님
+        assert client.post("/api/cycles/rollover", json={"start_date": "2026-04-01"}).json()["started"] == 0
+
+    def test_class_group_filter(self, client, seed_class_group):
+        """class_group_id를 주면 그 수업반만."""
+        other = client.post("/api/class-groups", json={
+            "name": "화목반", "days_of_week": ["tue", "thu"], "start_time": "16:00", "default_duration_minutes": 90,
+        }).json()
+        mine = self._students(client, seed_class_group["id"], 2)
+        theirs = self._students(client, other["id"], 2, prefix="화목")
+        self._complete(client, mine + theirs)
+
+        body = client.post("/api/cycles/rollover", json={
+            "start_date": "2026-04-01", "class_group_id": other["id"],
+        }).json()
+        assert {c["student_id"] for c in body["cycles"]} == set(theirs)
+        # 화목반 스케줄: 4/2(목)부터
+        assert {row["student_id"] for row in client.get("/api/attendance/daily/2026-04-02").json()} == set(theirs)
+        assert client.post("/api/cycles/rollover", json={"class_group_id": 999}).status_code == 404
+
+    def test_deleted_class_group_excluded(self, client, seed_class_group):
+        """삭제된 수업반 학생은 대상이 아니고, 그 수업반을 지정하면 404."""
+        other = client.post("/api/class-groups", json={
+            "name": "폐강반", "days_of_week": ["fri"], "start_time": "16:00", "default_duration_minutes": 90,
+        }).json()
+        mine = self._students(client, seed_class_group["id"], 1)
+        closed = self._students(client, other["id"], 1, prefix="폐강")
+        self._complete(client, mine + closed)
+        client.delete(f"/api/class-groups/{other['id']}")
+
+        assert client.post("/api/cycles/rollover", json={"class_group_id": other["id"]}).status_code == 404
+        body = client.post("/api/cycles/rollover", json={"start_date": "2026-04-01"}).json()
+        assert [c["student_id"] for c in body["cycles"]] == mine
+
+    def test_start_error_is_400(self, client, seed_class_group, monkeypatch):
+        """일괄 시작 실패(ValueError)는 500이 아니라 400."""
+        def fail(*args):
+            raise ValueError("수업반을 찾을 수 없습니다")
+
+        monkeypatch.setattr("app.routers.attendance.rollover_cycles", fail)
+        res = client.post("/api/cycles/rollover", json={"start_date": "2026-04-01"})
+        assert res.status_code == 400
+        assert res.json()["detail"] == "수업반을 찾을 수 없습니다"
+
+    def test_query_count_independent_of_student_count(self, client, seed_class_group, count_queries):
+        """대상 학생 수와 무관하게 쿼리 수 고정."""
+        small = self._students(client, seed_class_group["id"], 2)
+        self._complete(client, small)
+        with count_queries() as first:
+            client.post("/api/cycles/rollover", json={"start_date": "2026-04-01"})
+
+        large = self._students(client, seed_class_group["id"], 15, prefix="대량")
+        self._complete(client, large)
+        with count_queries() as second:
+            assert client.post("/api/cycles/rollover", json={"start_date": "2026-04-01"}).json()["started"] == 15
+        assert second["count"] == first["count"]
+
+
 class TestEnrollmentStatus:
     """수업등록 상태 변경 + 이력 테스트."""
 
@@ -0,0 +1,117 @@
+"""대시보드 읽기 모델 테스트.
+
+변경 API가 같은 트랜잭션에서 student_summaries를 갱신하는지,
+전체 재생성 결과가 증분 갱신 결과와 같은지 확인한다.
+"""
+from app.models.student_summary import StudentSummary
+from app.services.read_model import rebuild_read_model
+
+
+def _summary(client, student_id):
+    rows = client.get("/api/dashboard/students?enrollment_status=all").json()
+    return next(r for r in rows if r["student_id"] == student_id)
+
+
+def _snapshot(db):
+    db.expire_all()
+    return {
+        s.student_id: {c: getattr(s, c) for c in StudentSummary.__table__.columns.keys() if c != "updated_at"}
+        for s in db.query(StudentSummary).all()
+    }
+
+
+class TestReadModelMaintenance:
+    """변경 시 읽기 모델 갱신."""
+
+    def test_cycle_start_populates_row(self, client, seed_student):
+        """사이클 시작 → 수업반/사이클 정보 반영."""
+        row = _summary(client, seed_student["id"])
+        assert row["class_group_name"] == "테스트반"
+        assert row["start_time"] == "14:30"
+        assert row["current_cycle_number"] == 1
+        assert row["current_count"] == 8
+        assert row["active_date"] is not None
+
+    def test_attendance_change_updates_count(self, client, seed_student):
+        """미차감 → 차감 복귀 시 회차 9 (학생 API와 동일)."""
+        group_id = seed_student["class_group_id"]
+        att = client.get(f"/api/attendance/daily/2026-03-02?class_group_id={group_id}").json()[0]
+        client.put(f"/api/attendance/{att['id']}", json={
+            "status": "absent_excused", "counts_toward_cycle": False, "excuse_reason": "sick_leave",
+        })
+        client.put(f"/api/attendance/{att['id']}", json={"status": "present"})
+
+        assert _summary(client, seed_student["id"])["current_count"] == 9
+
+    def test_complete_and_confirm_payment(self, client, seed_student):
+        """사이클 완료 → 미납 반영, 납부 확인 → 미납 해제."""
+        client.post(f"/api/cycles/{seed_student['current_cycle']['id']}/complete")
+        row = _summary(client, seed_student["id"])
+        assert row["current_cycle_status"] == "completed"
+        assert row["pending_amount"] == 240000
+
+        stats = client.get("/api/dashboard/stats").json()
+        assert stats["pending_payment_count"] == 1
+        assert stats["pending_amount_total"] == 240000
+
+        client.post(f"/api/payments/{row['pending_payment_id']}/confirm", json={"payment_method": "cash"})
+        assert _summary(client, seed_student["id"])["pending_payment_id"] is None
+        assert client.get("/api/dashboard/stats").json()["pending_payment_count"] == 0
+
+    def test_pending_totals_count_every_unpaid_cycle(self, client, seed_student):
+        """미납 사이클이 둘인 학생도 건수/금액을 모두 센다 (읽기 모델은 최근 1건만 보관)."""
+        student_id = seed_student["id"]
+        client.post(f"/api/cycles/{seed_student['current_cycle']['id']}/complete")
+        client.post(f"/api/students/{student_id}/start-cycle", json={"start_date": "2026-04-06"})
+        cycle_id = client.get(f"/api/students/{student_id}").json()["current_cycle"]["id"]
+        client.post(f"/api/cycles/{cycle_id}/complete")
+
+        stats = client.get("/api/dashboard/stats").json()
+        assert stats["pending_payment_count"] == 2
+        assert stats["pending_amount_total"] == 480000
+
+    def test_status_change_and_group_rename(self, client, seed_student):
+        """상태 변경 / 수업반 이름 변경 반영."""
+        client.post(f"/api/students/{seed_student['id']}/status", json={"status": "stopped"})
+        client.put(f"/api/class-groups/{seed_student['class_group_id']}", json={
+            "name": "새이름반",
+            "days_of_week": ["mon", "wed"],
+            "start_time": "15:00",
+            "default_duration_minutes": 90,
+        })
+
+        row = _summary(client, seed_student["id"])
+        assert row["enrollment_status"] == "stopped"
+        assert row["stopped_date"] is not None
+        assert row["class_group_name"] == "새이름반"
+        assert row["start_time"] == "15:00"
+        stats = client.get("/api/dashboard/stats").json()
+        assert stats["status_counts"] == {"inquiry": 0, "level_test": 0, "active": 0, "stopped": 1}
+
+
+class TestRebuild:
+    """전체 재생성."""
+
+    def test_rebuild_matches_incremental(self, client, db, seed_student):
+        """증분 갱신 결과 = 전체 재생성 결과."""
+        client.post("/api/students", json={
+            "name": "문의학생",
+            "phone": "010-0000-0000",
+            "school": "테스트초",
+            "grade": "middle1",
+            "parent_phone": "010-1111-1111",
+            "class_group_id": seed_student["class_group_id"],
+        })
+        client.post(f"/api/cycles/{seed_student['current_cycle']['id']}/complete")
+        incremental = _snapshot(db)
+
+        assert rebuild_read_model(db) == 2
+        db.commit()
+        assert _snapshot(db) == incremental
+
+    def test_dashboard_query_count(self, client, seed_student, count_queries):
+        """학생 현황은 읽기 모델 쿼리 1회, 통계는 읽기 모델 + 미납 합계 2회."""
+        with count_queries() as counter:
+            client.get("/api/dashboard/students")
+            client.get("/api/dashboard/stats")
+        assert counter["count"] == 3
@@ -0,0 +1,142 @@
+"""DB 엔진 설정 테스트 - SQLite 성능 프로필 PRAGMA, 서버 DB 연결 풀."""
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import sessionmaker
+
+from app.cache import clear_all_caches
+from app.config import Settings
+from app.database import (
+    Base,
+    apply_sqlite_profile,
+    async_url,
+    create_async_db_engine,
+    create_db_engine,
+    get_async_db,
+    get_db,
+)
+from app.main import app
+
+
+def _pragma(engine, name):
+    with engine.connect() as conn:
+        return conn.exec_driver_sql(f"PRAGMA {name}").scalar()
+
+
+class TestSqliteProfile:
+    """connect 이벤트로 PRAGMA 적용."""
+
+    def test_performance_profile(self, tmp_path):
+        """performance 프로필 → WAL, synchronous=NORMAL, busy_timeout, foreign_keys."""
+        engine = create_engine(f"sqlite:///{tmp_path / 'perf.db'}")
+        apply_sqlite_profile(engine, Settings(sqlite_profile="performance", sqlite_busy_timeout_ms=1234))
+
+        assert _pragma(engine, "journal_mode") == "wal"
+        assert _pragma(engine, "synchronous") == 1  # NORMAL
+        assert _pragma(engine, "busy_timeout") == 1234
+        assert _pragma(engine, "foreign_keys") == 1
+        assert _pragma(engine, "cache_size") == -64000
+        engine.dispose()
+
+    def test_default_profile_keeps_sqlite_defaults(self, tmp_path):
+        """default 프로필 → PRAGMA 변경 없음 (rollback journal)."""
+        engine = create_engine(f"sqlite:///{tmp_path / 'plain.db'}")
+        apply_sqlite_profile(engine, Settings(sqlite_profile="default"))
+
+        assert _pragma(engine, "journal_mode") == "delete"
+        assert _pragma(engine, "synchronous") == 2  # FULL
+        engine.dispose()
+
+
+@pytest.fixture()
+def profiled_client(tmp_path):
+    """기본(performance) 프로필을 적용한 임시 SQLite 파일 DB로 API 호출 (foreign_keys=ON)."""
+    config = Settings(database_url=f"sqlite:///{tmp_path / 'profiled.db'}")
+    engine = create_db_engine(config)
+    async_engine = create_async_db_engine(config)
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine, autoflush=False)
+    AsyncSession = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+    def _get_db():
+        with Session() as session:
+            yield session
+
+    async def _get_async_db():
+        async with AsyncSession() as session:
+            yield session
+
+    clear_all_caches()
+    app.dependency_overrides[get_db] = _get_db
+    app.dependency_overrides[get_async_db] = _get_async_db
+    try:
+        with TestClient(app) as client:
+            yield client
+    finally:
+        app.dependency_overrides.clear()
+        clear_all_caches()
+        engine.dispose()
+
+
+class TestForeignKeysProfile:
+    """performance 프로필(foreign_keys=ON)에서도 잘못된 수업반 id는 500이 아니라 400."""
+
+    def test_unknown_class_group(self, profiled_client):
+        """없는 수업반으로 학생 등록/수정 → 400, 있는 수업반 → 정상."""
+        group = profiled_client.post("/api/class-groups", json={
+            "name": "월수반", "days_of_week": ["mon", "wed"], "start_time": "14:30", "default_duration_minutes": 90,
+        }).json()
+        student = {
+            "name": "김학생", "phone": "010-1", "school": "서울초", "grade": "elementary", "parent_phone": "010-2",
+        }
+        res = profiled_client.post("/api/students", json={**student, "class_group_id": group["id"] + 100})
+        assert res.status_code == 400
+
+        created = profiled_client.post("/api/students", json={**student, "class_group_id": group["id"]})
+        assert created.status_code == 201
+        res = profiled_client.put(f"/api/students/{created.json()['id']}", json={
+            **student, "class_group_id": group["id"] + 100,
+        })
+        assert res.status_code == 400
+        assert profiled_client.get(f"/api/students/{created.json()['id']}").json()["class_group_id"] == group["id"]
+
+
+class TestEngineFactory:
+    """database_url에 따른 엔진 생성."""
+
+    def test_sqlite_url_uses_profile(self, tmp_path):
+        """SQLite URL → PRAGMA 프로필 적용."""
+        engine = create_db_engine(Settings(database_url=f"sqlite:///{tmp_path / 'app.db'}"))
+
+        assert engine.dialect.name == "sqlite"
+        assert _pragma(engine, "journal_mode") == "wal"
+        engine.dispose()
+
+    def test_server_url_uses_connection_pool(self):
+        """PostgreSQL URL → 설정값으로 연결 풀 구성 (연결은 생성하지 않음)."""
+        engine = create_db_engine(Settings(
+            database_url="postgresql+psycopg://user:pw@localhost:5432/math_academy",
+            db_pool_size=7,
+            db_max_overflow=3,
+            db_pool_recycle_seconds=600,
+        ))
+
+        assert engine.dialect.name == "postgresql"
+        assert engine.pool.size() == 7
+        assert engine.pool._max_overflow == 3
+        assert engine.pool._recycle == 600
+        assert engine.pool._pre_ping is True
+
+
+class TestAsyncUrl:
+    """get_async_db용 비동기 드라이버 URL 변환."""
+
+    def test_sqlite_to_aiosqlite(self):
+        """sqlite → sqlite+aiosqlite."""
+        assert async_url("sqlite:///./math_academy.db").drivername == "sqlite+aiosqlite"
+
+    def test_postgresql_to_psycopg(self):
+        """postgresql(+드라이버) → postgresql+psycopg (async 지원)."""
+        assert async_url("postgresql://u:p@localhost/db").drivername == "postgresql+psycopg"
+        assert async_url("postgresql+psycopg://u:p@localhost/db").drivername == "postgresql+psycopg"
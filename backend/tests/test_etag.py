@@ -0,0 +1,76 @@
+"""조회 API ETag / If-None-Match 테스트."""
+import time
+
+from app.config import settings
+
+
+def _get(client, path, etag=None):
+    headers = {"If-None-Match": etag} if etag else {}
+    return client.get(path, headers=headers)
+
+
+class TestConditionalGet:
+    """버전이 그대로면 304, 변경 API 커밋 후에는 200."""
+
+    def test_etag_and_304_without_db(self, client, seed_student, count_queries):
+        """같은 ETag로 다시 요청하면 DB 조회 없이 304."""
+        first = _get(client, "/api/students")
+        etag = first.headers["etag"]
+        assert first.status_code == 200
+        with count_queries() as counter:
+            again = _get(client, "/api/students", etag)
+        assert again.status_code == 304
+        assert again.headers["etag"] == etag
+        assert again.content == b""
+        assert counter["count"] == 0
+
+    def test_grades_always_revalidates(self, client):
+        """등급 설정은 상수 → 같은 ETag면 항상 304."""
+        etag = _get(client, "/api/grades").headers["etag"]
+        assert _get(client, "/api/grades", etag).status_code == 304
+        assert _get(client, "/api/grades", f'W/{etag}, "other"').status_code == 304
+
+    def test_student_write_changes_etag(self, client, seed_student):
+        """학생 목록이 바뀌는 변경(사이클 완료)만 ETag를 바꾼다."""
+        etag = _get(client, "/api/students").headers["etag"]
+        att = client.get("/api/attendance/daily/2026-03-02").json()[0]
+        # 미차감 결석 → 1회 연장되어 회차 그대로 → 목록 변화 없음
+        client.put(f"/api/attendance/{att['id']}", json={"status": "absent", "counts_toward_cycle": False})
+        assert _get(client, "/api/students", etag).status_code == 304
+        client.post(f"/api/cycles/{seed_student['current_cycle']['id']}/complete")
+        res = _get(client, "/api/students", etag)
+        assert res.status_code == 200
+        assert res.headers["etag"] != etag
+        assert res.json()[0]["current_cycle"] is None
+
+    def test_level_test_changes_etag(self, client, seed_student):
+        """읽기 모델을 거치지 않는 레벨테스트 수정도 ETag를 바꾼다."""
+        etag = _get(client, "/api/students").headers["etag"]
+        client.put(f"/api/students/{seed_student['id']}/level-test", json={"level_test_result": "상"})
+        assert _get(client, "/api/students", etag).status_code == 200
+
+    def test_class_group_and_alerts(self, client, seed_student):
+        """수업반 수정 → 수업반 ETag, 사이클 완료 → 알림 ETag 변경."""
+        group_etag = _get(client, "/api/class-groups").headers["etag"]
+        client.put(f"/api/class-groups/{seed_student['class_group_id']}", json={
+            "name": "새이름", "days_of_week": ["mon", "wed"], "start_time": "14:30", "default_duration_minutes": 90,
+        })
+        assert _get(client, "/api/class-groups", group_etag).status_code == 200
+
+        alert_etag = _get(client, "/api/cycles/alerts").headers["etag"]
+        client.post(f"/api/cycles/{seed_student['current_cycle']['id']}/complete")
+        res = _get(client, "/api/cycles/alerts", alert_etag)
+        assert res.status_code == 200
+        assert len(res.json()) == 1
+
+    def test_other_process_change_seen_after_window(self, client, seed_student, monkeypatch):
+        """다른 워커/CLI의 변경은 이 프로세스 버전을 올리지 않으므로 다음 시간 구간부터 200."""
+        etag = _get(client, "/api/students").headers["etag"]
+        assert _get(client, "/api/students", etag).status_code == 304
+        now = time.time()
+        monkeypatch.setattr(time, "time", lambda: now + settings.etag_max_age_seconds)
+        assert _get(client, "/api/students", etag).status_code == 200
+
+    def test_other_endpoints_untouched(self, client, seed_student):
+        """대상이 아닌 조회 API에는 ETag를 붙이지 않는다."""
+        assert "etag" not in _get(client, "/api/payments").headers
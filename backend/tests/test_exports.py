@@ -0,0 +1,84 @@
+"""출석/수업료/등록 이력 스트리밍 내보내기 테스트."""
+import csv
+import io
+import json
+
+from app.services import export_service
+
+
+def _csv_rows(res) -> list[dict]:
+    return list(csv.DictReader(io.StringIO(res.content.decode("utf-8-sig"))))
+
+
+class TestAttendanceExport:
+    """출석 내보내기: CSV/NDJSON, 기간/수업반 필터."""
+
+    def test_csv(self, client, seed_student):
+        """헤더 + 8회차 행, 엑셀용 BOM, 첨부 파일 헤더."""
+        res = client.get("/api/exports/attendance")
+        assert res.status_code == 200
+        assert res.headers["content-type"].startswith("text/csv")
+        assert 'filename="attendance.csv"' in res.headers["content-disposition"]
+        assert res.content.startswith("\ufeff".encode())
+        rows = _csv_rows(res)
+        assert len(rows) == 8
+        assert rows[0]["date"] == "2026-03-02"
+        assert rows[0]["student_name"] == "김테스트"
+        assert rows[0]["class_group_name"] == "테스트반"
+        assert rows[0]["excuse_reason"] == ""
+
+    def test_ndjson_date_range(self, client, seed_student):
+        """기간 필터는 양끝 포함."""
+        res = client.get("/api/exports/attendance", params={
+            "format": "ndjson", "date_from": "2026-03-04", "date_to": "2026-03-11",
+        })
+        lines = [json.loads(line) for line in res.text.splitlines()]
+        assert [line["date"] for line in lines] == ["2026-03-04", "2026-03-09", "2026-03-11"]
+        assert lines[0]["counts_toward_cycle"] is True
+
+    def test_class_group_filter(self, client, seed_student):
+        """다른 수업반으로 필터하면 헤더만."""
+        other = client.post("/api/class-groups", json={
+            "name": "다른반", "days_of_week": ["fri"], "start_time": "16:00", "default_duration_minutes": 120,
+        }).json()
+        assert _csv_rows(client.get("/api/exports/attendance", params={"class_group_id": other["id"]})) == []
+        rows = _csv_rows(client.get("/api/exports/attendance", params={"class_group_id": seed_student["class_group_id"]}))
+        assert len(rows) == 8
+
+    def test_streams_in_batches(self, client, db, seed_student, monkeypatch):
+        """EXPORT_BATCH_SIZE 행씩 읽어 배치마다 청크 1개, 합치면 순서대로 빠짐없이."""
+        monkeypatch.setattr(export_service, "EXPORT_BATCH_SIZE", 3)
+        stmt = export_service.export_select("attendance", None, None, None)
+        chunks = list(export_service.iter_export(db, stmt, "ndjson"))
+        assert [len(chunk.splitlines()) for chunk in chunks] == [3, 3, 2]
+        csv_chunks = list(export_service.iter_export(db, stmt, "csv"))
+        assert [len(chunk.splitlines()) for chunk in csv_chunks] == [1 + 3, 3, 2]  # 첫 청크에 헤더
+
+        lines = client.get("/api/exports/attendance", params={"format": "ndjson"}).text.splitlines()
+        assert [json.loads(line)["id"] for line in lines] == sorted(json.loads(line)["id"] for line in lines)
+        assert len(lines) == 8
+
+    def test_invalid_format(self, client):
+        """지원하지 않는 형식은 422."""
+        res = client.get("/api/exports/attendance", params={"format": "xml"})
+        assert res.status_code == 422
+
+
+class TestPaymentAndHistoryExport:
+    """수업료 / 등록 이력 내보내기."""
+
+    def test_payments(self, client, seed_student):
+        """사이클 완료 시 생성된 청구가 내보내진다 (생성일 기준 기간 필터)."""
+        client.post(f"/api/cycles/{seed_student['current_cycle']['id']}/complete")
+        rows = _csv_rows(client.get("/api/exports/payments"))
+        assert len(rows) == 1
+        assert rows[0]["amount"] == "240000"
+        assert rows[0]["status"] == "pending"
+        assert _csv_rows(client.get("/api/exports/payments", params={"date_to": "2000-01-01"})) == []
+
+    def test_enrollment_history(self, client, seed_student):
+        """상태 변경 이력 (최초 등록 포함)."""
+        client.delete(f"/api/students/{seed_student['id']}")
+        lines = client.get("/api/exports/enrollment-history", params={"format": "ndjson"}).text.splitlines()
+        statuses = [(r["from_status"], r["to_status"]) for r in map(json.loads, lines)]
+        assert statuses == [(None, "active"), ("active", "stopped")]
@@ -0,0 +1,104 @@
+"""인덱스 선언 + 마이그레이션 테스트.
+
+라우터가 실제로 실행하는 SELECT 문을 캡처해 EXPLAIN QUERY PLAN으로 확인한다.
+핫 패스 테이블(attendance/cycles/payments/enrollment_history)은 전체 스캔하면 안 된다.
+"""
+import re
+
+import pytest
+from sqlalchemy import event, inspect, text
+
+from app.migrate import ensure_indexes
+from tests.conftest import ALL_ENGINES, engine
+
+pytestmark = pytest.mark.skipif(engine.dialect.name != "sqlite", reason="EXPLAIN QUERY PLAN은 SQLite 전용")
+
+HOT_TABLES = {"attendance", "cycles", "payments", "enrollment_history"}
+FULL_SCAN = re.compile(r"^SCAN (?:TABLE )?(\w+)")
+
+
+@pytest.fixture()
+def capture_selects():
+    """블록 안에서 실행된 SELECT 문과 파라미터를 수집."""
+    statements: list[tuple[str, tuple]] = []
+
+    def _on_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    for target in ALL_ENGINES:
+        event.listen(target, "before_cursor_execute", _on_execute)
+    yield statements
+    for target in ALL_ENGINES:
+        event.remove(target, "before_cursor_execute", _on_execute)
+
+
+def _full_scans(db, statements) -> list[str]:
+    """핫 테이블을 인덱스 없이 전체 스캔하는 쿼리 목록."""
+    offenders = []
+    conn = db.connection()
+    for statement, parameters in statements:
+        plan = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()
+        for row in plan:
+            detail = row[-1]
+            m = FULL_SCAN.match(detail)
+            if m and m.group(1) in HOT_TABLES and "USING" not in detail:
+                offenders.append(f"{detail} ← {statement}")
+    return offenders
+
+
+class TestQueryPlans:
+    """라우터 쿼리가 인덱스를 사용하는지 확인."""
+
+    def test_read_endpoints_use_indexes(self, client, db, seed_student, capture_selects):
+        """조회 API의 모든 쿼리가 핫 테이블을 인덱스로 탐색."""
+        group_id = seed_student["class_group_id"]
+        client.get(f"/api/attendance/daily/2026-03-02?class_group_id={group_id}")
+        client.get("/api/attendance/daily/2026-03-04")
+        client.get("/api/students")
+        client.get(f"/api/students/{seed_student['id']}")
+        client.get(f"/api/students/{seed_student['id']}/history")
+        client.get("/api/cycles/alerts")
+        client.get("/api/payments?status=pending")
+        client.get("/api/payments")
+        client.get("/api/payments?limit=1&cursor=MjAyNi0wMy0wMVQxMDowMDowMHwx")
+        client.get(f"/api/payments?student_id={seed_student['id']}")
+        client.get(f"/api/payments?class_group_id={group_id}")
+
+        assert capture_selects
+        assert _full_scans(db, capture_selects) == []
+
+    def test_write_endpoints_use_indexes(self, client, db, seed_student, capture_selects):
+        """출석 수정 / 사이클 완료 / 납부 / 다음 사이클 시작 쿼리도 인덱스 사용."""
+        group_id = seed_student["class_group_id"]
+        cycle_id = seed_student["current_cycle"]["id"]
+        att = client.get(f"/api/attendance/daily/2026-03-02?class_group_id={group_id}").json()[0]
+
+        client.put(f"/api/attendance/{att['id']}", json={
+            "status": "absent_excused",
+            "counts_toward_cycle": False,
+            "excuse_reason": "sick_leave",
+        })
+        client.post(f"/api/cycles/{cycle_id}/complete")
+        payment = client.get("/api/payments").json()[0]
+        client.post(f"/api/payments/{payment['id']}/confirm", json={"payment_method": "cash"})
+        client.post(f"/api/cycles/{cycle_id}/start-next", json={"start_date": "2026-04-06"})
+
+        assert _full_scans(db, capture_selects) == []
+
+
+class TestEnsureIndexes:
+    """기존 DB에 인덱스를 추가하는 마이그레이션."""
+
+    def test_adds_missing_indexes_idempotently(self, db):
+        """인덱스가 없는 기존 DB → 생성, 재실행 시 추가 없음."""
+        inspector = inspect(engine)
+        declared = {ix["name"] for table in HOT_TABLES for ix in inspector.get_indexes(table)}
+        with engine.begin() as conn:
+            for name in declared:
+                conn.execute(text(f"DROP INDEX {name}"))
+
+        created = ensure_indexes(engine)
+        assert declared <= set(created)
+        assert "ix_attendance_date" in created
+        assert ensure_indexes(engine) == []
@@ -0,0 +1,78 @@
+"""안내 문자 템플릿 테스트."""
+import pytest
+
+from app.services.message_template import DEFAULT_TEMPLATES, PAYMENT_NOTICE, TemplateError, compile_template
+
+
+@pytest.fixture()
+def pending_payment(client, seed_student):
+    """seed_student의 사이클 완료 → 미납 수업료 1건."""
+    client.post(f"/api/cycles/{seed_student['current_cycle']['id']}/complete")
+    return client.get("/api/payments").json()[0]
+
+
+class TestCompileTemplate:
+    """템플릿 파싱/검증."""
+
+    def test_unknown_or_formatted_placeholder_rejected(self):
+        """허용 목록 밖의 자리표시자, 서식 지정, 속성 접근은 거부."""
+        for body in ("{parent_phone}", "{amount:>10}", "{student_name.upper}", "{student_name", "{0}"):
+            with pytest.raises(TemplateError):
+                compile_template(PAYMENT_NOTICE, body)
+
+    def test_render(self):
+        """자리표시자 치환, 중괄호 이스케이프 유지."""
+        compiled = compile_template(PAYMENT_NOTICE, "{student_name}님 {{안내}} {amount}원")
+        assert compiled.fields == {"student_name", "amount"}
+        assert compiled.render({"student_name": "김", "amount": "1,000"}) == "김님 {안내} 1,000원"
+
+    def test_render_matches_format_map(self):
+        """미리 파싱한 조각으로 만든 결과가 str.format_map과 같다 (숫자 값 포함)."""
+        body = DEFAULT_TEMPLATES[PAYMENT_NOTICE]
+        values = {
+            "student_name": "김학생", "grade_label": "초등", "cycle_number": 3,
+            "total_count": 8, "amount": "240,000", "class_group_name": "월수반",
+        }
+        assert compile_template(PAYMENT_NOTICE, body).render(values) == body.format_map(values)
+
+
+class TestMessageTemplateAPI:
+    """템플릿 조회/수정 → 단건/일괄 안내 문자에 반영."""
+
+    def test_default_template(self, client, pending_payment):
+        """저장된 문구가 없으면 기본 문구 (기존 문자와 동일)."""
+        template = client.get(f"/api/message-templates/{PAYMENT_NOTICE}").json()
+        assert template["is_default"] is True
+        assert "student_name" in template["placeholders"]
+
+        message = client.post(f"/api/payments/{pending_payment['id']}/message").json()["message"]
+        assert message.startswith("안녕하세요, 수학공부방입니다.\n\n김테스트 학생(초등)의\n1회차 수업(8회)")
+        assert "수업료: 240,000원" in message
+
+    def test_updated_template_used_by_single_and_batch(self, client, pending_payment):
+        """수정한 문구가 캐시 무효화 후 단건/일괄 생성에 모두 반영."""
+        client.post(f"/api/payments/{pending_payment['id']}/message")  # 기본 문구 캐시
+        res = client.put(f"/api/message-templates/{PAYMENT_NOTICE}", json={
+            "body": "[{class_group_name}] {student_name}({grade_label}) {cycle_number}회차 {amount}원",
+        })
+        assert res.status_code == 200
+        assert res.json()["is_default"] is False
+
+        expected = "[테스트반] 김테스트(초등) 1회차 240,000원"
+        assert client.post(f"/api/payments/{pending_payment['id']}/message").json()["message"] == expected
+        batch = client.post("/api/payments/messages", json={"unsent_only": False}).json()
+        assert [m["message"] for m in batch] == [expected]
+
+    def test_invalid_template_rejected(self, client):
+        """잘못된 자리표시자 → 400, 기존 문구 유지. 없는 템플릿 → 404."""
+        res = client.put(f"/api/message-templates/{PAYMENT_NOTICE}", json={"body": "{parent_phone}"})
+        assert res.status_code == 400
+        assert client.get(f"/api/message-templates/{PAYMENT_NOTICE}").json()["is_default"] is True
+        assert client.get("/api/message-templates/unknown").status_code == 404
+
+    def test_template_cached(self, client, pending_payment, count_queries):
+        """템플릿은 한 번만 읽는다 (두 번째 생성부터 템플릿 조회 없음)."""
+        client.post(f"/api/payments/{pending_payment['id']}/message")
+        with count_queries() as counter:
+            client.post(f"/api/payments/{pending_payment['id']}/message")
+        assert counter["count"] <= 2  # 수업료 조인 조회 + 발송 표시 UPDATE
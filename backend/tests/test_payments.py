@@ -4,7 +4,13 @@
 2. 메시지 생성 → message_sent = True
 3. 입금 확인 → status = paid
 4. 납부 후 다음 사이클 시작
+5. 목록 필터 + 커서 페이지네이션
 """
+from datetime import datetime
+
+import pytest
+
+from app.models.payment import Payment
 
 
 class TestPaymentAutoCreate:
@@ -111,3 +117,102 @@ class TestNextCycleStart:
             "start_date": "2026-03-30",
         })
         assert res.status_code == 400
+
+
+@pytest.fixture()
+def many_payments(db, seed_student):
+    """seed_student의 수업료 25건 (3.1 ~ 3.25, 같은 시각 2건씩 포함)."""
+    cycle_id = seed_student["current_cycle"]["id"]
+    for i in range(25):
+        db.add(Payment(
+            student_id=seed_student["id"],
+            cycle_id=cycle_id,
+            amount=240000,
+            status="paid" if i % 5 == 0 else "pending",
+            message_sent=i % 2 == 0,
+            created_at=datetime(2026, 3, 1 + i // 2 * 2, 10, 0),
+        ))
+    db.commit()
+    return seed_student
+
+
+class TestMessageBatch:
+    """미납 안내 문자 일괄 생성."""
+
+    def test_pending_unsent_only(self, client, many_payments):
+        """미납 + 미발송 건만 생성하고 발송 표시, 다시 호출하면 빈 목록."""
+        res = client.post("/api/payments/messages", json={})
+        assert res.status_code == 200
+        messages = res.json()
+        assert len(messages) == 10
+        assert all("김테스트" in m["message"] and "240,000" in m["message"] for m in messages)
+
+        assert len(client.get("/api/payments?message_sent=false&status=pending").json()) == 0
+        assert client.post("/api/payments/messages", json={}).json() == []
+        assert len(client.post("/api/payments/messages", json={"unsent_only": False}).json()) == 20
+
+    def test_filters(self, client, many_payments):
+        """수업반 / 청구 생성일 기간 필터."""
+        res = client.post("/api/payments/messages", json={"date_from": "2026-03-03", "date_to": "2026-03-05"})
+        assert len(res.json()) == 1  # 3.3~3.5의 4건 중 미납 + 미발송은 1건
+        other = client.post("/api/payments/messages", json={"class_group_id": many_payments["class_group_id"] + 1})
+        assert other.json() == []
+
+    def test_query_count_fixed(self, client, many_payments, count_queries):
+        """조회 1회 + UPDATE 1회 (건수와 무관)."""
+        with count_queries() as counter:
+            assert len(client.post("/api/payments/messages", json={}).json()) == 10
+        assert counter["count"] <= 3
+
+
+class TestPaymentList:
+    """수업료 목록 필터 + 키셋 페이지네이션."""
+
+    def test_cursor_pagination_walks_all_rows(self, client, many_payments):
+        """limit 10씩 커서를 따라가면 25건을 중복/누락 없이 최신순으로 조회."""
+        seen, cursor, pages = [], None, 0
+        while True:
+            url = "/api/payments?limit=10" + (f"&cursor={cursor}" if cursor else "")
+            res = client.get(url)
+            assert res.status_code == 200
+            seen.extend(res.json())
+            pages += 1
+            cursor = res.headers.get("X-Next-Cursor")
+            if not cursor:
+                break
+
+        assert pages == 3
+        assert len({p["id"] for p in seen}) == 25
+        keys = [(p["created_at"], p["id"]) for p in seen]
+        assert keys == sorted(keys, reverse=True)
+
+    def test_last_page_has_no_cursor(self, client, many_payments):
+        """남은 데이터가 없으면 X-Next-Cursor 헤더 없음."""
+        res = client.get("/api/payments?limit=25")
+        assert len(res.json()) == 25
+        assert "X-Next-Cursor" not in res.headers
+
+    def test_filters(self, client, many_payments):
+        """학생 / 수업반 / 기간 / 메시지 발송 여부 필터."""
+        sid = many_payments["id"]
+        gid = many_payments["class_group_id"]
+
+        assert len(client.get(f"/api/payments?student_id={sid}&limit=100").json()) == 25
+        assert len(client.get(f"/api/payments?student_id={sid + 1}").json()) == 0
+        assert len(client.get(f"/api/payments?class_group_id={gid}&limit=100").json()) == 25
+        assert len(client.get("/api/payments?message_sent=true&limit=100").json()) == 13
+        assert len(client.get("/api/payments?status=paid").json()) == 5
+
+        ranged = client.get("/api/payments?date_from=2026-03-03&date_to=2026-03-05").json()
+        assert {p["created_at"][:10] for p in ranged} == {"2026-03-03", "2026-03-05"}
+        assert len(ranged) == 4
+
+    def test_invalid_cursor(self, client, many_payments):
+        """잘못된 커서 → 400."""
+        assert client.get("/api/payments?cursor=not-a-cursor").status_code == 400
+
+    def test_single_query_per_page(self, client, many_payments, count_queries):
+        """페이지 조회는 JOIN 쿼리 1회."""
+        with count_queries() as counter:
+            client.get("/api/payments?limit=10")
+        assert counter["count"] == 1
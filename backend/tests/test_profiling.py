@@ -0,0 +1,66 @@
+"""요청별 SQL 프로파일링 / 메트릭 테스트."""
+import logging
+
+import pytest
+
+from app.config import settings
+from app.profiling import request_metrics
+
+
+@pytest.fixture()
+def metrics():
+    request_metrics.reset()
+    yield request_metrics
+    request_metrics.reset()
+
+
+class TestProfileHeaders:
+    """debug 모드 응답 헤더."""
+
+    def test_debug_headers_match_query_count(self, client, seed_student, count_queries, monkeypatch):
+        """X-DB-Query-Count는 실제 실행된 SQL 문 수와 같다."""
+        monkeypatch.setattr(settings, "debug", True)
+        with count_queries() as counter:
+            res = client.get(f"/api/students/{seed_student['id']}")
+        assert int(res.headers["x-db-query-count"]) == counter["count"] > 0
+        assert float(res.headers["x-db-time-ms"]) >= 0
+        assert res.headers["x-db-slowest"].startswith("SELECT")
+        assert "x-response-time-ms" in res.headers
+
+    def test_no_headers_without_debug(self, client, seed_student):
+        res = client.get("/api/students")
+        assert "x-db-query-count" not in res.headers
+
+
+class TestMetrics:
+    """/api/metrics 엔드포인트별 집계 + 느린 요청 로그."""
+
+    def test_aggregated_by_route_template(self, client, seed_student, metrics):
+        """경로 파라미터가 달라도 같은 엔드포인트로 집계 (동기/비동기 모두)."""
+        client.get(f"/api/students/{seed_student['id']}")
+        client.get("/api/students/999")
+        client.get("/api/students")
+        data = client.get("/api/metrics").json()
+
+        detail = data["endpoints"]["GET /api/students/{student_id}"]
+        assert detail["requests"] == 2
+        assert detail["max_queries"] >= 1
+        assert detail["slowest_statements"][0]["statement"].startswith("SELECT")
+        assert data["endpoints"]["GET /api/students"]["avg_queries"] >= 1
+        assert "class_groups" in data["caches"]
+        assert data["thresholds"]["slow_request_ms"] == settings.slow_request_ms
+
+    def test_slow_request_logged(self, client, seed_student, metrics, monkeypatch, caplog):
+        """SQL 문 수 기준을 넘으면 경고 로그 + slow_requests 증가."""
+        monkeypatch.setattr(settings, "slow_request_query_count", 1)
+        with caplog.at_level(logging.WARNING, logger="app.profiling"):
+            client.get(f"/api/students/{seed_student['id']}")
+        assert any("느린 요청 GET /api/students/{student_id}" in r.getMessage() for r in caplog.records)
+        assert metrics.snapshot()["GET /api/students/{student_id}"]["slow_requests"] == 1
+
+    def test_slow_query_logged(self, client, seed_student, metrics, monkeypatch, caplog):
+        """SQL 1개가 기준을 넘으면 그 SQL을 로그로 남긴다."""
+        monkeypatch.setattr(settings, "slow_query_ms", 0)
+        with caplog.at_level(logging.WARNING, logger="app.profiling"):
+            client.get("/api/students")
+        assert any(r.getMessage().startswith("느린 쿼리") for r in caplog.records)
@@ -0,0 +1,86 @@
+"""수납/미수 요약 API + 월별 수업료 집계(payment_monthly) 유지 테스트."""
+from datetime import date
+
+from app.models.payment_monthly import PaymentMonthly
+from app.services.revenue import rebuild_payment_rollup
+from app.services.rollup import month_key
+
+THIS_MONTH = month_key(date.today())
+
+
+def _rollup(db) -> dict:
+    db.expire_all()
+    return {
+        (r.month, r.status, r.payment_method, r.grade, r.class_group_id): (r.count, r.amount)
+        for r in db.query(PaymentMonthly).all()
+        if r.count or r.amount
+    }
+
+
+def _complete(client, seed_student) -> int:
+    """사이클 완료 → 미납 수업료 id."""
+    client.post(f"/api/cycles/{seed_student['current_cycle']['id']}/complete")
+    return client.get("/api/payments?status=pending").json()[0]["id"]
+
+
+class TestRevenueSummary:
+    """월별 수납액/미수금과 방법·학년·수업반별 내역."""
+
+    def test_pending_then_paid(self, client, seed_student):
+        """청구 → 미수금, 납부 확인 → 수납액 (방법별)."""
+        payment_id = _complete(client, seed_student)
+        summary = client.get("/api/payments/summary").json()
+        assert summary["total"]["pending_count"] == 1
+        assert summary["total"]["pending_amount"] == 240000
+        assert summary["total"]["paid_amount"] == 0
+
+        client.post(f"/api/payments/{payment_id}/confirm", json={"payment_method": "cash"})
+        summary = client.get("/api/payments/summary").json()
+        [month] = summary["months"]
+        assert month["month"] == THIS_MONTH
+        assert (month["paid_count"], month["paid_amount"], month["pending_amount"]) == (1, 240000, 0)
+        assert month["by_method"] == {"cash": 240000}
+        assert month["by_grade"] == [{
+            "grade": "elementary", "label": "초등",
+            "paid_count": 1, "paid_amount": 240000, "pending_count": 0, "pending_amount": 0,
+        }]
+        assert month["by_class_group"][0]["class_group_name"] == "테스트반"
+
+    def test_filters_and_range(self, client, seed_student):
+        """수업반 필터, 기간 밖은 빈 요약, 월 순서 검증."""
+        _complete(client, seed_student)
+        group_id = seed_student["class_group_id"]
+        assert client.get(f"/api/payments/summary?class_group_id={group_id}").json()["total"]["pending_count"] == 1
+        assert client.get(f"/api/payments/summary?class_group_id={group_id + 1}").json()["months"] == []
+        assert client.get("/api/payments/summary?month_from=2020-01&month_to=2020-12").json()["months"] == []
+        assert client.get("/api/payments/summary?month_from=2026-05&month_to=2026-03").status_code == 400
+
+    def test_single_query(self, client, seed_student, count_queries):
+        """요약은 집계 테이블 쿼리 1회."""
+        _complete(client, seed_student)
+        with count_queries() as counter:
+            client.get("/api/payments/summary?month_from=2020-01")
+        assert counter["count"] == 1
+
+
+class TestPaymentRollup:
+    """청구/납부/학생 변경 시 증분 갱신 = 전체 재생성."""
+
+    def test_incremental_matches_rebuild(self, client, db, seed_student):
+        """납부 확인 후 학년/수업반을 바꿔도 재집계 결과와 같다."""
+        payment_id = _complete(client, seed_student)
+        client.post(f"/api/payments/{payment_id}/confirm", json={"payment_method": "transfer"})
+        other = client.post("/api/class-groups", json={
+            "name": "중등반", "days_of_week": ["tue", "thu"], "start_time": "16:00", "default_duration_minutes": 120,
+        }).json()
+        student = client.get(f"/api/students/{seed_student['id']}").json()
+        client.put(f"/api/students/{seed_student['id']}", json={
+            **{k: student[k] for k in ("name", "phone", "school", "parent_phone", "tuition_amount", "memo")},
+            "grade": "middle1", "class_group_id": other["id"],
+        })
+
+        incremental = _rollup(db)
+        assert incremental == {(THIS_MONTH, "paid", "transfer", "middle1", other["id"]): (1, 240000)}
+        rebuild_payment_rollup(db)
+        db.commit()
+        assert _rollup(db) == incremental
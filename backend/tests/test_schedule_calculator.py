@@ -0,0 +1,78 @@
+"""수업일 계산기 테스트 - 기존 하루 단위 탐색과 결과가 같은지 전수 비교."""
+from datetime import date, timedelta
+
+from app.services.schedule_calculator import (
+    WEEKDAY_MAP,
+    bulk_class_dates,
+    class_dates,
+    latest_class_date,
+    next_class_dates,
+    weekday_mask,
+)
+
+ALL_MASKS = range(128)
+MONDAY = date(2026, 3, 2)
+
+
+def _walk_forward(start: date, mask: int, count: int) -> list[date]:
+    """기존 구현과 같은 하루 단위 탐색 (기준값)."""
+    result: list[date] = []
+    current = start
+    for _ in range(365):
+        if mask & (1 << current.weekday()):
+            result.append(current)
+            if len(result) >= count:
+                break
+        current += timedelta(days=1)
+    return result
+
+
+class TestWeekdayMask:
+    """요일 목록 → 비트마스크."""
+
+    def test_mask_bits(self):
+        """월=bit0 … 일=bit6."""
+        assert weekday_mask(["mon", "wed"]) == 0b0000101
+        assert weekday_mask(["tue", "thu"]) == 0b0001010
+        assert weekday_mask(list(WEEKDAY_MAP.values())) == 0b1111111
+        assert weekday_mask([]) == 0
+
+
+class TestClassDates:
+    """N번째 수업일 산술 계산."""
+
+    def test_mon_wed_from_monday(self):
+        """월수반 3.2(월) 시작 → 3.2 ~ 3.25 8회."""
+        mask = weekday_mask(["mon", "wed"])
+        assert class_dates(MONDAY, mask, 8) == [
+            date(2026, 3, d) for d in (2, 4, 9, 11, 16, 18, 23, 25)
+        ]
+
+    def test_matches_day_walk_for_every_mask_and_weekday(self):
+        """모든 요일 조합 × 모든 시작 요일에서 기존 탐색과 동일."""
+        for mask in ALL_MASKS:
+            for shift in range(7):
+                start = MONDAY + timedelta(days=shift)
+                assert class_dates(start, mask, 9) == _walk_forward(start, mask, 9)
+
+    def test_empty_mask_returns_empty(self):
+        """수업 요일이 없으면 빈 목록 / None."""
+        assert class_dates(MONDAY, 0, 8) == []
+        assert latest_class_date(MONDAY, 0) is None
+
+    def test_next_class_dates_excludes_start(self):
+        """마지막 수업일(3.25 수) 다음 수업일 → 3.30(월)."""
+        mask = weekday_mask(["mon", "wed"])
+        assert next_class_dates(date(2026, 3, 25), mask) == [date(2026, 3, 30)]
+
+    def test_latest_class_date(self):
+        """오늘 포함 가장 최근 수업일 (역방향)."""
+        mask = weekday_mask(["tue", "thu"])
+        assert latest_class_date(date(2026, 3, 5), mask) == date(2026, 3, 5)  # 목
+        assert latest_class_date(date(2026, 3, 9), mask) == date(2026, 3, 5)  # 월 → 지난 목
+
+    def test_bulk_matches_single(self):
+        """일괄 계산 결과 = 개별 계산 결과."""
+        requests = [(MONDAY + timedelta(days=i % 7), mask) for i, mask in enumerate(ALL_MASKS)]
+        bulk = bulk_class_dates(requests, 8)
+        assert bulk == [class_dates(s, m, 8) for s, m in requests]
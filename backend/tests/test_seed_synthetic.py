@@ -0,0 +1,48 @@
+"""부하 테스트용 합성 데이터 생성 테스트."""
+from datetime import date
+
+import pytest
+from sqlalchemy import func, select
+
+from app.models.class_group import ClassGroup
+from app.models.cycle import Cycle
+from app.models.payment import Payment
+from app.models.student import Student
+from app.seed_synthetic import generate_synthetic_data
+from app.services.cycle_service import check_cycle_counts
+
+END = date(2026, 10, 1)
+
+
+class TestSyntheticData:
+    """지점 × 학생 × 기간 규모의 일관된 데이터."""
+
+    def test_counts_and_consistency(self, client, db):
+        """반환한 행 수 = 실제 행 수, 회차 불일치 없음, 미래 완료 사이클 없음."""
+        counts = generate_synthetic_data(db, branches=2, students_per_branch=30, years=1, end_date=END)
+        db.commit()
+
+        assert counts["students"] == db.execute(select(func.count()).select_from(Student)).scalar() == 60
+        assert counts["cycles"] == db.execute(select(func.count()).select_from(Cycle)).scalar()
+        assert counts["payments"] == db.execute(select(func.count()).select_from(Payment)).scalar()
+        assert counts["student_summaries"] == 60
+        assert check_cycle_counts(db) == []
+        assert not db.execute(select(Cycle.id).where(Cycle.completed_at > END)).first()
+        names = db.execute(select(ClassGroup.name)).scalars().all()
+        assert any(name.startswith("강남점 ") for name in names)
+        assert any(name.startswith("서초점 ") for name in names)
+
+        # 생성 후 API가 그대로 동작
+        assert len(client.get("/api/students").json()) > 0
+        assert client.get("/api/cycles/alerts").status_code == 200
+
+    def test_same_seed_same_data(self, db):
+        """같은 seed면 같은 행 수."""
+        first = generate_synthetic_data(db, branches=1, students_per_branch=20, years=0.5, end_date=END, seed=7)
+        db.rollback()
+        assert generate_synthetic_data(db, branches=1, students_per_branch=20, years=0.5, end_date=END, seed=7) == first
+
+    def test_requires_empty_db(self, db, seed_student):
+        """학생 데이터가 있으면 거부."""
+        with pytest.raises(ValueError):
+            generate_synthetic_data(db, branches=1, students_per_branch=5, years=0.5, end_date=END)
@@ -2,6 +2,8 @@
 
 import pytest
 
+from app.models.class_group import ClassGroup
+
 
 @pytest.fixture()
 def class_group(client):
@@ -108,6 +110,152 @@ class TestStudentRead:
         assert filtered[0]["name"] == "학생A"
 
 
+class TestStudentListQueryCount:
+    """학생 목록 조회 쿼리 수 회귀 테스트 (N+1 방지)."""
+
+    def _create_active_students(self, client, class_group, n):
+        for i in range(n):
+            student = client.post("/api/students", json={
+                **STUDENT_BASE, "name": f"학생{i:02d}",
+                "class_group_id": class_group["id"],
+                "enrollment_status": "active",
+            }).json()
+            client.post(f"/api/students/{student['id']}/start-cycle", json={
+                "start_date": "2026-03-02",
+            })
+
+    def test_query_count_independent_of_student_count(self, client, class_group, count_queries):
+        """학생 2명 → 20명이어도 목록 조회 쿼리 수 동일."""
+        self._create_active_students(client, class_group, 2)
+        with count_queries() as small:
+            assert len(client.get("/api/students").json()) == 2
+
+        self._create_active_students(client, class_group, 18)
+        with count_queries() as large:
+            assert len(client.get("/api/students").json()) == 20
+
+        assert large["count"] == small["count"]
+        assert large["count"] <= 4
+
+    def test_list_includes_cycle_group_and_status_dates(self, client, class_group):
+        """일괄 조회 결과에도 현재 사이클, 수업반명, 상태별 일자가 포함."""
+        self._create_active_students(client, class_group, 1)
+
+        data = client.get("/api/students").json()[0]
+        assert data["class_group_name"] == "테스트반"
+        assert data["current_cycle"]["current_count"] == 8
+        assert data["active_date"] is not None
+        assert data["inquiry_date"] is None
+
+
+class TestStudentImport:
+    """학생 일괄 등록 (CSV/JSON)."""
+
+    def _rows(self, class_group, n, **extra):
+        return [
+            {**STUDENT_BASE, "name": f"학생{i:02d}", "parent_phone": f"010-9999-{i:04d}",
+             "class_group_id": class_group["id"], **extra}
+            for i in range(n)
+        ]
+
+    def test_json_import_with_first_cycles(self, client, class_group):
+        """start_date가 있는 수업중 학생은 첫 사이클과 8회차 스케줄까지 생성."""
+        res = client.post("/api/students/import", json=self._rows(
+            class_group, 3, enrollment_status="active", start_date="2026-03-02",
+        ))
+        assert res.status_code == 201
+        body = res.json()
+        assert body["created"] == 3
+        assert body["cycles_started"] == 3
+
+        students = client.get("/api/students").json()
+        assert {s["current_cycle"]["cycle_number"] for s in students} == {1}
+        assert all(s["active_date"] is not None for s in students)
+        assert len(client.get("/api/attendance/daily/2026-03-25").json()) == 3
+        dashboard = client.get("/api/dashboard/students").json()
+        assert {d["current_count"] for d in dashboard} == {8}
+
+    def test_csv_import(self, client, class_group):
+        """CSV 본문 (빈 칸은 값 없음)."""
+        csv_text = (
+            "name,phone,school,grade,parent_phone,class_group_id,tuition_amount,enrollment_status\n"
+            f"이학생,010-1,서울초,middle1,010-2,{class_group['id']},,inquiry\n"
+        )
+        res = client.post("/api/students/import", content=csv_text.encode(), headers={"Content-Type": "text/csv"})
+        assert res.status_code == 201
+        student = client.get(f"/api/students/{res.json()['student_ids'][0]}").json()
+        assert student["tuition_amount"] is None
+        assert student["effective_tuition"] == 320000
+        assert student["current_cycle"] is None
+
+    def test_csv_encodings(self, client, class_group):
+        """엑셀(한국어)의 CP949 CSV도 읽고, 읽을 수 없는 인코딩은 400."""
+        csv_text = (
+            "name,phone,school,grade,parent_phone,class_group_id\n"
+            f"박학생,010-1,서울초,elementary,010-2,{class_group['id']}\n"
+        )
+        headers = {"Content-Type": "text/csv"}
+        res = client.post("/api/students/import", content=csv_text.encode("cp949"), headers=headers)
+        assert res.status_code == 201
+        assert client.get(f"/api/students/{res.json()['student_ids'][0]}").json()["school"] == "서울초"
+
+        res = client.post("/api/students/import", content=b"name\n\xff\xfe\xff", headers=headers)
+        assert res.status_code == 400
+        assert "인코딩" in res.json()["detail"]
+
+    def test_errors_reported_per_row_and_nothing_inserted(self, client, class_group):
+        """한 행이라도 오류면 전체 취소, 행별 오류 목록 반환."""
+        rows = self._rows(class_group, 4)
+        rows[1]["grade"] = "college"
+        del rows[2]["phone"]
+        rows[3].update(name=rows[0]["name"], parent_phone=rows[0]["parent_phone"])
+        res = client.post("/api/students/import", json=rows)
+        assert res.status_code == 400
+        errors = {e["row"]: e["errors"] for e in res.json()["detail"]["errors"]}
+        assert set(errors) == {2, 3, 4}
+        assert "grade" in errors[2][0]
+        assert "phone" in errors[3][0]
+        assert "1행" in errors[4][0]
+        assert client.get("/api/students", params={"enrollment_status": "all"}).json() == []
+
+    def test_existing_student_and_dry_run(self, client, class_group):
+        """dry_run은 검증만, 이미 등록된 학생은 오류."""
+        rows = self._rows(class_group, 2)
+        res = client.post("/api/students/import", params={"dry_run": True}, json=rows)
+        assert res.json()["validated"] == 2
+        assert res.json()["created"] == 0
+        client.post("/api/students/import", json=rows[:1])
+        res = client.post("/api/students/import", json=rows)
+        assert res.status_code == 400
+        assert res.json()["detail"]["errors"][0]["row"] == 1
+
+    def test_group_created_outside_api(self, client, db, class_group):
+        """다른 워커/CLI가 만든 (이 워커 캐시에 없는) 수업반으로도 등록과 첫 사이클 시작."""
+        client.get("/api/class-groups")  # 수업반 캐시 적재
+        group = ClassGroup(name="CLI반", days_of_week='["fri"]', start_time="16:00", default_duration_minutes=120)
+        db.add(group)
+        db.commit()
+        res = client.post("/api/students/import", json=self._rows(
+            {"id": group.id}, 2, enrollment_status="active", start_date="2026-03-06",
+        ))
+        assert res.status_code == 201
+        assert res.json()["cycles_started"] == 2
+        assert len(client.get("/api/attendance/daily/2026-03-13").json()) == 2
+
+    def test_query_count_independent_of_row_count(self, client, class_group, count_queries):
+        """행 수가 늘어도 쿼리 수는 고정."""
+        client.get("/api/class-groups")  # 수업반 캐시 적재
+        with count_queries() as small:
+            client.post("/api/students/import", json=self._rows(class_group, 2, enrollment_status="active", start_date="2026-03-02"))
+        rows = self._rows(class_group, 30, enrollment_status="active", start_date="2026-03-02")
+        for row in rows:
+            row["name"] = "새" + row["name"]
+        with count_queries() as large:
+            res = client.post("/api/students/import", json=rows)
+        assert res.json()["created"] == 30
+        assert large["count"] == small["count"]
+
+
 class TestStudentUpdate:
     """학생 수정 테스트."""
 
@@ -32,6 +32,12 @@ interface StatusCounts {
   stopped: number
 }
 
+interface DashboardStats {
+  status_counts: StatusCounts
+  pending_payment_count: number
+  pending_amount_total: number
+}
+
 const DAY_MAP: Record<number, string> = {
   0: 'sun', 1: 'mon', 2: 'tue', 3: 'wed', 4: 'thu', 5: 'fri', 6: 'sat',
 }
@@ -55,25 +61,13 @@ export default function Dashboard() {
       .then((r) => r.json())
       .then(setAlerts)
 
-    // 상태별 학생 수
-    Promise.all([
-      fetch('/api/students?enrollment_status=inquiry').then((r) => r.json()),
-      fetch('/api/students?enrollment_status=level_test').then((r) => r.json()),
-      fetch('/api/students?enrollment_status=active').then((r) => r.json()),
-      fetch('/api/students?enrollment_status=stopped').then((r) => r.json()),
-    ]).then(([inq, lt, act, stp]) => {
-      setStatusCounts({
-        inquiry: inq.length,
-        level_test: lt.length,
-        active: act.length,
-        stopped: stp.length,
-      })
-    })
-
-    // 미납 건수
-    fetch('/api/payments?status=pending')
+    // 상태별 학생 수 + 미납 건수 (읽기 모델 집계)
+    fetch('/api/dashboard/stats')
       .then((r) => r.json())
-      .then((payments) => setPendingCount(payments.length))
+      .then((stats: DashboardStats) => {
+        setStatusCounts(stats.status_counts)
+        setPendingCount(stats.pending_payment_count)
+      })
   }, [])
 
   const completedAlerts = alerts.filter((a) => a.status === 'completed')
@@ -56,14 +56,44 @@ export default function Payments() {
   const [confirmMethod, setConfirmMethod] = useState('transfer')
   const [confirmMemo, setConfirmMemo] = useState('')
 
+  // 목록 API는 최신순 페이지 단위 → 첫 페이지만 읽고, 더 보기로 X-Next-Cursor 다음 페이지를 붙인다
+  const [nextCursor, setNextCursor] = useState<string | null>(null)
+  const [loadingMore, setLoadingMore] = useState(false)
+  // 미납 합계는 불러온 페이지가 아니라 전체 기준 (대시보드 통계)
+  const [pendingStats, setPendingStats] = useState({ count: 0, amount: 0 })
+
+  const pageUrl = (cursor: string | null) => {
+    const params = new URLSearchParams()
+    if (filter !== 'all') params.set('status', filter)
+    if (cursor) params.set('cursor', cursor)
+    const query = params.toString()
+    return query ? `/api/payments?${query}` : '/api/payments'
+  }
+
   const fetchPayments = async () => {
     setLoading(true)
-    const url = filter === 'all' ? '/api/payments' : `/api/payments?status=${filter}`
-    const res = await fetch(url)
-    setPayments(await res.json())
+    const [res, statsRes] = await Promise.all([fetch(pageUrl(null)), fetch('/api/dashboard/stats')])
+    setPayments(res.ok ? await res.json() : [])
+    setNextCursor(res.ok ? res.headers.get('X-Next-Cursor') : null)
+    if (statsRes.ok) {
+      const stats = await statsRes.json()
+      setPendingStats({ count: stats.pending_payment_count, amount: stats.pending_amount_total })
+    }
     setLoading(false)
   }
 
+  const loadMore = async () => {
+    if (!nextCursor) return
+    setLoadingMore(true)
+    const res = await fetch(pageUrl(nextCursor))
+    if (res.ok) {
+      const page: Payment[] = await res.json()
+      setPayments((prev) => [...prev, ...page])
+      setNextCursor(res.headers.get('X-Next-Cursor'))
+    }
+    setLoadingMore(false)
+  }
+
   useEffect(() => { fetchPayments() }, [filter])
 
   const formatAmount = (amount: number) => amount.toLocaleString() + '원'
@@ -114,11 +144,6 @@ export default function Payments() {
     fetchPayments()
   }
 
-  const pendingCount = payments.filter((p) => p.status === 'pending').length
-  const totalPending = payments
-    .filter((p) => p.status === 'pending')
-    .reduce((sum, p) => sum + p.amount, 0)
-
   return (
     <div>
       <div className="flex items-center justify-between mb-4">
@@ -137,9 +162,9 @@ export default function Payments() {
             <SelectItem value="all">전체</SelectItem>
           </SelectContent>
         </Select>
-        {filter === 'pending' && pendingCount > 0 && (
+        {filter === 'pending' && pendingStats.count > 0 && (
           <p className="text-sm text-muted-foreground">
-            미납 {pendingCount}건 / 합계 {totalPending.toLocaleString()}원
+            미납 {pendingStats.count}건 / 합계 {pendingStats.amount.toLocaleString()}원
           </p>
         )}
       </div>
@@ -226,6 +251,13 @@ export default function Payments() {
           </TableBody>
         </Table>
       )}
+      {!loading && nextCursor && (
+        <div className="flex justify-center mt-4">
+          <Button variant="outline" onClick={loadMore} disabled={loadingMore}>
+            {loadingMore ? '불러오는 중...' : '더 보기'}
+          </Button>
+        </div>
+      )}
 
       {/* 메시지 다이얼로그 */}
       <Dialog open={msgOpen} onOpenChange={setMsgOpen}>